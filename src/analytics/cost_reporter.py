@@ -139,7 +139,7 @@ def per_video_costs(limit: int = 50) -> list[dict]:
     """
     from history.history_manager import get_all
 
-    records = get_all(limit=limit)
+    records = get_all(limit=limit, include_breakdown=True)
     results: list[dict] = []
 
     for r in records:
@@ -217,7 +217,7 @@ def cost_by_category() -> dict[str, float]:
         "pixabay": 0.0,
     }
 
-    all_records = get_all(limit=10000)
+    all_records = get_all(limit=10000, include_breakdown=True)
     for r in all_records:
         breakdown = r.get("cost_breakdown") or {}
         for key in totals:
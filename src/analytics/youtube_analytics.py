@@ -38,17 +38,13 @@ def _get_analytics_service(lang: str = "ko"):
     try:
         from google.auth.transport.requests import Request
         from googleapiclient.discovery import build
-        import pickle
-        import config
+        from uploader.oauth_handler import load_credentials
 
-        token_path = config.DATABASE_DIR / f"token_{lang}.pickle"
-        if not token_path.exists():
+        creds = load_credentials(lang)
+        if creds is None:
             return None
 
-        with open(token_path, "rb") as f:
-            creds = pickle.load(f)
-
-        if creds and creds.expired and creds.refresh_token:
+        if creds.expired and creds.refresh_token:
             creds.refresh(Request())
 
         return build("youtubeAnalytics", "v2", credentials=creds)
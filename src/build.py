@@ -6,6 +6,7 @@ build.py — 빌드 자동화 스크립트
     python build.py --clean      빌드 전 build/dist 정리
     python build.py --onefile    단일 exe 모드 (onefile)
     python build.py --debug      콘솔 출력 포함 디버그 빌드
+    python build.py --no-ext     Cython 확장(image/_scan.pyx) 빌드 생략
 
 빌드 결과:
     dist/webpage-to-youtube/         (기본: onedir 모드)
@@ -33,6 +34,9 @@ SPEC_FILE = SRC_DIR / "webpage-to-youtube.spec"
 BUILD_DIR = SRC_DIR / "build"
 DIST_DIR = SRC_DIR / "dist"
 
+# 선택 Cython 확장 (없으면 런타임에 numba/NumPy 경로로 동작)
+CYTHON_EXTENSIONS = [SRC_DIR / "image" / "_scan.pyx"]
+
 
 def check_prerequisites() -> bool:
     """빌드 전 필수 조건을 확인한다."""
@@ -76,6 +80,26 @@ def check_prerequisites() -> bool:
     return ok
 
 
+def build_extensions() -> None:
+    """
+    Cython 확장을 제자리(in-place)로 컴파일한다.
+    Cython 또는 C 컴파일러가 없으면 경고만 남기고 건너뛴다 (순수 Python 폴백 사용).
+    """
+    try:
+        import Cython
+        logger.info("Cython %s 감지", Cython.__version__)
+    except ImportError:
+        logger.warning("Cython 미설치 — 확장 빌드 건너뜀 (pip install cython)")
+        return
+
+    for pyx in CYTHON_EXTENSIONS:
+        cmd = [sys.executable, "-m", "Cython.Build.Cythonize", "-i", "-3", str(pyx)]
+        logger.info("확장 빌드: %s", " ".join(cmd))
+        result = subprocess.run(cmd, cwd=str(SRC_DIR))
+        if result.returncode != 0:
+            logger.warning("확장 빌드 실패 — %s 없이 진행 (numba/NumPy 폴백)", pyx.name)
+
+
 def clean_build() -> None:
     """build/ 및 dist/ 디렉토리를 삭제한다."""
     for d in (BUILD_DIR, DIST_DIR):
@@ -131,10 +155,10 @@ def build_onefile(debug: bool = False) -> bool:
         "scenario.generator.ollama_generator",
         "image.generator.dalle_generator",
         "image.generator.sd_generator",
+        "image._scan",
         "tts.openai_tts",
         "tts.edge_tts",
         "langdetect",
-        "bs4",
         "lxml",
         "PIL",
         "pydub",
@@ -218,6 +242,10 @@ def main() -> None:
         "--skip-check", action="store_true",
         help="사전 조건 검사 건너뛰기",
     )
+    parser.add_argument(
+        "--no-ext", action="store_true",
+        help="Cython 확장 빌드 생략",
+    )
     args = parser.parse_args()
 
     logger.info("=" * 50)
@@ -236,6 +264,10 @@ def main() -> None:
     if args.clean:
         clean_build()
 
+    # 선택 확장 컴파일 (clean 이후 — 결과물이 번들에 포함되도록)
+    if not args.no_ext:
+        build_extensions()
+
     # 빌드 실행
     if args.onefile:
         success = build_onefile(debug=args.debug)
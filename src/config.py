@@ -3,6 +3,7 @@ config.py — 전역 설정 + 기본값
 설정 탭에서 변경된 값은 이 파일을 통해 런타임에 반영된다.
 """
 
+import json
 import os
 import sys
 from pathlib import Path
@@ -50,6 +51,9 @@ OLLAMA_MODEL: str = "llama3.1"
 # Stable Diffusion 설정 (로컬 엔진 선택 시)
 SD_API_URL: str = "http://localhost:7860"
 
+# LLM 응답 디스크 캐시 디렉터리 (개발 중 재실행용 — 비어 있으면 비활성)
+LLM_CACHE_DIR: str = os.getenv("WTOY_LLM_CACHE_DIR", "")
+
 # ─────────────────────────────────────────────
 # 유튜브 채널
 # ─────────────────────────────────────────────
@@ -58,6 +62,7 @@ YOUTUBE_EN_CHANNEL_ID: str = os.getenv("YOUTUBE_EN_CHANNEL_ID", "")
 YOUTUBE_PRIVACY: str = "public"          # "public" | "unlisted" | "private"
 YOUTUBE_CATEGORY_ID: str = "22"          # 22 = People & Blogs
 YOUTUBE_SCHEDULE_ENABLED: bool = False
+YOUTUBE_UPLOAD_CHUNK_SIZE: int = 64 * 1024 * 1024   # resumable 청크 (256KB 배수 — 클수록 왕복 감소)
 
 # ─────────────────────────────────────────────
 # 영상 품질
@@ -65,6 +70,10 @@ YOUTUBE_SCHEDULE_ENABLED: bool = False
 VIDEO_RESOLUTION: str = "1080p"          # "1080p" | "720p" | "480p"
 VIDEO_BITRATE: str = "4000k"
 VIDEO_FPS: int = 24
+VIDEO_PRESET: str = "medium"             # libx264 프리셋 — 빠른 확인용 렌더는 "veryfast" (약 3~4배 빠름)
+VIDEO_CRF: str = "23"                    # 낮을수록 고품질 (23 = libx264 기본, 18 ≈ 시각적 무손실)
+VIDEO_TUNE: str = "stillimage"           # 장면 내 프레임이 정지 이미지인 슬라이드쇼에 맞춘 튜닝
+PARALLEL_ENCODES: int = 2                # 동시에 합성·인코딩할 영상 수 (프로세스, 1이면 순차)
 
 RESOLUTION_MAP = {
     "1080p": (1920, 1080),
@@ -163,6 +172,13 @@ COST_TTS_PER_1K_CHARS: float = 0.015
 # ─────────────────────────────────────────────
 HISTORY_DB_PATH = DATABASE_DIR / "history.db"
 IMAGE_CACHE_DB_PATH = DATABASE_DIR / "image_cache.db"
+THUMBNAIL_CACHE_DIR = DATABASE_DIR / "thumbnail_cache"   # 썸네일 베이스 이미지 (프롬프트 해시 → PNG)
+
+# 설정 탭에서 저장한 값 (재시작 시 복원)
+SETTINGS_PATH = DATABASE_DIR / "settings.json"
+_PATH_SETTINGS = ("OUTPUT_DIR",)
+# API 키는 평문 파일에 저장하지 않는다 — 환경변수(.env)가 항상 우선
+_SECRET_SETTINGS = ("OPENAI_API_KEY", "PIXABAY_API_KEY")
 
 # ─────────────────────────────────────────────
 # 런타임 설정 업데이트 (GUI 설정 탭에서 호출)
@@ -173,3 +189,50 @@ def apply_settings(settings: dict) -> None:
     for key, value in settings.items():
         if key in g:
             g[key] = value
+
+
+def save_settings(settings: dict) -> None:
+    """
+    설정 dict를 SETTINGS_PATH에 저장한다.
+    임시 파일에 쓰고 fsync 후 os.replace로 교체하므로 저장 중 종료돼도 기존 파일이 깨지지 않는다.
+    GUI 스레드를 막지 않도록 워커 스레드에서 호출한다.
+    API 키(_SECRET_SETTINGS)는 저장하지 않는다.
+    """
+    data = {
+        k: str(v) if isinstance(v, Path) else v
+        for k, v in settings.items()
+        if k not in _SECRET_SETTINGS
+    }
+    tmp_path = SETTINGS_PATH.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, SETTINGS_PATH)
+
+
+def load_saved_settings() -> None:
+    """
+    SETTINGS_PATH에 저장된 설정이 있으면 전역 변수에 반영한다.
+    이전 버전이 저장한 API 키는 적용하지 않고 파일에서 지운다. (환경변수 값을 덮어쓰지 않음)
+    """
+    if not SETTINGS_PATH.exists():
+        return
+    try:
+        data = json.loads(SETTINGS_PATH.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return
+    if any(key in data for key in _SECRET_SETTINGS):
+        data = {k: v for k, v in data.items() if k not in _SECRET_SETTINGS}
+        try:
+            save_settings(data)
+        except OSError:
+            pass
+    for key in _PATH_SETTINGS:
+        if data.get(key):
+            data[key] = Path(data[key])
+    apply_settings(data)
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+
+load_saved_settings()
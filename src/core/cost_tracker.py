@@ -1,9 +1,11 @@
 """
 core/cost_tracker.py — 실시간 비용 계산
 각 API 호출 후 비용을 누적하며, GUI의 cost_display에 콜백으로 전달한다.
+번역 청크·이미지 배치 등 여러 스레드에서 동시에 호출될 수 있어 누적은 잠금으로 보호한다.
 """
 
 import logging
+import threading
 from typing import Callable, Optional
 
 import config
@@ -17,6 +19,7 @@ CostCallback = Callable[[float], None]
 class CostTracker:
     def __init__(self, on_update: Optional[CostCallback] = None) -> None:
         self._on_update = on_update
+        self._lock = threading.Lock()
         self._costs: dict[str, float] = {
             "gpt4o": 0.0,
             "dalle3": 0.0,
@@ -32,7 +35,8 @@ class CostTracker:
             input_tokens  / 1000 * config.COST_GPT4O_INPUT_PER_1K
             + output_tokens / 1000 * config.COST_GPT4O_OUTPUT_PER_1K
         )
-        self._costs["gpt4o"] += cost
+        with self._lock:
+            self._costs["gpt4o"] += cost
         self._notify()
         logger.debug("GPT-4o 비용 +$%.4f (in=%d, out=%d)", cost, input_tokens, output_tokens)
         return cost
@@ -44,14 +48,16 @@ class CostTracker:
             else config.COST_DALLE3_STD_PER_IMAGE
         )
         cost = unit * count
-        self._costs["dalle3"] += cost
+        with self._lock:
+            self._costs["dalle3"] += cost
         self._notify()
         logger.debug("DALL-E 3 비용 +$%.4f (%d장)", cost, count)
         return cost
 
     def add_tts(self, char_count: int) -> float:
         cost = char_count / 1000 * config.COST_TTS_PER_1K_CHARS
-        self._costs["tts"] += cost
+        with self._lock:
+            self._costs["tts"] += cost
         self._notify()
         logger.debug("TTS 비용 +$%.4f (%d자)", cost, char_count)
         return cost
@@ -60,13 +66,15 @@ class CostTracker:
     # 조회
     # ─────────────────────────────────────────────
     def total_usd(self) -> float:
-        return sum(self._costs.values())
+        with self._lock:
+            return sum(self._costs.values())
 
     def total_krw(self, rate: float = 1380.0) -> int:
         return int(self.total_usd() * rate)
 
     def breakdown(self) -> dict[str, float]:
-        return dict(self._costs)
+        with self._lock:
+            return dict(self._costs)
 
     def summary_str(self) -> str:
         t = self.total_usd()
@@ -0,0 +1,88 @@
+"""
+core/db.py — SQLite 공유 연결
+
+호출마다 sqlite3.connect()로 파일을 새로 열지 않고,
+DB 파일별로 프로세스 수명 동안 연결 하나를 유지한다.
+여러 스레드(이미지 배치 워커, 스케줄러 등)가 같은 연결을 쓰므로
+모든 접근은 잠금으로 직렬화하고 블록 단위로 트랜잭션을 묶는다.
+"""
+
+import atexit
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+# 연결 생성 직후 이 순서대로 1회 적용 (값이 None이면 생략)
+# page_size는 새 DB 파일에서 WAL 전환 전에만 효과가 있으므로 맨 앞에 둔다
+_PRAGMAS: dict[str, object] = {
+    "page_size": None,
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "cache_size": -64000,        # 64MB
+}
+
+
+class SharedConnection:
+    """스레드 간에 공유되는 단일 SQLite 연결."""
+
+    def __init__(self, path: Path, **pragmas: object) -> None:
+        self.path = path
+        self._conn = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None,
+        )
+        self._conn.row_factory = sqlite3.Row
+        for name, value in {**_PRAGMAS, **pragmas}.items():
+            if value is not None:
+                self._conn.execute(f"PRAGMA {name}={value}")
+        self._lock = threading.RLock()
+        atexit.register(self.close)
+
+    @contextmanager
+    def transaction(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        """
+        잠금을 잡고 블록 전체를 하나의 트랜잭션으로 실행한다.
+        예외 발생 시 롤백. 같은 스레드에서 중첩 호출하면 바깥 트랜잭션에 합류한다.
+        immediate=True면 시작 시점에 쓰기 잠금을 잡는다 (다른 프로세스와의 조회→갱신 경합 방지).
+        """
+        with self._lock:
+            if self._conn.in_transaction:
+                yield self._conn
+                return
+            self._conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+            try:
+                yield self._conn
+                self._conn.execute("COMMIT")
+            except BaseException:
+                # COMMIT 실패(SQLITE_BUSY, 디스크 가득 참 등)도 롤백해야 연결이 트랜잭션에 묶이지 않는다
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                raise
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_shared: dict[Path, SharedConnection] = {}
+_shared_lock = threading.Lock()
+
+
+def shared(path: Path, **pragmas: object) -> SharedConnection:
+    """
+    DB 파일 경로에 대응하는 공유 연결을 반환한다. 없으면 생성한다.
+    pragmas는 기본 PRAGMA를 덮어쓰거나 추가하며, 연결을 처음 만들 때만 적용된다.
+    """
+    key = Path(path).resolve()
+    with _shared_lock:
+        conn = _shared.get(key)
+        if conn is None:
+            conn = SharedConnection(key, **pragmas)
+            _shared[key] = conn
+            logger.debug("SQLite 공유 연결 생성: %s", key)
+        return conn
@@ -0,0 +1,31 @@
+"""
+core/fast_json.py — JSON 직렬화 (orjson 선택 사용)
+
+orjson이 설치돼 있으면 orjson으로, 없으면 표준 json으로 동작한다.
+dumps()는 항상 str을 반환하며 json.dumps(..., ensure_ascii=False)와 같은
+UTF-8 문자열을 만든다. 파싱 오류는 두 경우 모두 json.JSONDecodeError로 잡을 수 있다.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError   # orjson.JSONDecodeError도 이 클래스의 하위 클래스
+
+
+def dumps(obj: Any) -> str:
+    """obj를 JSON 문자열로 직렬화한다. (ensure_ascii=False)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def loads(data: str | bytes) -> Any:
+    """JSON 문자열(또는 bytes)을 파싱한다."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
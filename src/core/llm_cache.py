@@ -0,0 +1,71 @@
+"""
+core/llm_cache.py — LLM 응답 디스크 캐시 (개발용, 선택)
+
+같은 페이지로 파이프라인을 다시 돌릴 때마다 시나리오 생성·번역을 GPT에 재요청하면
+회당 수십 초와 비용이 든다. config.LLM_CACHE_DIR(환경변수 WTOY_LLM_CACHE_DIR)이
+설정돼 있으면 (모델, 프롬프트, 입력)의 해시를 키로 응답을 JSON 파일에 저장해 재사용한다.
+비어 있으면 get()은 항상 None, put()은 아무것도 하지 않는다.
+
+파일은 임시 파일에 쓴 뒤 os.replace로 교체하므로 동시에 같은 키를 써도 깨진 파일이 남지 않는다.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+import config
+from core import fast_json
+
+logger = logging.getLogger(__name__)
+
+
+def make_key(kind: str, *parts: str) -> str:
+    """kind와 입력 문자열들로 캐시 키를 만든다. (blake2b 128bit)"""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return f"{kind}_{h.hexdigest()}"
+
+
+def get(key: str) -> Optional[Any]:
+    """캐시된 값을 반환한다. 캐시 비활성·미적중·손상 시 None."""
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return None
+    try:
+        data = (cache_dir / f"{key}.json").read_bytes()
+    except OSError:
+        return None
+    try:
+        value = fast_json.loads(data)
+    except fast_json.JSONDecodeError:
+        logger.warning("LLM 캐시 파일 손상 — 무시: %s", key)
+        return None
+    logger.info("LLM 캐시 적중: %s", key)
+    return value
+
+
+def put(key: str, value: Any) -> None:
+    """값을 캐시에 저장한다. 실패해도 예외를 올리지 않는다."""
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return
+    path = cache_dir / f"{key}.json"
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(fast_json.dumps(value), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("LLM 캐시 저장 실패 (%s): %s", key, e)
+        tmp_path.unlink(missing_ok=True)
+
+
+def _cache_dir() -> Optional[Path]:
+    if not config.LLM_CACHE_DIR:
+        return None
+    return Path(config.LLM_CACHE_DIR).expanduser()
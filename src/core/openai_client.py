@@ -0,0 +1,71 @@
+"""
+core/openai_client.py — 공유 OpenAI 클라이언트
+
+호출마다 OpenAI()를 만들면 httpx 클라이언트·TLS 컨텍스트·연결 풀을 매번 새로 만들어
+keep-alive가 되지 않는다. 프로세스에서 클라이언트 하나를 만들어 재사용하고,
+설정 탭에서 API 키가 바뀌면 다음 호출 때 다시 만든다.
+openai/httpx import는 클라이언트를 처음 만들 때 한 번만 실행된다 (GUI 시작 시간 유지).
+
+AsyncOpenAI는 연결 풀이 이벤트 루프에 묶이므로 공유하지 않는다.
+new_async_client()가 같은 풀 설정(HTTP/2, keep-alive)으로 실행(이벤트 루프)마다 새로 만든다.
+"""
+
+import importlib.util
+import logging
+import threading
+
+import config
+
+logger = logging.getLogger(__name__)
+
+_MAX_KEEPALIVE = 8
+_ASYNC_MAX_KEEPALIVE = 32   # 동시 요청(TTS 세마포어 등)이 모두 연결을 재사용할 수 있도록
+
+_client = None
+_client_key = None
+_lock = threading.Lock()
+
+
+def get_client():
+    """공유 OpenAI 클라이언트를 반환한다. (스레드 안전)"""
+    global _client, _client_key
+
+    # 빠른 경로: 이미 만든 클라이언트는 잠금 없이 반환 (번역 청크 스레드 간 경합 방지)
+    client = _client
+    if client is not None and _client_key == config.OPENAI_API_KEY:
+        return client
+
+    with _lock:
+        if _client is None or _client_key != config.OPENAI_API_KEY:
+            import httpx
+            from openai import DefaultHttpxClient, OpenAI
+
+            http2 = _http2_available()
+            http_client = DefaultHttpxClient(   # SDK 기본 timeout 등을 유지한 httpx.Client
+                http2=http2,
+                limits=httpx.Limits(max_keepalive_connections=_MAX_KEEPALIVE),
+            )
+            _client = OpenAI(api_key=config.OPENAI_API_KEY, http_client=http_client)
+            _client_key = config.OPENAI_API_KEY
+            logger.debug("OpenAI 클라이언트 생성 (http2=%s)", http2)
+        return _client
+
+
+def new_async_client():
+    """
+    AsyncOpenAI 클라이언트를 새로 만든다.
+    호출한 쪽이 이벤트 루프 하나(asyncio.run 한 번) 동안 `async with`로 쓰고 닫는다.
+    """
+    import httpx
+    from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+    http_client = DefaultAsyncHttpxClient(
+        http2=_http2_available(),
+        limits=httpx.Limits(max_keepalive_connections=_ASYNC_MAX_KEEPALIVE),
+    )
+    return AsyncOpenAI(api_key=config.OPENAI_API_KEY, http_client=http_client)
+
+
+def _http2_available() -> bool:
+    """HTTP/2는 h2 패키지가 있을 때만 (openai 의존성에 포함되지 않음)"""
+    return importlib.util.find_spec("h2") is not None
@@ -5,6 +5,7 @@ STEP 1~11 을 순서대로 실행하며 각 스텝 완료 시 체크포인트를
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Optional
 
 from core.checkpoint import Checkpoint
@@ -111,12 +112,12 @@ class Pipeline:
     # STEP 구현 (각 대화에서 채워질 스텁)
     # ─────────────────────────────────────────────
     def _step1_scrape(self) -> None:
-        from scraper.fetcher import fetch_page
+        from scraper.fetcher import fetch_page_bytes
         from scraper.parser import extract_text
         from scraper.language_detector import detect_language
 
-        html = fetch_page(self.url)
-        text = extract_text(html, focus=self.focus)
+        html, encoding = fetch_page_bytes(self.url)
+        text = extract_text(html, focus=self.focus, encoding=encoding)
         lang = detect_language(text)
 
         self.state["page_text"] = text
@@ -236,44 +237,51 @@ class Pipeline:
     def _step8_compose(self) -> None:
         from video.landscape_composer import compose_landscape
         from video.shorts_composer import compose_shorts
+        from video.parallel_encode import run_compose_jobs
 
         video_dir = self._ensure_output_dir() / "videos"
         video_dir.mkdir(exist_ok=True)
 
-        self.state["video_landscape_ko"] = str(compose_landscape(
-            scenes=self.state["scenario_ko"],
-            image_paths=self.state["image_paths"],
-            audio_paths=self.state["audio_ko_paths"],
-            bgm_path=self.state["bgm_path"],
-            output_path=video_dir / "landscape_ko.mp4",
-            lang="ko",
-        ))
-        self.state["video_landscape_en"] = str(compose_landscape(
-            scenes=self.state["scenario_en"],
-            image_paths=self.state["image_paths"],
-            audio_paths=self.state["audio_en_paths"],
-            bgm_path=self.state["bgm_path"],
-            output_path=video_dir / "landscape_en.mp4",
-            lang="en",
-        ))
-        self.state["video_shorts_ko"] = str(compose_shorts(
-            scenes=self.state["shorts_scenario_ko"],
-            image_paths=self.state["image_paths"],
-            audio_paths=self.state["audio_ko_paths"],
-            bgm_path=self.state["bgm_path"],
-            output_path=video_dir / "shorts_ko.mp4",
-            title=self.state["youtube_title_ko"],
-            lang="ko",
-        ))
-        self.state["video_shorts_en"] = str(compose_shorts(
-            scenes=self.state["shorts_scenario_en"],
-            image_paths=self.state["image_paths"],
-            audio_paths=self.state["audio_en_paths"],
-            bgm_path=self.state["bgm_path"],
-            output_path=video_dir / "shorts_en.mp4",
-            title=self.state["youtube_title_en"],
-            lang="en",
-        ))
+        # 4개 영상은 서로 독립 — config.PARALLEL_ENCODES개 프로세스에서 동시에 합성한다
+        keys = ["video_landscape_ko", "video_landscape_en", "video_shorts_ko", "video_shorts_en"]
+        jobs = [
+            (compose_landscape, dict(
+                scenes=self.state["scenario_ko"],
+                image_paths=self.state["image_paths"],
+                audio_paths=self.state["audio_ko_paths"],
+                bgm_path=self.state["bgm_path"],
+                output_path=video_dir / "landscape_ko.mp4",
+                lang="ko",
+            )),
+            (compose_landscape, dict(
+                scenes=self.state["scenario_en"],
+                image_paths=self.state["image_paths"],
+                audio_paths=self.state["audio_en_paths"],
+                bgm_path=self.state["bgm_path"],
+                output_path=video_dir / "landscape_en.mp4",
+                lang="en",
+            )),
+            (compose_shorts, dict(
+                scenes=self.state["shorts_scenario_ko"],
+                image_paths=self.state["image_paths"],
+                audio_paths=self.state["audio_ko_paths"],
+                bgm_path=self.state["bgm_path"],
+                output_path=video_dir / "shorts_ko.mp4",
+                title=self.state["youtube_title_ko"],
+                lang="ko",
+            )),
+            (compose_shorts, dict(
+                scenes=self.state["shorts_scenario_en"],
+                image_paths=self.state["image_paths"],
+                audio_paths=self.state["audio_en_paths"],
+                bgm_path=self.state["bgm_path"],
+                output_path=video_dir / "shorts_en.mp4",
+                title=self.state["youtube_title_en"],
+                lang="en",
+            )),
+        ]
+        for key, path in zip(keys, run_compose_jobs(jobs)):
+            self.state[key] = str(path)
 
     def _step9_thumbnails(self) -> None:
         from thumbnail.prompt_generator import generate_thumbnail_prompt
@@ -311,9 +319,6 @@ class Pipeline:
         logger.info("결과물 저장 경로: %s", self.state["output_dir"])
 
     def _step11_upload(self) -> None:
-        from uploader.youtube_uploader import upload_video
-        from uploader.metadata_builder import build_metadata
-
         # 🔴 최종 컨펌 대기
         confirmed = self.confirm_callback(
             "업로드 직전 최종 확인 — 4개 영상을 유튜브에 업로드합니다.",
@@ -328,25 +333,38 @@ class Pipeline:
         if not confirmed:
             raise PipelineAborted("업로드 컨펌 거부")
 
-        for lang, video_key, shorts_key in [
-            ("ko", "video_landscape_ko", "video_shorts_ko"),
-            ("en", "video_landscape_en", "video_shorts_en"),
-        ]:
-            meta_long  = build_metadata(self.state, lang=lang, is_shorts=False)
-            meta_short = build_metadata(self.state, lang=lang, is_shorts=True)
-
-            upload_video(
-                video_path=self.state[video_key],
-                thumbnail_path=self.state["thumbnail_paths"][f"landscape_{lang}"],
-                metadata=meta_long,
-                lang=lang,
-            )
-            upload_video(
-                video_path=self.state[shorts_key],
-                thumbnail_path=self.state["thumbnail_paths"][f"shorts_{lang}"],
-                metadata=meta_short,
-                lang=lang,
-            )
+        # ko/en 채널 업로드는 서로 독립 (네트워크 I/O) — 언어별로 동시에 진행한다
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [
+                pool.submit(self._upload_lang, lang, video_key, shorts_key)
+                for lang, video_key, shorts_key in [
+                    ("ko", "video_landscape_ko", "video_shorts_ko"),
+                    ("en", "video_landscape_en", "video_shorts_en"),
+                ]
+            ]
+            for future in futures:
+                future.result()   # 실패한 언어의 예외를 그대로 전달
+
+    def _upload_lang(self, lang: str, video_key: str, shorts_key: str) -> None:
+        """한 언어 채널에 가로 영상과 쇼츠를 순서대로 업로드한다."""
+        from uploader.youtube_uploader import upload_video
+        from uploader.metadata_builder import build_metadata
+
+        meta_long  = build_metadata(self.state, lang=lang, is_shorts=False)
+        meta_short = build_metadata(self.state, lang=lang, is_shorts=True)
+
+        upload_video(
+            video_path=self.state[video_key],
+            thumbnail_path=self.state["thumbnail_paths"][f"landscape_{lang}"],
+            metadata=meta_long,
+            lang=lang,
+        )
+        upload_video(
+            video_path=self.state[shorts_key],
+            thumbnail_path=self.state["thumbnail_paths"][f"shorts_{lang}"],
+            metadata=meta_short,
+            lang=lang,
+        )
 
     # ─────────────────────────────────────────────
     # 헬퍼
@@ -134,7 +134,7 @@ class AnalyticsTab(QWidget):
             from history.history_manager import get_all
             from analytics.youtube_analytics import fetch_stats_for_history
 
-            records = get_all(limit=20)
+            records = get_all(limit=20, include_breakdown=True)
             all_stats: list[dict] = []
 
             for record in records:
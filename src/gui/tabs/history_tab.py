@@ -58,6 +58,9 @@ class HistoryTab(QWidget):
             1, QHeaderView.ResizeMode.Stretch
         )
         self._table.setColumnWidth(0, 40)
+        # 행 높이 고정 — 행 추가 시 내용 기반 높이 측정을 하지 않는다
+        self._table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self._table.verticalHeader().setDefaultSectionSize(22)
         layout.addWidget(self._table, stretch=1)
 
         # 하단 버튼
@@ -113,11 +116,10 @@ class HistoryTab(QWidget):
             self._table.setItem(row, 7, QTableWidgetItem(r.get("upload_status", "")))
 
     def _on_delete(self) -> None:
-        selected = self._table.selectedItems()
-        if not selected:
+        rows = [idx.row() for idx in self._table.selectionModel().selectedRows(0)]
+        if not rows:
             return
 
-        rows = set(item.row() for item in selected)
         ids = [self._records[r]["id"] for r in rows if r < len(self._records)]
 
         reply = QMessageBox.question(
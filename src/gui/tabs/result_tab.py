@@ -17,6 +17,12 @@ from gui.components.video_preview import VideoPreview
 
 logger = logging.getLogger(__name__)
 
+# (언어, 가로 영상 state 키, 쇼츠 영상 state 키)
+_LANG_KEYS = (
+    ("ko", "video_landscape_ko", "video_shorts_ko"),
+    ("en", "video_landscape_en", "video_shorts_en"),
+)
+
 
 class ResultTab(QWidget):
     """결과 탭 위젯."""
@@ -132,10 +138,7 @@ class ResultTab(QWidget):
             from uploader.youtube_uploader import upload_video
             from uploader.metadata_builder import build_metadata
 
-            for lang, v_key, s_key in [
-                ("ko", "video_landscape_ko", "video_shorts_ko"),
-                ("en", "video_landscape_en", "video_shorts_en"),
-            ]:
+            for lang, v_key, s_key in _LANG_KEYS:
                 meta_long = build_metadata(self._state, lang=lang, is_shorts=False)
                 meta_short = build_metadata(self._state, lang=lang, is_shorts=True)
 
@@ -159,10 +162,7 @@ class ResultTab(QWidget):
             from uploader.metadata_builder import build_metadata
 
             count = 0
-            for lang, v_key, s_key in [
-                ("ko", "video_landscape_ko", "video_shorts_ko"),
-                ("en", "video_landscape_en", "video_shorts_en"),
-            ]:
+            for lang, v_key, s_key in _LANG_KEYS:
                 meta_long = build_metadata(self._state, lang=lang, is_shorts=False)
                 meta_short = build_metadata(self._state, lang=lang, is_shorts=True)
 
@@ -12,7 +12,7 @@ from PyQt6.QtWidgets import (
     QHeaderView, QComboBox, QTimeEdit, QGroupBox,
     QFormLayout, QMessageBox, QAbstractItemView,
 )
-from PyQt6.QtCore import Qt, QTime
+from PyQt6.QtCore import Qt, QTime, pyqtSignal
 
 logger = logging.getLogger(__name__)
 
@@ -22,9 +22,13 @@ class ScheduleTab(QWidget):
 
     _COLUMNS = ["ID", "파일명", "언어", "상태", "예약시간", "업로드완료", "video_id"]
 
+    # CronRunner 스레드 → GUI 스레드 (처리 주기별 업로드 결과 목록)
+    upload_results = pyqtSignal(list)
+
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self._runner = None
+        self.upload_results.connect(self._on_upload_results)
         self._setup_ui()
         self._refresh_queue()
 
@@ -78,6 +82,9 @@ class ScheduleTab(QWidget):
         self._table.horizontalHeader().setSectionResizeMode(
             1, QHeaderView.ResizeMode.Stretch
         )
+        # 행 높이 고정 — 행 추가 시 내용 기반 높이 측정을 하지 않는다
+        self._table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self._table.verticalHeader().setDefaultSectionSize(22)
         layout.addWidget(self._table, stretch=1)
 
         # 하단 버튼
@@ -129,19 +136,30 @@ class ScheduleTab(QWidget):
             logger.error("큐 로드 실패: %s", e)
 
     def _get_selected_ids(self) -> list[int]:
-        items = self._table.selectedItems()
-        rows = set(item.row() for item in items)
+        # selectedRows()는 행당 인덱스 하나만 반환 (selectedItems()는 셀 단위)
         ids = []
-        for r in rows:
-            id_item = self._table.item(r, 0)
+        for idx in self._table.selectionModel().selectedRows(0):
+            id_item = self._table.item(idx.row(), 0)
             if id_item:
                 ids.append(int(id_item.text()))
         return ids
 
-    def _on_apply_schedule(self) -> None:
+    def _ensure_runner(self) -> None:
         if not self._runner:
             from scheduler.cron_runner import CronRunner
-            self._runner = CronRunner()
+            # 콜백은 CronRunner 스레드에서 호출되므로 시그널로 GUI 스레드에 넘긴다
+            self._runner = CronRunner(on_upload_results=self.upload_results.emit)
+
+    def _on_upload_results(self, results: list) -> None:
+        """처리 주기 하나가 끝나면 큐 목록과 상태 표시를 한 번에 갱신한다."""
+        ok = sum(1 for _, success, _ in results if success)
+        failed = len(results) - ok
+        if self._runner and self._runner.is_running():
+            self._status_label.setText(f"실행 중 — 최근 업로드: 완료 {ok} / 실패 {failed}")
+        self._refresh_queue()
+
+    def _on_apply_schedule(self) -> None:
+        self._ensure_runner()
 
         mode = self._repeat_combo.currentData()
         upload_time = self._time_edit.time().toString("HH:mm")
@@ -149,9 +167,7 @@ class ScheduleTab(QWidget):
         QMessageBox.information(self, "적용", f"스케줄 설정 완료: {mode} / {upload_time}")
 
     def _on_toggle_runner(self) -> None:
-        if not self._runner:
-            from scheduler.cron_runner import CronRunner
-            self._runner = CronRunner()
+        self._ensure_runner()
 
         if self._runner.is_running():
             self._runner.stop()
@@ -171,9 +187,8 @@ class ScheduleTab(QWidget):
         if not ids:
             return
         try:
-            from scheduler.upload_queue import retry
-            for qid in ids:
-                retry(qid)
+            from scheduler.upload_queue import retry_many
+            retry_many(ids)
             self._refresh_queue()
         except Exception as e:
             QMessageBox.critical(self, "오류", str(e))
@@ -183,9 +198,8 @@ class ScheduleTab(QWidget):
         if not ids:
             return
         try:
-            from scheduler.upload_queue import cancel
-            for qid in ids:
-                cancel(qid)
+            from scheduler.upload_queue import cancel_many
+            cancel_many(ids)
             self._refresh_queue()
         except Exception as e:
             QMessageBox.critical(self, "오류", str(e))
@@ -201,9 +215,8 @@ class ScheduleTab(QWidget):
         if reply != QMessageBox.StandardButton.Yes:
             return
         try:
-            from scheduler.upload_queue import remove
-            for qid in ids:
-                remove(qid)
+            from scheduler.upload_queue import remove_many
+            remove_many(ids)
             self._refresh_queue()
         except Exception as e:
             QMessageBox.critical(self, "오류", str(e))
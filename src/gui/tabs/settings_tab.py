@@ -6,6 +6,7 @@ TTS 음성, BGM, 자막, 엔진 선택, API 키 등 전체 설정을 관리한
 """
 
 import logging
+from typing import Optional
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
@@ -14,18 +15,75 @@ from PyQt6.QtWidgets import (
     QMessageBox, QTextEdit, QScrollArea, QSpinBox,
     QDoubleSpinBox,
 )
-from PyQt6.QtCore import Qt
-
-from gui.components.engine_selector import EngineSelector
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 
 logger = logging.getLogger(__name__)
 
+# EngineSelector가 관리하는 config 키
+_ENGINE_KEYS = (
+    "SCENARIO_ENGINE", "IMAGE_ENGINE", "TTS_ENGINE",
+    "OPENAI_API_KEY", "PIXABAY_API_KEY", "GOOGLE_CLIENT_SECRET_PATH",
+    "OLLAMA_HOST", "SD_API_URL",
+)
+
+
+# (config 키, 위젯 값 getter) — _save_settings에서 한 번에 dict로 변환
+_SETTINGS_SCHEMA = (
+    ("YOUTUBE_KO_CHANNEL_ID", lambda t: t._ko_channel.text().strip()),
+    ("YOUTUBE_EN_CHANNEL_ID", lambda t: t._en_channel.text().strip()),
+    ("YOUTUBE_PRIVACY", lambda t: t._privacy_combo.currentText()),
+    ("YOUTUBE_CATEGORY_ID", lambda t: t._category_input.text().strip()),
+    ("VIDEO_RESOLUTION", lambda t: t._resolution_combo.currentText()),
+    ("VIDEO_BITRATE", lambda t: t._bitrate_input.text().strip()),
+    ("TARGET_DURATION_SEC", lambda t: t._target_duration.value()),
+    ("SCENE_TARGET_SEC", lambda t: t._scene_target.value()),
+    ("NARRATIVE_TONE", lambda t: t._tone_combo.currentText()),
+    ("HOOK_INTENSITY", lambda t: t._hook_combo.currentText()),
+    ("IMAGE_STYLE", lambda t: t._style_input.toPlainText().strip()),
+    ("IMAGE_QUALITY", lambda t: t._image_quality_combo.currentText()),
+    ("TTS_SPEED", lambda t: t._tts_speed.value()),
+    ("TTS_KO_VOICE", lambda t: t._tts_ko_voice.currentText()),
+    ("TTS_EN_VOICE", lambda t: t._tts_en_voice.currentText()),
+    ("BGM_VOLUME_RATIO", lambda t: t._bgm_slider.value() / 100.0),
+    ("SUBTITLE_ENABLED", lambda t: t._subtitle_check.isChecked()),
+    ("SUBTITLE_FONT_SIZE", lambda t: t._sub_size.value()),
+    ("SUBTITLE_POSITION", lambda t: t._sub_position.currentText()),
+    ("SUBTITLE_COLOR", lambda t: t._sub_color.currentText()),
+)
+
+
+class _SaveSignals(QObject):
+    """QRunnable은 시그널을 가질 수 없으므로 별도 QObject로 결과를 전달한다."""
+
+    finished = pyqtSignal(bool, str)  # (success, error)
+
+
+class _SaveTask(QRunnable):
+    """설정 파일 쓰기를 스레드 풀에서 실행한다."""
+
+    def __init__(self, settings: dict, done_message: tuple[str, str]) -> None:
+        super().__init__()
+        self.settings = settings
+        self.done_message = done_message   # 저장 성공 시 알림 (제목, 본문)
+        self.signals = _SaveSignals()
+
+    def run(self) -> None:
+        import config
+        try:
+            config.save_settings(self.settings)
+            self.signals.finished.emit(True, "")
+        except Exception as e:
+            self.signals.finished.emit(False, str(e))
+
 
 class SettingsTab(QWidget):
     """설정 탭 위젯."""
 
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
+        self._save_task: Optional[_SaveTask] = None
+        self._pending_save: Optional[tuple[dict, tuple[str, str]]] = None   # (settings, 완료 알림)
+        self._engine_selector = None  # 탭이 처음 표시될 때 생성
         self._setup_ui()
         self._load_current_settings()
 
@@ -137,9 +195,12 @@ class SettingsTab(QWidget):
         self._bgm_slider.setValue(15)
         self._bgm_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
         self._bgm_label = QLabel("15%")
-        self._bgm_slider.valueChanged.connect(
-            lambda v: self._bgm_label.setText(f"{v}%")
+        # 고정 폭 + 우측 정렬: 드래그 중 텍스트 길이가 바뀌어도 레이아웃 재계산 없음
+        self._bgm_label.setFixedWidth(40)
+        self._bgm_label.setAlignment(
+            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
         )
+        self._bgm_slider.valueChanged.connect(self._on_bgm_changed)
         bgm_row = QHBoxLayout()
         bgm_row.addWidget(self._bgm_slider)
         bgm_row.addWidget(self._bgm_label)
@@ -165,9 +226,10 @@ class SettingsTab(QWidget):
         sub_form.addRow("색상:", self._sub_color)
         layout.addWidget(sub_group)
 
-        # 9~10. 엔진 선택 + API 키
-        self._engine_selector = EngineSelector()
-        layout.addWidget(self._engine_selector)
+        # 9~10. 엔진 선택 + API 키 (showEvent에서 실제 위젯으로 교체)
+        self._content_layout = layout
+        self._engine_placeholder = QWidget()
+        layout.addWidget(self._engine_placeholder)
 
         # 하단 버튼
         btn_layout = QHBoxLayout()
@@ -188,6 +250,20 @@ class SettingsTab(QWidget):
         outer = QVBoxLayout(self)
         outer.addWidget(scroll)
 
+    def showEvent(self, event) -> None:
+        """탭이 처음 표시될 때 엔진 선택 위젯을 생성한다."""
+        super().showEvent(event)
+        if self._engine_selector is not None:
+            return
+        from gui.components.engine_selector import EngineSelector
+        self._engine_selector = EngineSelector()
+        self._content_layout.replaceWidget(self._engine_placeholder, self._engine_selector)
+        self._engine_placeholder.deleteLater()
+        self._load_engine_settings()
+
+    def _on_bgm_changed(self, value: int) -> None:
+        self._bgm_label.setText(f"{value}%")
+
     def _browse_output_dir(self) -> None:
         path = QFileDialog.getExistingDirectory(self, "출력 폴더 선택")
         if path:
@@ -218,44 +294,29 @@ class SettingsTab(QWidget):
         self._sub_size.setValue(config.SUBTITLE_FONT_SIZE)
         self._sub_position.setCurrentText(config.SUBTITLE_POSITION)
         self._sub_color.setCurrentText(config.SUBTITLE_COLOR)
+        self._load_engine_settings()
+
+    def _load_engine_settings(self) -> None:
+        """엔진 선택 위젯이 생성돼 있으면 config 값을 반영한다."""
+        if self._engine_selector is None:
+            return
+        import config
 
-        self._engine_selector.set_values({
-            "SCENARIO_ENGINE": config.SCENARIO_ENGINE,
-            "IMAGE_ENGINE": config.IMAGE_ENGINE,
-            "TTS_ENGINE": config.TTS_ENGINE,
-            "OPENAI_API_KEY": config.OPENAI_API_KEY,
-            "PIXABAY_API_KEY": config.PIXABAY_API_KEY,
-            "GOOGLE_CLIENT_SECRET_PATH": config.GOOGLE_CLIENT_SECRET_PATH,
-            "OLLAMA_HOST": config.OLLAMA_HOST,
-            "SD_API_URL": config.SD_API_URL,
-        })
+        self._engine_selector.set_values({k: getattr(config, k) for k in _ENGINE_KEYS})
 
     def _save_settings(self) -> None:
-        """위젯 값을 config.py에 반영한다."""
+        """위젯 값을 config.py에 반영하고 파일에 저장한다."""
         import config
 
-        settings = {
-            "YOUTUBE_KO_CHANNEL_ID": self._ko_channel.text().strip(),
-            "YOUTUBE_EN_CHANNEL_ID": self._en_channel.text().strip(),
-            "YOUTUBE_PRIVACY": self._privacy_combo.currentText(),
-            "YOUTUBE_CATEGORY_ID": self._category_input.text().strip(),
-            "VIDEO_RESOLUTION": self._resolution_combo.currentText(),
-            "VIDEO_BITRATE": self._bitrate_input.text().strip(),
-            "TARGET_DURATION_SEC": self._target_duration.value(),
-            "SCENE_TARGET_SEC": self._scene_target.value(),
-            "NARRATIVE_TONE": self._tone_combo.currentText(),
-            "HOOK_INTENSITY": self._hook_combo.currentText(),
-            "IMAGE_STYLE": self._style_input.toPlainText().strip(),
-            "IMAGE_QUALITY": self._image_quality_combo.currentText(),
-            "TTS_SPEED": self._tts_speed.value(),
-            "TTS_KO_VOICE": self._tts_ko_voice.currentText(),
-            "TTS_EN_VOICE": self._tts_en_voice.currentText(),
-            "BGM_VOLUME_RATIO": self._bgm_slider.value() / 100.0,
-            "SUBTITLE_ENABLED": self._subtitle_check.isChecked(),
-            "SUBTITLE_FONT_SIZE": self._sub_size.value(),
-            "SUBTITLE_POSITION": self._sub_position.currentText(),
-            "SUBTITLE_COLOR": self._sub_color.currentText(),
-        }
+        settings = self._collect_settings()
+        config.apply_settings(settings)
+        self._persist_settings(settings)
+
+    def _collect_settings(self) -> dict:
+        """위젯 값을 config 키 dict로 만든다."""
+        import config
+
+        settings = {key: getter(self) for key, getter in _SETTINGS_SCHEMA}
 
         # 출력 폴더 변경 시 Path로 변환
         output_dir = self._output_dir.text().strip()
@@ -263,12 +324,42 @@ class SettingsTab(QWidget):
             from pathlib import Path
             settings["OUTPUT_DIR"] = Path(output_dir)
 
-        # 엔진 및 API 키
-        engine_values = self._engine_selector.get_values()
-        settings.update(engine_values)
-
-        config.apply_settings(settings)
-        QMessageBox.information(self, "저장 완료", "설정이 반영됐습니다.")
+        # 엔진 및 API 키 (위젯이 아직 없으면 config 값 유지)
+        if self._engine_selector is not None:
+            settings.update(self._engine_selector.get_values())
+        else:
+            settings.update({k: getattr(config, k) for k in _ENGINE_KEYS})
+        return settings
+
+    def _persist_settings(
+        self,
+        settings: dict,
+        done_message: tuple[str, str] = ("저장 완료", "설정이 반영됐습니다."),
+    ) -> None:
+        """
+        설정 파일 쓰기를 백그라운드로 넘긴다. 저장 중이면 마지막 요청만 남겨 이어서 저장한다.
+        done_message: 저장 성공 시 표시할 (제목, 본문)
+        """
+        if self._save_task is not None:
+            self._pending_save = (settings, done_message)
+            return
+        self._save_task = _SaveTask(settings, done_message)
+        self._save_task.setAutoDelete(False)
+        self._save_task.signals.finished.connect(self._on_save_finished)
+        QThreadPool.globalInstance().start(self._save_task)
+
+    def _on_save_finished(self, success: bool, error: str) -> None:
+        done_title, done_text = self._save_task.done_message
+        self._save_task = None
+        if self._pending_save is not None:
+            (settings, done_message), self._pending_save = self._pending_save, None
+            self._persist_settings(settings, done_message)
+            return
+        if success:
+            QMessageBox.information(self, done_title, done_text)
+        else:
+            logger.error("설정 저장 실패: %s", error)
+            QMessageBox.warning(self, "저장 실패", f"설정은 반영됐지만 파일 저장에 실패했습니다.\n{error}")
 
     def _reset_defaults(self) -> None:
         reply = QMessageBox.question(
@@ -282,4 +373,8 @@ class SettingsTab(QWidget):
         # IMAGE_STYLE만 기본값 복원 (다른 값은 코드 기본값이므로 reload 대안)
         config.IMAGE_STYLE = config.IMAGE_STYLE_DEFAULT
         self._load_current_settings()
-        QMessageBox.information(self, "초기화 완료", "기본값으로 복원됐습니다.")
+        # 저장 파일에도 반영 — 재시작 시 이전 값이 되살아나지 않도록
+        self._persist_settings(
+            self._collect_settings(),
+            done_message=("초기화 완료", "기본값으로 복원됐습니다."),
+        )
@@ -6,22 +6,40 @@ history/history_manager.py — 히스토리 저장/조회
 히스토리 탭 및 통계 탭에서 활용된다.
 """
 
-import json
 import logging
 import sqlite3
-from typing import Optional
+from typing import ContextManager, Optional
 
 import config
+from core import db, fast_json
 
 logger = logging.getLogger(__name__)
 
 _DB_PATH = config.HISTORY_DB_PATH
+_DB = db.shared(_DB_PATH)
 
+# 조회 결과는 sqlite3.Row 대신 튜플로 받아 이 컬럼 이름과 zip해 dict를 만든다
+_COLS_LIST = (
+    "id", "url", "title_ko", "title_en", "page_lang", "scene_count", "image_count",
+    "reused_images", "cost_usd", "cost_breakdown", "output_dir", "upload_status",
+    "video_ids", "created_at", "updated_at",
+)
+# 목록 조회용 컬럼 (JSON 컬럼 cost_breakdown/video_ids, updated_at 제외)
+_LIST_COLS_LIST = (
+    "id", "url", "title_ko", "title_en", "page_lang", "scene_count", "image_count",
+    "reused_images", "cost_usd", "output_dir", "upload_status", "created_at",
+)
+_ALL_COLS = ", ".join(_COLS_LIST)
+_LIST_COLS = ", ".join(_LIST_COLS_LIST)
 
-def _get_conn() -> sqlite3.Connection:
-    conn = sqlite3.connect(_DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+# trigram 토크나이저는 3글자 단위로 색인하므로 이보다 짧은 검색어는 LIKE로 찾는다
+_FTS_MIN_TERM_LEN = 3
+_fts_ready = False   # trigram FTS5 인덱스 사용 가능 여부 (_init_fts 성공 시 True)
+
+
+def _get_conn() -> ContextManager[sqlite3.Connection]:
+    """공유 연결을 빌려준다. with 블록 하나가 트랜잭션 하나."""
+    return _DB.transaction()
 
 
 def _init_db() -> None:
@@ -47,7 +65,75 @@ def _init_db() -> None:
             )
         """)
         conn.execute("CREATE INDEX IF NOT EXISTS idx_history_created ON history(created_at)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_history_title ON history(title_ko)")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_history_status_created "
+            "ON history(upload_status, created_at DESC)"
+        )
+        # 마이그레이션: 선행 와일드카드 LIKE에는 쓰이지 않던 title_ko 인덱스 제거 (제목 검색은 FTS5)
+        conn.execute("DROP INDEX IF EXISTS idx_history_title")
+        # 통계가 없으면 한 번 수집해 플래너가 새 인덱스를 고려하게 한다
+        has_stats = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchone()
+        if not has_stats:
+            conn.execute("ANALYZE")
+    global _fts_ready
+    try:
+        _init_fts()
+        _fts_ready = True
+    except sqlite3.OperationalError as e:
+        logger.warning("FTS5(trigram) 사용 불가 — LIKE 검색으로 동작: %s", e)
+
+
+def _init_fts() -> None:
+    """
+    제목/URL 검색용 FTS5 인덱스를 초기화한다.
+    history 테이블을 content로 쓰는 external-content 테이블이며,
+    트리거로 INSERT/UPDATE/DELETE를 따라간다.
+    trigram 토크나이저(SQLite 3.34+)로 LIKE '%kw%'와 같은 부분 문자열 검색을 한다.
+    (한국어 제목은 띄어쓰기 단위 토큰이 아니라 "인공지능기술"의 "기술"도 찾아야 한다)
+    """
+    with _get_conn() as conn:
+        row = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'history_fts'"
+        ).fetchone()
+        if row is not None:
+            if "trigram" in row[0]:
+                return
+            # 마이그레이션: 이전 unicode61 인덱스 → trigram으로 한 번 다시 만든다
+            for trigger in ("history_fts_ai", "history_fts_ad", "history_fts_au"):
+                conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+            conn.execute("DROP TABLE history_fts")
+        conn.execute("""
+            CREATE VIRTUAL TABLE history_fts USING fts5(
+                title_ko, title_en, url,
+                content='history', content_rowid='id',
+                tokenize='trigram'
+            )
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS history_fts_ai AFTER INSERT ON history BEGIN
+                INSERT INTO history_fts(rowid, title_ko, title_en, url)
+                VALUES (new.id, new.title_ko, new.title_en, new.url);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS history_fts_ad AFTER DELETE ON history BEGIN
+                INSERT INTO history_fts(history_fts, rowid, title_ko, title_en, url)
+                VALUES ('delete', old.id, old.title_ko, old.title_en, old.url);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS history_fts_au
+            AFTER UPDATE OF title_ko, title_en, url ON history BEGIN
+                INSERT INTO history_fts(history_fts, rowid, title_ko, title_en, url)
+                VALUES ('delete', old.id, old.title_ko, old.title_en, old.url);
+                INSERT INTO history_fts(rowid, title_ko, title_en, url)
+                VALUES (new.id, new.title_ko, new.title_en, new.url);
+            END
+        """)
+        # 기존 레코드 색인
+        conn.execute("INSERT INTO history_fts(history_fts) VALUES ('rebuild')")
 
 
 _init_db()
@@ -72,7 +158,7 @@ def add_record(
     """
     새 제작 이력을 추가한다. 반환: 생성된 record id.
     """
-    breakdown_json = json.dumps(cost_breakdown or {}, ensure_ascii=False)
+    breakdown_json = fast_json.dumps(cost_breakdown or {})
     with _get_conn() as conn:
         cursor = conn.execute(
             """INSERT INTO history
@@ -110,47 +196,89 @@ def add_from_pipeline(state: dict, cost_tracker) -> int:
 # 조회
 # ─────────────────────────────────────────────
 
-def get_all(limit: int = 100, offset: int = 0) -> list[dict]:
-    """전체 이력을 최신순으로 조회한다."""
+def get_all(limit: int = 100, offset: int = 0, *, include_breakdown: bool = False) -> list[dict]:
+    """
+    전체 이력을 최신순으로 조회한다.
+    include_breakdown=False면 목록용 컬럼(_LIST_COLS)만 읽고 JSON 파싱을 하지 않는다.
+    cost_breakdown/video_ids가 필요하면 True로 호출한다.
+    """
+    with _get_conn() as conn:
+        rows = _fetch_tuples(
+            conn,
+            f"SELECT {_select_cols(include_breakdown)} FROM history "
+            "ORDER BY created_at DESC LIMIT ? OFFSET ?",
+            (limit, offset),
+        )
+    return _rows_to_dicts(rows, include_breakdown)
+
+
+def get_all_fast(limit: int = 100, offset: int = 0) -> list[tuple]:
+    """
+    get_all()의 튜플 버전. dict 변환 없이 _LIST_COLS_LIST 순서의 튜플을 반환한다.
+    컬럼 위치를 알고 있는 반복 집계용.
+    """
     with _get_conn() as conn:
-        rows = conn.execute(
-            "SELECT * FROM history ORDER BY created_at DESC LIMIT ? OFFSET ?",
+        return _fetch_tuples(
+            conn,
+            f"SELECT {_LIST_COLS} FROM history ORDER BY created_at DESC LIMIT ? OFFSET ?",
             (limit, offset),
-        ).fetchall()
-    return [_row_to_dict(r) for r in rows]
+        )
 
 
 def get_by_id(record_id: int) -> Optional[dict]:
     """특정 이력을 조회한다."""
     with _get_conn() as conn:
-        row = conn.execute("SELECT * FROM history WHERE id = ?", (record_id,)).fetchone()
-    return _row_to_dict(row) if row else None
+        rows = _fetch_tuples(conn, f"SELECT {_ALL_COLS} FROM history WHERE id = ?", (record_id,))
+    return _row_to_dict(rows[0]) if rows else None
+
 
+def search(keyword: str, limit: int = 50, *, include_breakdown: bool = False) -> list[dict]:
+    """
+    제목 또는 URL에 키워드가 포함된 이력을 검색한다.
+    trigram FTS5 인덱스로 부분 문자열 검색을 한다.
+    FTS5를 쓸 수 없거나, 검색어가 3글자 미만이거나, 결과가 없으면 LIKE로 폴백한다.
+    """
+    cols = _select_cols(include_breakdown)
+    query = _fts_query(keyword) if _fts_ready else ""
+    if query:
+        try:
+            with _get_conn() as conn:
+                rows = _fetch_tuples(
+                    conn,
+                    f"""SELECT {cols} FROM history
+                        WHERE id IN (SELECT rowid FROM history_fts WHERE history_fts MATCH ?)
+                        ORDER BY created_at DESC LIMIT ?""",
+                    (query, limit),
+                )
+            if rows:
+                return _rows_to_dicts(rows, include_breakdown)
+        except sqlite3.OperationalError as e:
+            logger.debug("FTS5 검색 실패 — LIKE 폴백: %s", e)
 
-def search(keyword: str, limit: int = 50) -> list[dict]:
-    """제목 또는 URL에 키워드가 포함된 이력을 검색한다."""
     pattern = f"%{keyword}%"
     with _get_conn() as conn:
-        rows = conn.execute(
-            """SELECT * FROM history
-               WHERE title_ko LIKE ? OR title_en LIKE ? OR url LIKE ?
-               ORDER BY created_at DESC LIMIT ?""",
+        rows = _fetch_tuples(
+            conn,
+            f"""SELECT {cols} FROM history
+                WHERE title_ko LIKE ? OR title_en LIKE ? OR url LIKE ?
+                ORDER BY created_at DESC LIMIT ?""",
             (pattern, pattern, pattern, limit),
-        ).fetchall()
-    return [_row_to_dict(r) for r in rows]
+        )
+    return _rows_to_dicts(rows, include_breakdown)
 
 
-def get_by_month(year: int, month: int) -> list[dict]:
+def get_by_month(year: int, month: int, *, include_breakdown: bool = False) -> list[dict]:
     """특정 월의 이력을 조회한다."""
     month_str = f"{year:04d}-{month:02d}"
     with _get_conn() as conn:
-        rows = conn.execute(
-            """SELECT * FROM history
-               WHERE created_at LIKE ?
-               ORDER BY created_at DESC""",
+        rows = _fetch_tuples(
+            conn,
+            f"""SELECT {_select_cols(include_breakdown)} FROM history
+                WHERE created_at LIKE ?
+                ORDER BY created_at DESC""",
             (f"{month_str}%",),
-        ).fetchall()
-    return [_row_to_dict(r) for r in rows]
+        )
+    return _rows_to_dicts(rows, include_breakdown)
 
 
 # ─────────────────────────────────────────────
@@ -163,7 +291,7 @@ def update_upload_status(record_id: int, status: str, video_ids: Optional[dict]
     status: "not_uploaded" | "partial" | "uploaded"
     video_ids: {"landscape_ko": "xxx", "landscape_en": "xxx", ...}
     """
-    ids_json = json.dumps(video_ids or {}, ensure_ascii=False) if video_ids else None
+    ids_json = fast_json.dumps(video_ids or {}) if video_ids else None
     with _get_conn() as conn:
         if ids_json:
             conn.execute(
@@ -244,13 +372,40 @@ def total_reused_images() -> int:
 # 내부 헬퍼
 # ─────────────────────────────────────────────
 
-def _row_to_dict(row: sqlite3.Row) -> dict:
-    """sqlite3.Row를 dict로 변환하고 JSON 필드를 파싱한다."""
-    d = dict(row)
+def _fts_query(keyword: str) -> str:
+    """
+    검색어 전체를 trigram MATCH 구문(phrase)으로 변환한다. 예: 'ai 뉴스' → '"ai 뉴스"'
+    LIKE '%ai 뉴스%'와 같은 부분 문자열 일치. 3글자 미만이면 빈 문자열 (LIKE 사용).
+    """
+    if len(keyword) < _FTS_MIN_TERM_LEN:
+        return ""
+    return '"' + keyword.replace('"', '""') + '"'
+
+
+def _select_cols(include_breakdown: bool) -> str:
+    return _ALL_COLS if include_breakdown else _LIST_COLS
+
+
+def _fetch_tuples(conn: sqlite3.Connection, sql: str, params: tuple = ()) -> list[tuple]:
+    """공유 연결의 row_factory(sqlite3.Row)를 거치지 않고 튜플로 조회한다."""
+    cur = conn.cursor()
+    cur.row_factory = None
+    return cur.execute(sql, params).fetchall()
+
+
+def _rows_to_dicts(rows: list[tuple], include_breakdown: bool) -> list[dict]:
+    if include_breakdown:
+        return [_row_to_dict(r) for r in rows]
+    return [dict(zip(_LIST_COLS_LIST, r)) for r in rows]
+
+
+def _row_to_dict(row: tuple) -> dict:
+    """_COLS_LIST 순서의 튜플을 dict로 변환하고 JSON 필드를 파싱한다."""
+    d = dict(zip(_COLS_LIST, row))
     for json_field in ("cost_breakdown", "video_ids"):
         if d.get(json_field):
             try:
-                d[json_field] = json.loads(d[json_field])
-            except json.JSONDecodeError:
+                d[json_field] = fast_json.loads(d[json_field])
+            except fast_json.JSONDecodeError:
                 d[json_field] = {}
     return d
@@ -11,20 +11,21 @@ image/cache_matcher.py가 유사도 검색/저장을 담당하고,
 
 import logging
 import sqlite3
-from pathlib import Path
-from typing import Optional
+from typing import ContextManager, Optional
 
 import config
+from core import db
+from image import cache_matcher
 
 logger = logging.getLogger(__name__)
 
 _DB_PATH = config.IMAGE_CACHE_DB_PATH
+_DB = db.shared(_DB_PATH, **cache_matcher.DB_PRAGMAS)
 
 
-def _get_conn() -> sqlite3.Connection:
-    conn = sqlite3.connect(_DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+def _get_conn() -> ContextManager[sqlite3.Connection]:
+    """공유 연결을 빌려준다. with 블록 하나가 트랜잭션 하나."""
+    return _DB.transaction()
 
 
 def _ensure_columns() -> None:
@@ -43,10 +44,64 @@ def _ensure_columns() -> None:
             conn.execute("ALTER TABLE image_cache ADD COLUMN style TEXT DEFAULT ''")
 
 
+def _ensure_counters() -> None:
+    """
+    전체 항목 수 / 고유 프롬프트 수를 image_cache_meta에 유지한다.
+    INSERT/DELETE/UPDATE 트리거가 값을 갱신하므로 통계 조회 시 COUNT 스캔이 필요 없다.
+    """
+    with _get_conn() as conn:
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_image_cache_prompt ON image_cache(prompt)"
+        )
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS image_cache_meta (
+                k   TEXT    PRIMARY KEY,
+                v   INTEGER NOT NULL
+            )
+        """)
+        seeded = conn.execute("SELECT COUNT(*) AS cnt FROM image_cache_meta").fetchone()["cnt"]
+        if not seeded:
+            conn.execute("""
+                INSERT INTO image_cache_meta (k, v)
+                SELECT 'total', COUNT(*) FROM image_cache
+                UNION ALL
+                SELECT 'unique_prompts', COUNT(DISTINCT prompt) FROM image_cache
+            """)
+
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS image_cache_meta_ai AFTER INSERT ON image_cache BEGIN
+                UPDATE image_cache_meta SET v = v + 1 WHERE k = 'total';
+                UPDATE image_cache_meta SET v = v + 1 WHERE k = 'unique_prompts'
+                    AND NOT EXISTS (
+                        SELECT 1 FROM image_cache WHERE prompt = new.prompt AND id <> new.id
+                    );
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS image_cache_meta_ad AFTER DELETE ON image_cache BEGIN
+                UPDATE image_cache_meta SET v = v - 1 WHERE k = 'total';
+                UPDATE image_cache_meta SET v = v - 1 WHERE k = 'unique_prompts'
+                    AND NOT EXISTS (SELECT 1 FROM image_cache WHERE prompt = old.prompt);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS image_cache_meta_au
+            AFTER UPDATE OF prompt ON image_cache WHEN old.prompt <> new.prompt BEGIN
+                UPDATE image_cache_meta SET v = v - 1 WHERE k = 'unique_prompts'
+                    AND NOT EXISTS (SELECT 1 FROM image_cache WHERE prompt = old.prompt);
+                UPDATE image_cache_meta SET v = v + 1 WHERE k = 'unique_prompts'
+                    AND NOT EXISTS (
+                        SELECT 1 FROM image_cache WHERE prompt = new.prompt AND id <> new.id
+                    );
+            END
+        """)
+
+
 # cache_matcher.py가 _init_db()로 테이블을 먼저 생성하므로
-# import 시점에 컬럼 확장만 수행
+# import 시점에 컬럼 확장 + 카운터 설정만 수행
 try:
     _ensure_columns()
+    _ensure_counters()
 except Exception:
     pass  # 테이블이 아직 없을 수 있음 — cache_matcher 첫 사용 시 생성됨
 
@@ -102,15 +157,41 @@ def save_with_history(
     """
     with _get_conn() as conn:
         cursor = conn.execute(
-            """INSERT INTO image_cache (prompt, image_path, history_id, style)
-               VALUES (?, ?, ?, ?)""",
-            (prompt.strip(), str(image_path), history_id, style),
+            """INSERT INTO image_cache
+               (prompt, image_path, history_id, style, prompt_tokens, size_bytes)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            (prompt.strip(), str(image_path), history_id, style,
+             cache_matcher.prompt_tokens(prompt), cache_matcher.file_size(image_path)),
         )
         cache_id = cursor.lastrowid
     logger.debug("이미지 캐시 저장 [id=%d, history=%s]: %s", cache_id, history_id, image_path)
     return cache_id
 
 
+def bulk_save_with_history(items: list[tuple[str, str, Optional[int], str]]) -> list[int]:
+    """
+    여러 이미지를 한 트랜잭션으로 캐시에 저장한다. (커밋/fsync 1회)
+
+    items: [(prompt, image_path, history_id, style), ...]
+    반환: 생성된 캐시 레코드 id 목록 (items 순서)
+    """
+    if not items:
+        return []
+    cache_ids: list[int] = []
+    with _get_conn() as conn:
+        for prompt, image_path, history_id, style in items:
+            cursor = conn.execute(
+                """INSERT INTO image_cache
+                   (prompt, image_path, history_id, style, prompt_tokens, size_bytes)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (prompt.strip(), str(image_path), history_id, style,
+                 cache_matcher.prompt_tokens(prompt), cache_matcher.file_size(image_path)),
+            )
+            cache_ids.append(cursor.lastrowid)
+    logger.debug("이미지 캐시 일괄 저장: %d개", len(cache_ids))
+    return cache_ids
+
+
 def link_to_history(cache_ids: list[int], history_id: int) -> None:
     """기존 캐시 항목들을 특정 제작 이력에 연결한다."""
     if not cache_ids:
@@ -130,26 +211,26 @@ def link_to_history(cache_ids: list[int], history_id: int) -> None:
 
 def total_count() -> int:
     """전체 캐시 이미지 수."""
+    return _counter("total")
+
+
+def _counter(key: str) -> int:
+    """image_cache_meta에 유지되는 카운터 값을 읽는다."""
     with _get_conn() as conn:
-        row = conn.execute("SELECT COUNT(*) as cnt FROM image_cache").fetchone()
-    return row["cnt"]
+        row = conn.execute("SELECT v FROM image_cache_meta WHERE k = ?", (key,)).fetchone()
+    return row["v"] if row else 0
 
 
 def total_disk_usage_mb() -> float:
     """
     캐시 이미지 파일의 총 디스크 사용량 (MB).
-    존재하지 않는 파일은 제외한다.
+    저장 시점에 기록한 size_bytes의 합계이며, 파일이 사라진 항목은 clear_missing()으로 정리된다.
     """
     with _get_conn() as conn:
-        rows = conn.execute("SELECT image_path FROM image_cache").fetchall()
-
-    total_bytes = 0
-    for row in rows:
-        p = Path(row["image_path"])
-        if p.exists():
-            total_bytes += p.stat().st_size
-
-    return total_bytes / (1024 * 1024)
+        row = conn.execute(
+            "SELECT COALESCE(SUM(size_bytes), 0) / 1048576.0 AS mb FROM image_cache"
+        ).fetchone()
+    return row["mb"]
 
 
 def reuse_stats() -> dict:
@@ -164,9 +245,8 @@ def reuse_stats() -> dict:
             "reusable": int  (2회 이상 유사 프롬프트가 있는 이미지 수),
         }
     """
-    with _get_conn() as conn:
-        total = conn.execute("SELECT COUNT(*) as cnt FROM image_cache").fetchone()["cnt"]
-        unique = conn.execute("SELECT COUNT(DISTINCT prompt) as cnt FROM image_cache").fetchone()["cnt"]
+    total = _counter("total")
+    unique = _counter("unique_prompts")
 
     return {
         "total_cached": total,
@@ -191,7 +271,8 @@ def clear_missing() -> int:
     with _get_conn() as conn:
         rows = conn.execute("SELECT id, image_path FROM image_cache").fetchall()
 
-    missing_ids = [row["id"] for row in rows if not Path(row["image_path"]).exists()]
+    existing = cache_matcher.file_sizes(row["image_path"] for row in rows)
+    missing_ids = [row["id"] for row in rows if row["image_path"] not in existing]
     if not missing_ids:
         return 0
 
@@ -201,6 +282,7 @@ def clear_missing() -> int:
             f"DELETE FROM image_cache WHERE id IN ({placeholders})",
             missing_ids,
         )
+    cache_matcher.invalidate_index()
     logger.info("캐시 정리: %d개 항목 삭제 (파일 누락)", len(missing_ids))
     return len(missing_ids)
 
@@ -210,6 +292,7 @@ def clear_all() -> int:
     with _get_conn() as conn:
         cursor = conn.execute("DELETE FROM image_cache")
         count = cursor.rowcount
+    cache_matcher.invalidate_index()
     logger.info("캐시 전체 초기화: %d개 항목 삭제", count)
     return count
 
@@ -221,5 +304,6 @@ def delete_by_history(history_id: int) -> int:
             "DELETE FROM image_cache WHERE history_id = ?", (history_id,)
         )
         count = cursor.rowcount
+    cache_matcher.invalidate_index()
     logger.info("캐시 삭제 (history_id=%d): %d개 항목", history_id, count)
     return count
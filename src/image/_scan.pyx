@@ -0,0 +1,67 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+image/_scan.pyx — Cython 유사도 스캔 (선택 빌드)
+
+numba를 설치할 수 없는 배포 환경용으로, image/_scan_numba.py와 같은 알고리즘을
+미리 컴파일해 둔다. `python build.py`가 Cython이 있으면 제자리(in-place)로 빌드하며,
+빌드된 모듈이 있으면 cache_matcher가 numba보다 먼저 사용한다.
+"""
+
+import numpy as np
+
+from libc.stdint cimport int32_t, int64_t
+
+
+def jaccard_scan(
+    const int32_t[::1] q_tokens,
+    Py_ssize_t q_len,
+    const int64_t[::1] offsets,
+    const int32_t[::1] data,
+    int64_t min_len,
+    int64_t max_len,
+):
+    """
+    모든 행과 쿼리의 Jaccard 유사도를 반환한다. 인자는 _scan_numba.jaccard_scan과 동일.
+
+    q_tokens: 인덱스 어휘에 있는 쿼리 토큰 id (오름차순 int32)
+    q_len:    쿼리 전체 토큰 수 (어휘에 없는 토큰 포함 — 합집합 크기에 반영)
+    offsets:  행 i의 토큰은 data[offsets[i]:offsets[i + 1]] (int64)
+    data:     행별 오름차순 토큰 id (int32)
+    min_len, max_len: 임계값을 넘을 수 있는 행 토큰 수 범위
+    """
+    cdef Py_ssize_t n_rows = offsets.shape[0] - 1
+    cdef Py_ssize_t n_q = q_tokens.shape[0]
+    out_arr = np.zeros(n_rows, dtype=np.float64)
+    cdef double[::1] out = out_arr
+    cdef Py_ssize_t i, a, b, start, end, row_len, inter
+    cdef int32_t x, y
+
+    if q_len == 0:
+        return out_arr
+
+    with nogil:
+        for i in range(n_rows):
+            start = offsets[i]
+            end = offsets[i + 1]
+            row_len = end - start
+            if row_len == 0 or row_len < min_len or row_len > max_len:
+                continue
+
+            a = 0
+            b = start
+            inter = 0
+            while a < n_q and b < end:
+                x = q_tokens[a]
+                y = data[b]
+                if x == y:
+                    inter += 1
+                    a += 1
+                    b += 1
+                elif x < y:
+                    a += 1
+                else:
+                    b += 1
+
+            out[i] = <double>inter / <double>(q_len + row_len - inter)
+
+    return out_arr
@@ -0,0 +1,61 @@
+"""
+image/_scan_numba.py — Numba JIT 유사도 스캔 (선택 의존성)
+
+numba가 설치돼 있으면 cache_matcher가 NumPy 경로 대신 이 커널을 사용한다.
+캐시 토큰 인덱스(CSR: offsets/data, 행마다 토큰 id 오름차순)를 한 번 훑으며
+투 포인터 병합으로 교집합 크기를 세어 Jaccard 유사도를 계산한다.
+토큰 수가 [min_len, max_len] 밖인 행은 병합 없이 건너뛴다.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, nogil=True)
+def jaccard_scan(
+    q_tokens: np.ndarray,
+    q_len: int,
+    offsets: np.ndarray,
+    data: np.ndarray,
+    min_len: int,
+    max_len: int,
+) -> np.ndarray:
+    """
+    모든 행과 쿼리의 Jaccard 유사도를 반환한다.
+
+    q_tokens: 인덱스 어휘에 있는 쿼리 토큰 id (오름차순 int32)
+    q_len:    쿼리 전체 토큰 수 (어휘에 없는 토큰 포함 — 합집합 크기에 반영)
+    offsets:  행 i의 토큰은 data[offsets[i]:offsets[i + 1]]
+    data:     행별 오름차순 토큰 id (int32)
+    min_len, max_len: 임계값을 넘을 수 있는 행 토큰 수 범위
+    """
+    n_rows = offsets.size - 1
+    n_q = q_tokens.size
+    out = np.zeros(n_rows, dtype=np.float64)
+    if q_len == 0:
+        return out
+
+    for i in range(n_rows):
+        start = offsets[i]
+        end = offsets[i + 1]
+        row_len = end - start
+        if row_len == 0 or row_len < min_len or row_len > max_len:
+            continue
+
+        a = 0
+        b = start
+        inter = 0
+        while a < n_q and b < end:
+            x = q_tokens[a]
+            y = data[b]
+            if x == y:
+                inter += 1
+                a += 1
+                b += 1
+            elif x < y:
+                a += 1
+            else:
+                b += 1
+
+        out[i] = inter / (q_len + row_len - inter)
+    return out
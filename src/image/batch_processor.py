@@ -2,20 +2,23 @@
 image/batch_processor.py — 배치 병렬 이미지 생성
 
 scenes 목록을 IMAGE_BATCH_SIZE(기본 10)개 단위 배치로 나눠 처리한다.
-  - DALL-E 3: ThreadPoolExecutor로 배치 내 병렬 생성 (max_workers=5, Rate Limit 대응)
+  - DALL-E 3: asyncio로 배치 내 동시 생성 (세마포어 5개, Rate Limit 대응)
   - Stable Diffusion: 순차 생성 (로컬 GPU 단일 처리)
 
 각 scene 생성 전 cache_matcher로 유사 이미지를 검색한다.
 유사도 80% 이상 발견 시 reuse_callback을 호출해 제작자(또는 GUI)가 결정하도록 한다.
 """
 
+import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
 from pathlib import Path
 from typing import Callable, Optional
 
 import config
+from core import openai_client
 from core.cost_tracker import CostTracker
+from history import image_db
 from image import cache_matcher, style_anchor
 from image.generator import dalle_generator, sd_generator
 
@@ -27,7 +30,7 @@ ReuseCallback = Callable[[int, str, str], bool]
 # (completed: int, total: int) -> None
 ProgressCallback = Callable[[int, int], None]
 
-# DALL-E 3 Tier-1 Rate Limit: ~5 img/min. 워커 5개면 큐 쌓임 방지
+# DALL-E 3 Tier-1 Rate Limit: ~5 img/min. 동시 요청 5개면 큐 쌓임 방지
 _DALLE_MAX_WORKERS = 5
 
 
@@ -58,6 +61,12 @@ def generate_all(
     batches = [scenes[i:i + batch_size] for i in range(0, total, batch_size)]
     completed = 0
 
+    # 디렉토리 생성·기존 파일 확인은 장면마다 하지 않고 여기서 한 번만
+    scenes_dir = output_dir / "scenes"
+    scenes_dir.mkdir(parents=True, exist_ok=True)
+    with os.scandir(scenes_dir) as it:
+        existing = {entry.name for entry in it}
+
     logger.info(
         "이미지 생성 시작: 총 %d장, %d개 배치 (엔진=%s)",
         total, len(batches), config.IMAGE_ENGINE,
@@ -67,9 +76,9 @@ def generate_all(
         logger.info("배치 %d/%d 처리 중 (%d장)", batch_idx + 1, len(batches), len(batch))
 
         if config.IMAGE_ENGINE == "dalle3":
-            batch_result = _process_parallel(batch, output_dir, cost_tracker, reuse_callback)
+            batch_result = _process_parallel(batch, output_dir, existing, cost_tracker, reuse_callback)
         else:
-            batch_result = _process_sequential(batch, output_dir, reuse_callback)
+            batch_result = _process_sequential(batch, output_dir, existing, reuse_callback)
 
         result.update(batch_result)
         completed += len(batch)
@@ -77,6 +86,7 @@ def generate_all(
         if progress_callback:
             progress_callback(completed, total)
 
+    cache_matcher.flush()   # 순차 처리 중 save()한 캐시 항목 기록 완료 대기
     success = len(result)
     logger.info("이미지 생성 완료: %d/%d장 성공", success, total)
     return result
@@ -89,15 +99,62 @@ def generate_all(
 def _generate_one(
     scene: dict,
     output_dir: Path,
+    existing: set[str],
     cost_tracker: Optional[CostTracker],
     reuse_callback: Optional[ReuseCallback],
-) -> tuple[int, Optional[Path]]:
+) -> tuple[int, Optional[Path], Optional[str]]:
     """
     장면 하나의 이미지를 생성한다.
     1. 스타일 앵커 적용
     2. 캐시에서 유사 이미지 검색
     3. 유사 이미지 있으면 reuse_callback 호출
-    4. 재사용 거부 or 캐시 없음 → 엔진으로 생성 후 캐시 저장
+    4. 재사용 거부 or 캐시 없음 → 엔진으로 생성 (existing에 파일이 있으면 그대로 사용)
+
+    반환: (scene_id, 이미지 경로, 캐시에 저장할 프롬프트)
+          프롬프트는 새로 생성한 경우에만 채워지며, 캐시 저장은 호출 측이 한다.
+    """
+    scene_id, prompt, reused = _lookup_cache(scene, reuse_callback)
+    if reused is not None:
+        return scene_id, reused, None
+
+    # 새 이미지 생성
+    path = _call_engine(prompt, scene_id, output_dir, existing, cost_tracker)
+    return scene_id, path, prompt if path else None
+
+
+async def _generate_one_async(
+    scene: dict,
+    output_dir: Path,
+    existing: set[str],
+    cost_tracker: Optional[CostTracker],
+    reuse_callback: Optional[ReuseCallback],
+    client,
+    sem: asyncio.Semaphore,
+) -> tuple[int, Optional[Path], Optional[str]]:
+    """_generate_one()의 DALL-E 3 비동기 버전. 반환 형식은 동일."""
+    # 캐시 검색·재사용 콜백은 블로킹(GUI 대기 포함)이므로 스레드에서 실행
+    scene_id, prompt, reused = await asyncio.to_thread(_lookup_cache, scene, reuse_callback)
+    if reused is not None:
+        return scene_id, reused, None
+
+    existing_path = _existing_path(output_dir, scene_id, existing)
+    if existing_path is not None:
+        return scene_id, existing_path, prompt
+
+    async with sem:
+        path = await dalle_generator.generate_image_async(
+            prompt, scene_id, output_dir, client, cost_tracker, skip_existence_check=True,
+        )
+    return scene_id, path, prompt if path else None
+
+
+def _lookup_cache(
+    scene: dict,
+    reuse_callback: Optional[ReuseCallback],
+) -> tuple[int, str, Optional[Path]]:
+    """
+    스타일 앵커를 적용하고 캐시에서 유사 이미지를 찾는다.
+    반환: (scene_id, 앵커 적용 프롬프트, 재사용할 이미지 경로 또는 None)
     """
     scene_id: int = scene["scene_id"]
     raw_prompt: str = scene.get("image_prompt", "")
@@ -115,67 +172,105 @@ def _generate_one(
         )
         if reuse_callback(scene_id, prompt, best["image_path"]):
             logger.info("scene %d — 캐시 이미지 재사용", scene_id)
-            return scene_id, Path(best["image_path"])
+            return scene_id, prompt, Path(best["image_path"])
+
+    return scene_id, prompt, None
 
-    # 새 이미지 생성
-    path = _call_engine(prompt, scene_id, output_dir, cost_tracker)
-    if path:
-        cache_matcher.save(prompt, path)
 
-    return scene_id, path
+def _existing_path(output_dir: Path, scene_id: int, existing: set[str]) -> Optional[Path]:
+    """generate_all 시작 시 이미 있던 장면 파일이면 그 경로를 반환한다 (체크포인트 재시작 시)."""
+    fname = f"scene_{scene_id:04d}.png"
+    if fname in existing:
+        logger.debug("scene %d 이미지 파일 이미 존재 — 건너뜀", scene_id)
+        return output_dir / "scenes" / fname
+    return None
 
 
 def _call_engine(
     prompt: str,
     scene_id: int,
     output_dir: Path,
+    existing: set[str],
     cost_tracker: Optional[CostTracker],
 ) -> Optional[Path]:
     """선택된 엔진으로 이미지를 생성한다."""
+    existing_path = _existing_path(output_dir, scene_id, existing)
+    if existing_path is not None:
+        return existing_path
+
     if config.IMAGE_ENGINE == "dalle3":
-        return dalle_generator.generate_image(prompt, scene_id, output_dir, cost_tracker)
+        return dalle_generator.generate_image(
+            prompt, scene_id, output_dir, cost_tracker, skip_existence_check=True,
+        )
     else:
-        return sd_generator.generate_image(prompt, scene_id, output_dir)
+        return sd_generator.generate_image(prompt, scene_id, output_dir, skip_existence_check=True)
 
 
 def _process_parallel(
     batch: list,
     output_dir: Path,
+    existing: set[str],
     cost_tracker: Optional[CostTracker],
     reuse_callback: Optional[ReuseCallback],
 ) -> dict[int, Path]:
-    """ThreadPoolExecutor로 배치 내 병렬 처리 (DALL-E 3 전용)."""
+    """asyncio로 배치 내 동시 처리 (DALL-E 3 전용). 캐시 저장은 배치 끝에 한 번에."""
     result: dict[int, Path] = {}
-    workers = min(_DALLE_MAX_WORKERS, len(batch))
-
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        futures = {
-            executor.submit(_generate_one, scene, output_dir, cost_tracker, reuse_callback): scene["scene_id"]
-            for scene in batch
-        }
-        for future in as_completed(futures):
-            sid = futures[future]
-            try:
-                scene_id, path = future.result()
-                if path:
-                    result[scene_id] = path
-                else:
-                    logger.warning("scene %d 이미지 생성 실패", sid)
-            except Exception as e:
-                logger.error("scene %d 처리 중 예외: %s", sid, e)
+    to_cache: list[tuple[str, str, Optional[int], str]] = []
+
+    outcomes = asyncio.run(
+        _gather_async(batch, output_dir, existing, cost_tracker, reuse_callback)
+    )
+    for scene, outcome in zip(batch, outcomes):
+        sid = scene["scene_id"]
+        if isinstance(outcome, BaseException):
+            logger.error("scene %d 처리 중 예외: %s", sid, outcome)
+            continue
+        scene_id, path, cache_prompt = outcome
+        if path:
+            result[scene_id] = path
+            if cache_prompt:
+                to_cache.append((cache_prompt, str(path), None, ""))
+        else:
+            logger.warning("scene %d 이미지 생성 실패", sid)
 
+    image_db.bulk_save_with_history(to_cache)
     return result
 
 
+async def _gather_async(
+    batch: list,
+    output_dir: Path,
+    existing: set[str],
+    cost_tracker: Optional[CostTracker],
+    reuse_callback: Optional[ReuseCallback],
+) -> list:
+    """배치 전체를 하나의 AsyncOpenAI 클라이언트로 동시 요청한다. 예외는 결과로 반환."""
+    sem = asyncio.Semaphore(_DALLE_MAX_WORKERS)
+    # 비동기 연결 풀은 이벤트 루프에 묶이므로 이번 배치(asyncio.run 한 번) 동안만 쓰고 닫는다
+    async with openai_client.new_async_client() as client:
+        return await asyncio.gather(
+            *(
+                _generate_one_async(
+                    scene, output_dir, existing, cost_tracker, reuse_callback, client, sem,
+                )
+                for scene in batch
+            ),
+            return_exceptions=True,
+        )
+
+
 def _process_sequential(
     batch: list,
     output_dir: Path,
+    existing: set[str],
     reuse_callback: Optional[ReuseCallback],
 ) -> dict[int, Path]:
     """순차 처리 (Stable Diffusion 전용 — 로컬 GPU는 병렬 무의미)."""
     result: dict[int, Path] = {}
     for scene in batch:
-        scene_id, path = _generate_one(scene, output_dir, None, reuse_callback)
+        scene_id, path, cache_prompt = _generate_one(scene, output_dir, existing, None, reuse_callback)
+        if cache_prompt:
+            cache_matcher.save(cache_prompt, path)
         if path:
             result[scene_id] = path
         else:
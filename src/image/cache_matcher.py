@@ -5,27 +5,60 @@ SQLite image_cache.db에 생성된 이미지 이력을 저장하고,
 새 image_prompt와 기존 이력을 비교해 유사도 임계값 이상인 이미지를 반환한다.
 
 유사도 계산: Jaccard similarity (단어 집합 교집합 / 합집합)
-- 외부 라이브러리 없이 동작
 - 2글자 이하 단어, 콤마/마침표 등은 토큰화 시 제거
+- 캐시 프롬프트는 토큰 id 배열(CSR 형식) 인덱스로 메모리에 유지하고,
+  NumPy 집합 포함 연산(np.isin)으로 전체 행의 유사도를 한 번에 계산한다
+- Cython으로 빌드된 스캔(image/_scan.pyx)이 있으면 그것을, 없고 numba가 설치돼 있으면
+  JIT 컴파일된 스캔(image/_scan_numba.py)을 우선 사용
 """
 
+import atexit
 import logging
+import math
+import os
+import queue
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import ContextManager, Iterable, Optional
+
+import numpy as np
 
 import config
+from core import db
+
+# 유사도 스캔 커널: Cython 빌드(image/_scan.pyx) → numba JIT → NumPy 순으로 사용
+try:
+    from image._scan import jaccard_scan as _compiled_scan
+except ImportError:
+    try:
+        from image._scan_numba import jaccard_scan as _compiled_scan
+    except ImportError:
+        _compiled_scan = None
 
 logger = logging.getLogger(__name__)
 
 _DB_PATH = config.IMAGE_CACHE_DB_PATH
+# 캐시 DB 전용 PRAGMA (history/image_db.py도 같은 값으로 연결을 공유)
+# page_size는 새 DB 파일에만 적용된다 (기존 WAL DB는 VACUUM으로도 바뀌지 않음)
+DB_PRAGMAS: dict[str, object] = {
+    "page_size": 8192,
+    "cache_size": -131072,        # 128MB
+    "mmap_size": 268435456,       # 256MB — 순차 SELECT를 read 시스템 콜 없이 처리
+}
+_DB = db.shared(_DB_PATH, **DB_PRAGMAS)
+# file_sizes(): 이 수 이상의 경로를 여러 디렉토리에서 확인할 때만 스레드 풀 사용
+_PARALLEL_SCAN_MIN_PATHS = 64
+_SCAN_MAX_WORKERS = 32
+# save() 쓰기 지연(write-behind): 한 트랜잭션에 모아 쓰는 최대 행 수
+_WRITE_BATCH = 64
 _STOP_CHARS = str.maketrans("", "", ".,;:()[]\"'")
 
 
-def _get_conn() -> sqlite3.Connection:
-    conn = sqlite3.connect(_DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+def _get_conn() -> ContextManager[sqlite3.Connection]:
+    """공유 연결을 빌려준다. with 블록 하나가 트랜잭션 하나."""
+    return _DB.transaction()
 
 
 def _init_db() -> None:
@@ -43,9 +76,32 @@ def _init_db() -> None:
             "CREATE INDEX IF NOT EXISTS idx_created ON image_cache(created_at)"
         )
 
+        # 토큰화 결과 캐시 컬럼 (조회 때마다 프롬프트를 다시 토큰화하지 않도록)
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(image_cache)")}
+        if "prompt_tokens" not in columns:
+            conn.execute("ALTER TABLE image_cache ADD COLUMN prompt_tokens TEXT")
+        rows = conn.execute(
+            "SELECT id, prompt FROM image_cache WHERE prompt_tokens IS NULL"
+        ).fetchall()
+        if rows:
+            conn.executemany(
+                "UPDATE image_cache SET prompt_tokens = ? WHERE id = ?",
+                [(prompt_tokens(r["prompt"]), r["id"]) for r in rows],
+            )
+            logger.info("캐시 토큰 컬럼 채움: %d개 항목", len(rows))
 
-# 모듈 로드 시 DB 초기화
-_init_db()
+        # 파일 크기 컬럼 (디스크 사용량을 파일 순회 없이 SUM으로 계산)
+        if "size_bytes" not in columns:
+            conn.execute("ALTER TABLE image_cache ADD COLUMN size_bytes INTEGER")
+        rows = conn.execute(
+            "SELECT id, image_path FROM image_cache WHERE size_bytes IS NULL"
+        ).fetchall()
+        if rows:
+            sizes = file_sizes(r["image_path"] for r in rows)
+            conn.executemany(
+                "UPDATE image_cache SET size_bytes = ? WHERE id = ?",
+                [(sizes.get(r["image_path"], 0), r["id"]) for r in rows],
+            )
 
 
 # ─────────────────────────────────────────────
@@ -53,13 +109,18 @@ _init_db()
 # ─────────────────────────────────────────────
 
 def save(prompt: str, image_path: str | Path) -> None:
-    """생성된 이미지 정보를 캐시 DB에 저장한다."""
-    with _get_conn() as conn:
-        conn.execute(
-            "INSERT INTO image_cache (prompt, image_path) VALUES (?, ?)",
-            (prompt.strip(), str(image_path)),
-        )
-    logger.debug("이미지 캐시 저장: %s", image_path)
+    """
+    생성된 이미지 정보를 캐시 DB에 저장한다.
+    호출 스레드는 큐에 넣고 바로 반환하며, 백그라운드 writer 스레드가
+    쌓인 항목을 최대 _WRITE_BATCH개씩 한 트랜잭션으로 기록한다.
+    기록 완료를 기다려야 하면 flush()를 호출한다.
+    """
+    _writer.put(prompt, str(image_path))
+
+
+def flush() -> None:
+    """save()로 대기 중인 항목이 모두 DB에 기록될 때까지 기다린다."""
+    _writer.flush()
 
 
 def find_similar(
@@ -80,32 +141,30 @@ def find_similar(
         similarity 내림차순 정렬
     """
     threshold = threshold if threshold is not None else config.IMAGE_SIMILARITY_THRESHOLD
-    prompt_words = _tokenize(prompt)
-
-    with _get_conn() as conn:
-        rows = conn.execute(
-            "SELECT prompt, image_path FROM image_cache ORDER BY created_at DESC"
-        ).fetchall()
-
-    if not rows:
+    flush()   # 직전에 save()한 이미지도 검색 대상에 포함 (대기 항목이 없으면 즉시 반환)
+    snap = _index.refresh()
+    if not snap.ids.size:
         return []
 
+    sims = snap.similarities(_tokenize(prompt), threshold)
+    candidates = np.flatnonzero(sims >= threshold)
+    # 유사도 내림차순, 동률이면 최신(id 큰 것) 우선
+    candidates = candidates[np.lexsort((-snap.ids[candidates], -sims[candidates]))]
+
+    # 파일 존재 확인은 임계값을 넘은 후보에 대해서만 (디렉토리별 scandir 1회)
+    existing = file_sizes(snap.paths[i] for i in candidates)
     results: list[dict] = []
-    for row in rows:
-        cached_path = row["image_path"]
-        if not Path(cached_path).exists():
+    for i in candidates:
+        cached_path = snap.paths[i]
+        if cached_path not in existing:
             continue
-
-        similarity = _jaccard(prompt_words, _tokenize(row["prompt"]))
-        if similarity >= threshold:
-            results.append({
-                "similarity": similarity,
-                "image_path": cached_path,
-                "prompt": row["prompt"],
-            })
-
-    results.sort(key=lambda x: x["similarity"], reverse=True)
-    results = results[:limit]
+        results.append({
+            "similarity": float(sims[i]),
+            "image_path": cached_path,
+            "prompt": snap.prompts[i],
+        })
+        if len(results) >= limit:
+            break
 
     if results:
         logger.info(
@@ -120,7 +179,8 @@ def clear_missing() -> int:
     with _get_conn() as conn:
         rows = conn.execute("SELECT id, image_path FROM image_cache").fetchall()
 
-    missing_ids = [row["id"] for row in rows if not Path(row["image_path"]).exists()]
+    existing = file_sizes(row["image_path"] for row in rows)
+    missing_ids = [row["id"] for row in rows if row["image_path"] not in existing]
     if not missing_ids:
         return 0
 
@@ -129,23 +189,262 @@ def clear_missing() -> int:
             f"DELETE FROM image_cache WHERE id IN ({','.join('?' * len(missing_ids))})",
             missing_ids,
         )
+    invalidate_index()
     logger.info("캐시 정리: %d개 항목 삭제", len(missing_ids))
     return len(missing_ids)
 
 
+def file_sizes(paths: Iterable[str]) -> dict[str, int]:
+    """
+    존재하는 파일의 {경로: 크기(bytes)}를 반환한다. 없는 파일은 포함되지 않는다.
+    경로마다 stat()하지 않고 상위 디렉토리별로 os.scandir()을 한 번씩 호출한다.
+    경로가 많고 디렉토리가 여러 개면 디렉토리 스캔을 스레드 풀로 병렬 실행한다
+    (파일 시스템 호출은 GIL을 놓으므로 NFS/HDD 지연이 겹쳐진다).
+    """
+    by_dir: dict[str, list[str]] = {}
+    n_paths = 0
+    for p in paths:
+        by_dir.setdefault(os.path.dirname(p), []).append(p)
+        n_paths += 1
+
+    parents = list(by_dir)
+    if n_paths >= _PARALLEL_SCAN_MIN_PATHS and len(parents) > 1:
+        workers = min(_SCAN_MAX_WORKERS, len(parents))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            scanned = list(executor.map(_scan_dir, parents))
+    else:
+        scanned = [_scan_dir(parent) for parent in parents]
+
+    sizes: dict[str, int] = {}
+    for parent, entries in zip(parents, scanned):
+        if entries is None:
+            continue
+        for p in by_dir[parent]:
+            size = entries.get(os.path.normcase(os.path.basename(p)))
+            if size is not None:
+                sizes[p] = size
+    return sizes
+
+
+def _scan_dir(parent: str) -> Optional[dict[str, int]]:
+    """디렉토리의 {정규화된 파일명: 크기}. 디렉토리를 읽을 수 없으면 None."""
+    try:
+        with os.scandir(parent or ".") as it:
+            return {
+                os.path.normcase(e.name): e.stat().st_size
+                for e in it if e.is_file()
+            }
+    except OSError:
+        return None
+
+
+def file_size(path: str | Path) -> int:
+    """image_cache.size_bytes에 저장할 파일 크기. 파일이 없으면 0."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+def prompt_tokens(prompt: str) -> str:
+    """image_cache.prompt_tokens 컬럼에 저장할 형태(정렬된 토큰, 공백 구분)로 변환한다."""
+    return " ".join(sorted(_tokenize(prompt)))
+
+
+def invalidate_index() -> None:
+    """
+    메모리 토큰 인덱스를 버린다. 다음 find_similar에서 DB로부터 다시 만든다.
+    image_cache 행을 삭제한 뒤 호출한다. (추가는 id 기준으로 자동 반영)
+    """
+    _index.reset()
+
+
 # ─────────────────────────────────────────────
 # 내부 헬퍼
 # ─────────────────────────────────────────────
 
 def _tokenize(text: str) -> frozenset[str]:
     """텍스트를 소문자 단어 집합으로 변환한다. 2글자 이하 단어는 제거."""
-    cleaned = text.translate(_STOP_CHARS)
-    return frozenset(w.lower() for w in cleaned.split() if len(w) > 2)
+    # 단어별 lower() 대신 문자열 전체를 한 번에 변환 (C 레벨 연속 처리)
+    return frozenset([w for w in text.translate(_STOP_CHARS).lower().split() if len(w) > 2])
+
+
+class _CacheWriter:
+    """
+    save() 쓰기 지연 큐. 첫 put() 때 데몬 스레드를 띄우고,
+    큐에 쌓인 항목을 한꺼번에 꺼내 INSERT 한 번의 트랜잭션으로 기록한다.
+    """
+
+    def __init__(self) -> None:
+        self._queue: queue.Queue[tuple[str, str]] = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def put(self, prompt: str, image_path: str) -> None:
+        self._queue.put((prompt, image_path))
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="image-cache-writer", daemon=True,
+                    )
+                    self._thread.start()
+
+    def flush(self) -> None:
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < _WRITE_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write(batch)
+            except Exception as e:
+                logger.error("이미지 캐시 저장 실패 (%d건): %s", len(batch), e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    @staticmethod
+    def _write(batch: list[tuple[str, str]]) -> None:
+        rows = [
+            (prompt.strip(), image_path, prompt_tokens(prompt), file_size(image_path))
+            for prompt, image_path in batch
+        ]
+        with _get_conn() as conn:
+            conn.executemany(
+                """INSERT INTO image_cache (prompt, image_path, prompt_tokens, size_bytes)
+                   VALUES (?, ?, ?, ?)""",
+                rows,
+            )
+        logger.debug("이미지 캐시 저장: %d건", len(rows))
+
+
+_writer = _CacheWriter()
+atexit.register(flush)
+
 
+class _Snapshot:
+    """
+    토큰 인덱스의 불변 스냅샷.
+    행 i의 토큰 id는 data[offsets[i]:offsets[i + 1]] (CSR 형식, 행 내 오름차순).
+    """
+
+    def __init__(
+        self,
+        vocab: dict[str, int],
+        ids: np.ndarray,
+        offsets: np.ndarray,
+        data: np.ndarray,
+        prompts: list[str],
+        paths: list[str],
+    ) -> None:
+        self.vocab = vocab
+        self.ids = ids
+        self.offsets = offsets
+        self.data = data
+        self.lengths = np.diff(offsets)
+        self.prompts = prompts
+        self.paths = paths
+
+    def similarities(self, query: frozenset[str], threshold: float = 0.0) -> np.ndarray:
+        """
+        query와 모든 행의 Jaccard 유사도 배열을 반환한다.
+        Jaccard(A, B) <= min(|A|, |B|) / max(|A|, |B|) 이므로 토큰 수 비율만으로
+        threshold에 못 미치는 행은 교집합을 세지 않고 0으로 둔다.
+        """
+        q_len = len(query)
+        q_ids = np.fromiter(
+            sorted(self.vocab[t] for t in query if t in self.vocab), dtype=np.int32,
+        )
+        min_len, max_len = _length_bounds(q_len, threshold)
+        if _compiled_scan is not None:
+            return _compiled_scan(q_ids, q_len, self.offsets, self.data, min_len, max_len)
+
+        in_range = (self.lengths >= min_len) & (self.lengths <= max_len)
+        hits = np.zeros(self.data.size, dtype=bool)
+        if not in_range.all():
+            elem_mask = np.repeat(in_range, self.lengths)
+            hits[elem_mask] = np.isin(self.data[elem_mask], q_ids)
+        else:
+            hits = np.isin(self.data, q_ids)
+        csum = np.concatenate(([0], np.cumsum(hits, dtype=np.int64)))
+        inter = csum[self.offsets[1:]] - csum[self.offsets[:-1]]
+        union = len(query) + self.lengths - inter
+        sims = np.zeros(self.ids.size, dtype=np.float64)
+        valid = in_range & (self.lengths > 0) & (union > 0) & bool(query)
+        np.divide(inter, union, out=sims, where=valid)
+        return sims
+
+
+def _length_bounds(q_len: int, threshold: float) -> tuple[int, int]:
+    """threshold 이상이 될 수 있는 행 토큰 수 범위 [min_len, max_len]."""
+    if threshold <= 0.0:
+        return 0, np.iinfo(np.int64).max
+    eps = 1e-9
+    return math.ceil(q_len * threshold - eps), math.floor(q_len / threshold + eps)
+
+
+class _TokenIndex:
+    """
+    image_cache 전체 프롬프트의 토큰 인덱스.
+    refresh()가 마지막으로 읽은 id 이후의 행만 DB에서 가져와 덧붙인다.
+    """
 
-def _jaccard(a: frozenset[str], b: frozenset[str]) -> float:
-    """두 단어 집합의 Jaccard 유사도를 계산한다."""
-    if not a or not b:
-        return 0.0
-    union = len(a | b)
-    return len(a & b) / union if union > 0 else 0.0
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._snapshot = _Snapshot(
+                {}, np.zeros(0, np.int64), np.zeros(1, np.int64),
+                np.zeros(0, np.int32), [], [],
+            )
+            self._last_id = 0
+
+    def refresh(self) -> _Snapshot:
+        with self._lock:
+            with _get_conn() as conn:
+                rows = conn.execute(
+                    """SELECT id, prompt, prompt_tokens, image_path FROM image_cache
+                       WHERE id > ? ORDER BY id""",
+                    (self._last_id,),
+                ).fetchall()
+            if rows:
+                self._append(rows)
+            return self._snapshot
+
+    def _append(self, rows: list[sqlite3.Row]) -> None:
+        old = self._snapshot
+        vocab = dict(old.vocab)
+        new_tokens: list[int] = []
+        new_offsets: list[int] = []
+        end = int(old.offsets[-1])
+        for row in rows:
+            stored = row["prompt_tokens"]
+            tokens = stored.split() if stored is not None else _tokenize(row["prompt"])
+            new_tokens.extend(sorted(vocab.setdefault(t, len(vocab)) for t in tokens))
+            end += len(tokens)
+            new_offsets.append(end)
+
+        self._snapshot = _Snapshot(
+            vocab,
+            np.concatenate((old.ids, np.fromiter((r["id"] for r in rows), np.int64))),
+            np.concatenate((old.offsets, np.asarray(new_offsets, np.int64))),
+            np.concatenate((old.data, np.asarray(new_tokens, np.int32))),
+            old.prompts + [r["prompt"] for r in rows],
+            old.paths + [r["image_path"] for r in rows],
+        )
+        self._last_id = rows[-1]["id"]
+
+
+_index = _TokenIndex()
+
+
+# 모듈 로드 시 DB 초기화
+_init_db()
@@ -8,19 +8,23 @@ output_dir/scenes/scene_{id:04d}.png 로 저장한다.
 크기: 1024x1024 (비용 단가와 일치 — 영상 합성 시 리사이즈)
 """
 
+import asyncio
 import base64
 import logging
+import os
 import time
 from pathlib import Path
 from typing import Optional
 
 import config
+from core import openai_client
 from core.cost_tracker import CostTracker
 
 logger = logging.getLogger(__name__)
 
 _MAX_RETRIES = 3
 _RETRY_DELAY_SEC = 5
+_B64_CHUNK = 64 * 1024   # 4의 배수 — 청크 경계에서 그대로 디코딩 가능
 
 
 def generate_image(
@@ -28,6 +32,7 @@ def generate_image(
     scene_id: int,
     output_dir: Path,
     cost_tracker: Optional[CostTracker] = None,
+    skip_existence_check: bool = False,
 ) -> Optional[Path]:
     """
     DALL-E 3로 이미지를 생성하고 PNG 파일로 저장한다.
@@ -37,34 +42,24 @@ def generate_image(
         scene_id:     저장 파일명에 사용할 장면 번호
         output_dir:   프로젝트 output 디렉토리 (output_dir/scenes/ 하위에 저장)
         cost_tracker: 비용 추적기
+        skip_existence_check: True면 scenes 디렉토리 생성·기존 파일 확인을 생략
+                              (batch_processor가 배치 단위로 미리 처리한 경우)
 
     Returns:
         저장된 이미지 Path, 실패 시 None
     """
-    from openai import OpenAI
-
-    client = OpenAI(api_key=config.OPENAI_API_KEY)
-
-    scenes_dir = output_dir / "scenes"
-    scenes_dir.mkdir(parents=True, exist_ok=True)
-    save_path = scenes_dir / f"scene_{scene_id:04d}.png"
+    save_path = _scene_path(output_dir, scene_id, skip_existence_check)
 
     # 이미 생성된 파일이 있으면 재사용 (체크포인트 재시작 시)
-    if save_path.exists():
+    if not skip_existence_check and save_path.exists():
         logger.debug("scene %d 이미지 파일 이미 존재 — 건너뜀", scene_id)
         return save_path
 
+    client = openai_client.get_client()
     for attempt in range(1, _MAX_RETRIES + 1):
         logger.debug("DALL-E 3 시도 %d/%d — scene %d", attempt, _MAX_RETRIES, scene_id)
         try:
-            response = client.images.generate(
-                model="dall-e-3",
-                prompt=prompt,
-                n=1,
-                size="1024x1024",
-                quality=config.IMAGE_QUALITY,
-                response_format="b64_json",
-            )
+            response = client.images.generate(**_request_args(prompt))
         except Exception as e:
             logger.error("DALL-E 3 API 오류 (scene %d, 시도 %d): %s", scene_id, attempt, e)
             if attempt < _MAX_RETRIES:
@@ -72,20 +67,102 @@ def generate_image(
                 continue
             return None
 
+        return _save_response(response, save_path, scene_id, cost_tracker)
+
+    return None
+
+
+async def generate_image_async(
+    prompt: str,
+    scene_id: int,
+    output_dir: Path,
+    client,
+    cost_tracker: Optional[CostTracker] = None,
+    skip_existence_check: bool = False,
+) -> Optional[Path]:
+    """
+    generate_image()의 비동기 버전. client는 openai_client.new_async_client()로 만든 AsyncOpenAI.
+    동시 요청 수 제한은 호출 측(세마포어)이 담당한다.
+    """
+    save_path = _scene_path(output_dir, scene_id, skip_existence_check)
+
+    if not skip_existence_check and save_path.exists():
+        logger.debug("scene %d 이미지 파일 이미 존재 — 건너뜀", scene_id)
+        return save_path
+
+    for attempt in range(1, _MAX_RETRIES + 1):
+        logger.debug("DALL-E 3 시도 %d/%d — scene %d", attempt, _MAX_RETRIES, scene_id)
         try:
-            b64_data = response.data[0].b64_json
-            if not b64_data:
-                raise ValueError("b64_json 응답이 비어 있음")
-            img_bytes = base64.b64decode(b64_data)
-            save_path.write_bytes(img_bytes)
+            response = await client.images.generate(**_request_args(prompt))
         except Exception as e:
-            logger.error("이미지 저장 실패 (scene %d): %s", scene_id, e)
+            logger.error("DALL-E 3 API 오류 (scene %d, 시도 %d): %s", scene_id, attempt, e)
+            if attempt < _MAX_RETRIES:
+                await asyncio.sleep(_RETRY_DELAY_SEC * attempt)
+                continue
             return None
 
-        if cost_tracker:
-            cost_tracker.add_dalle3(count=1)
-
-        logger.info("DALL-E 3 완료: scene %d → %s", scene_id, save_path.name)
-        return save_path
+        return _save_response(response, save_path, scene_id, cost_tracker)
 
     return None
+
+
+# ─────────────────────────────────────────────
+# 내부 유틸
+# ─────────────────────────────────────────────
+
+def _scene_path(output_dir: Path, scene_id: int, prepared: bool = False) -> Path:
+    scenes_dir = output_dir / "scenes"
+    if not prepared:
+        scenes_dir.mkdir(parents=True, exist_ok=True)
+    return scenes_dir / f"scene_{scene_id:04d}.png"
+
+
+def _request_args(prompt: str) -> dict:
+    return {
+        "model": "dall-e-3",
+        "prompt": prompt,
+        "n": 1,
+        "size": "1024x1024",
+        "quality": config.IMAGE_QUALITY,
+        "response_format": "b64_json",
+    }
+
+
+def _save_response(
+    response,
+    save_path: Path,
+    scene_id: int,
+    cost_tracker: Optional[CostTracker],
+) -> Optional[Path]:
+    """b64_json 응답을 PNG로 저장하고 비용을 기록한다."""
+    try:
+        b64_data = response.data[0].b64_json
+        if not b64_data:
+            raise ValueError("b64_json 응답이 비어 있음")
+        _write_b64(b64_data, save_path)
+    except Exception as e:
+        logger.error("이미지 저장 실패 (scene %d): %s", scene_id, e)
+        return None
+
+    if cost_tracker:
+        cost_tracker.add_dalle3(count=1)
+
+    logger.info("DALL-E 3 완료: scene %d → %s", scene_id, save_path.name)
+    return save_path
+
+
+def _write_b64(b64_data: str, save_path: Path) -> None:
+    """
+    base64 문자열을 청크 단위로 디코딩해 파일에 쓴다.
+    이미지 전체 bytes 사본을 만들지 않고, 임시 파일에 쓴 뒤 교체해
+    중단 시 반쪽 파일이 '이미 존재'로 재사용되지 않게 한다.
+    """
+    tmp_path = save_path.with_suffix(".tmp")
+    try:
+        with open(tmp_path, "wb") as fh:
+            for i in range(0, len(b64_data), _B64_CHUNK):
+                fh.write(base64.b64decode(b64_data[i:i + _B64_CHUNK]))
+        os.replace(tmp_path, save_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
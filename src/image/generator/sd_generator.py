@@ -14,6 +14,9 @@ import time
 from pathlib import Path
 from typing import Optional
 
+import requests
+from requests.adapters import HTTPAdapter
+
 import config
 
 logger = logging.getLogger(__name__)
@@ -38,10 +41,23 @@ _SD_PAYLOAD_DEFAULTS: dict = {
 }
 
 
+def _build_session() -> requests.Session:
+    """SD 서버용 keep-alive 세션을 생성한다. 장면마다 TCP 연결을 새로 맺지 않는다."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _build_session()
+
+
 def generate_image(
     prompt: str,
     scene_id: int,
     output_dir: Path,
+    skip_existence_check: bool = False,
 ) -> Optional[Path]:
     """
     Stable Diffusion WebUI API로 이미지를 생성하고 PNG로 저장한다.
@@ -50,17 +66,18 @@ def generate_image(
         prompt:     스타일 앵커가 적용된 이미지 프롬프트 (영어)
         scene_id:   저장 파일명에 사용할 장면 번호
         output_dir: 프로젝트 output 디렉토리 (output_dir/scenes/ 하위에 저장)
+        skip_existence_check: True면 scenes 디렉토리 생성·기존 파일 확인을 생략
+                              (batch_processor가 배치 단위로 미리 처리한 경우)
 
     Returns:
         저장된 이미지 Path, 실패 시 None
     """
-    import requests
-
     scenes_dir = output_dir / "scenes"
-    scenes_dir.mkdir(parents=True, exist_ok=True)
     save_path = scenes_dir / f"scene_{scene_id:04d}.png"
+    if not skip_existence_check:
+        scenes_dir.mkdir(parents=True, exist_ok=True)
 
-    if save_path.exists():
+    if not skip_existence_check and save_path.exists():
         logger.debug("scene %d 이미지 파일 이미 존재 — 건너뜀", scene_id)
         return save_path
 
@@ -70,7 +87,7 @@ def generate_image(
     for attempt in range(1, _MAX_RETRIES + 1):
         logger.debug("SD 시도 %d/%d — scene %d", attempt, _MAX_RETRIES, scene_id)
         try:
-            resp = requests.post(url, json=payload, timeout=120)
+            resp = _SESSION.post(url, json=payload, timeout=120)
             resp.raise_for_status()
         except Exception as e:
             logger.error("SD API 오류 (scene %d, 시도 %d): %s", scene_id, attempt, e)
@@ -95,9 +112,8 @@ def generate_image(
 
 def check_server() -> bool:
     """SD WebUI 서버가 응답 가능한지 확인한다. 파이프라인 시작 전 호출."""
-    import requests
     try:
-        resp = requests.get(
+        resp = _SESSION.get(
             f"{config.SD_API_URL.rstrip('/')}/sdapi/v1/options",
             timeout=5,
         )
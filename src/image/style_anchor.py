@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Optional
 
 import config
+from prompts._loader import read_cached
 
 logger = logging.getLogger(__name__)
 
@@ -20,24 +21,27 @@ _PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
 _ANCHOR_FILE = _PROMPTS_DIR / "image_style_anchor.txt"
 
 _cached_anchor: Optional[str] = None
+_cached_anchor_first_kw_lower: Optional[str] = None   # _cached_anchor와 함께 갱신
 
 
 def get_style_anchor() -> str:
     """현재 설정된 스타일 앵커 문자열을 반환한다."""
-    global _cached_anchor
+    global _cached_anchor, _cached_anchor_first_kw_lower
 
     # 사용자가 설정 탭에서 스타일을 직접 변경한 경우 우선 적용
     if config.IMAGE_STYLE and config.IMAGE_STYLE != config.IMAGE_STYLE_DEFAULT:
         return config.IMAGE_STYLE
 
-    # 파일 캐싱: 첫 호출 시에만 파일을 읽는다
-    if _cached_anchor is None:
-        if _ANCHOR_FILE.exists():
-            _cached_anchor = _ANCHOR_FILE.read_text(encoding="utf-8").strip()
-            logger.debug("스타일 앵커 파일 로드: %d자", len(_cached_anchor))
+    # 파일 캐싱: mtime이 바뀐 경우에만 다시 읽는다 (실행 중 편집 반영)
+    text = read_cached(_ANCHOR_FILE)
+    anchor = text.strip() if text is not None else config.IMAGE_STYLE_DEFAULT
+    if anchor != _cached_anchor:
+        if text is not None:
+            logger.debug("스타일 앵커 파일 로드: %d자", len(anchor))
         else:
-            _cached_anchor = config.IMAGE_STYLE_DEFAULT
             logger.warning("image_style_anchor.txt 없음 — config 기본값 사용")
+        _cached_anchor = anchor
+        _cached_anchor_first_kw_lower = _first_keyword(anchor)
 
     return _cached_anchor
 
@@ -55,6 +59,11 @@ def apply(prompt: str, style: Optional[str] = None) -> str:
         스타일 앵커가 적용된 프롬프트 문자열
     """
     anchor = style if style is not None else get_style_anchor()
+    # 파일 앵커면 미리 소문자로 만들어 둔 첫 키워드를 재사용
+    if anchor is _cached_anchor and _cached_anchor_first_kw_lower is not None:
+        first_keyword = _cached_anchor_first_kw_lower
+    else:
+        first_keyword = _first_keyword(anchor)
     prompt = prompt.strip()
 
     if not prompt:
@@ -62,7 +71,6 @@ def apply(prompt: str, style: Optional[str] = None) -> str:
         return anchor
 
     # 앵커 첫 키워드 중복 방지 (대소문자 무시)
-    first_keyword = anchor.split(",")[0].strip().lower()
     if first_keyword in prompt.lower():
         logger.debug("스타일 앵커 이미 포함됨 — 추가 스킵")
         return prompt
@@ -73,6 +81,12 @@ def apply(prompt: str, style: Optional[str] = None) -> str:
 
 def invalidate_cache() -> None:
     """스타일 앵커 캐시를 초기화한다. 설정 탭에서 스타일 변경 후 호출."""
-    global _cached_anchor
+    global _cached_anchor, _cached_anchor_first_kw_lower
     _cached_anchor = None
+    _cached_anchor_first_kw_lower = None
     logger.debug("스타일 앵커 캐시 초기화")
+
+
+def _first_keyword(anchor: str) -> str:
+    """앵커의 첫 번째 키워드(콤마 구분)를 소문자로 반환한다."""
+    return anchor.split(",")[0].strip().lower()
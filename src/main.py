@@ -7,6 +7,7 @@ GUI 모드: python main.py  (인자 없이 실행 시 GUI 실행)
 import sys
 import argparse
 import logging
+import multiprocessing
 from pathlib import Path
 
 # 패키지 루트를 sys.path에 추가 (PyInstaller 빌드 호환)
@@ -68,4 +69,5 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()   # PyInstaller 빌드에서 영상 합성 워커 프로세스 지원
     main()
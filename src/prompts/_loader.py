@@ -0,0 +1,55 @@
+"""
+prompts/_loader.py — 프롬프트 파일 읽기 (mtime 캐시)
+
+시스템 프롬프트/스타일 앵커 파일은 호출마다 읽히지만 거의 바뀌지 않는다.
+(경로, st_mtime_ns, st_size)가 같으면 캐시된 문자열을 반환하고,
+파일이 수정되면 다음 호출에서 다시 읽는다. 적중 시 비용은 stat 1회.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+_cache: dict[Path, tuple[int, int, str]] = {}
+_lock = threading.Lock()
+
+
+def read_cached(path: Path) -> Optional[str]:
+    """
+    UTF-8 텍스트 파일 내용을 반환한다. 파일이 없으면 None.
+    줄바꿈은 Path.read_text()와 같이 '\\n'으로 통일한다.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+
+    hit = _cache.get(path)
+    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return hit[2]
+
+    try:
+        data = _read_all(path, st.st_size)
+    except OSError:
+        return None
+    text = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+    with _lock:
+        _cache[path] = (st.st_mtime_ns, st.st_size, text)
+    return text
+
+
+def _read_all(path: Path, size_hint: int) -> bytes:
+    """버퍼드 IO 계층 없이 os.open/os.read로 파일 전체를 읽는다."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        chunks: list[bytes] = []
+        while True:
+            chunk = os.read(fd, max(size_hint, 4096))
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
@@ -5,17 +5,21 @@ page_text를 입력받아 Scene JSON 배열과 YouTube 제목을 생성한다.
 검증 실패(장면 수 부족 / 평균 duration 과다) 시 최대 MAX_RETRIES회 재생성한다.
 """
 
-import json
 import logging
 from pathlib import Path
 from typing import Optional
 
 import config
+from core import fast_json, llm_cache, openai_client
 from core.cost_tracker import CostTracker
+from prompts._loader import read_cached
 
 logger = logging.getLogger(__name__)
 
 MAX_RETRIES = 3
+_MAX_OUTPUT_TOKENS = 12000
+_CONTEXT_TOKENS = 128_000        # gpt-4o 컨텍스트 한도
+_PROMPT_MARGIN_TOKENS = 1000     # 메시지 포맷/포커스/재시도 문제점 문구 여유분
 _PROMPTS_DIR = Path(__file__).parent.parent.parent / "prompts"
 
 _VALID_STAGES = frozenset({"hook", "problem", "core", "twist", "cta"})
@@ -37,10 +41,15 @@ def generate_scenario(
     Returns:
         {"scenes": [...], "title_ko": "..."}
     """
-    from openai import OpenAI
-
-    client = OpenAI(api_key=config.OPENAI_API_KEY)
+    client = openai_client.get_client()
     system_prompt = _load_system_prompt()
+    page_text = _fit_page_text(page_text, system_prompt)
+
+    cache_key = llm_cache.make_key("scenario", "gpt-4o", system_prompt, focus, page_text)
+    cached = llm_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     user_prompt = _build_user_prompt(page_text, focus)
     last_result: Optional[dict] = None
 
@@ -56,7 +65,7 @@ def generate_scenario(
                 ],
                 response_format={"type": "json_object"},
                 temperature=0.8,
-                max_tokens=12000,
+                max_tokens=_MAX_OUTPUT_TOKENS,
             )
         except Exception as e:
             logger.error("OpenAI API 호출 실패 (시도 %d): %s", attempt, e)
@@ -78,6 +87,7 @@ def generate_scenario(
         issues = _check_scene_issues(result.get("scenes", []))
         if not issues:
             logger.info("시나리오 생성 성공: %d장면", len(result["scenes"]))
+            llm_cache.put(cache_key, result)
             return result
 
         logger.warning("검증 실패 (시도 %d): %s", attempt, " / ".join(issues))
@@ -100,13 +110,40 @@ def generate_scenario(
 # ─────────────────────────────────────────────
 
 def _load_system_prompt() -> str:
-    path = _PROMPTS_DIR / "scenario_system.txt"
-    if path.exists():
-        return path.read_text(encoding="utf-8")
+    text = read_cached(_PROMPTS_DIR / "scenario_system.txt")
+    if text is not None:
+        return text
     logger.warning("scenario_system.txt 없음 — 인라인 기본 프롬프트 사용")
     return _INLINE_SYSTEM_PROMPT
 
 
+def _estimate_tokens(text: str) -> int:
+    """
+    토크나이저 없이 토큰 수를 보수적으로 추정한다.
+    ASCII는 약 4자당 1토큰, 한글 등 비ASCII는 1자당 1토큰으로 본다. (C 수준 연산만 사용)
+    """
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return (len(text) - ascii_chars) + ascii_chars // 4
+
+
+def _fit_page_text(page_text: str, system_prompt: str) -> str:
+    """
+    본문이 컨텍스트 한도를 넘을 것으로 추정되면 호출 전에 미리 자른다.
+    한도 초과 요청은 왕복 후에야 실패하고 재시도마다 같은 실패를 반복하기 때문.
+    """
+    budget = (
+        _CONTEXT_TOKENS - _MAX_OUTPUT_TOKENS - _PROMPT_MARGIN_TOKENS
+        - _estimate_tokens(system_prompt)
+    )
+    estimated = _estimate_tokens(page_text)
+    if estimated <= budget:
+        return page_text
+
+    keep = max(0, len(page_text) * budget // estimated)
+    logger.warning("본문이 너무 김 (추정 %d토큰 > %d) — %d자로 자름", estimated, budget, keep)
+    return page_text[:keep]
+
+
 def _build_user_prompt(page_text: str, focus: str, issues: Optional[list] = None) -> str:
     parts: list[str] = []
     if focus:
@@ -120,8 +157,8 @@ def _build_user_prompt(page_text: str, focus: str, issues: Optional[list] = None
 def _parse_response(raw: str) -> Optional[dict]:
     """JSON 파싱 후 scene 필드를 정규화한다."""
     try:
-        data = json.loads(raw)
-    except json.JSONDecodeError as e:
+        data = fast_json.loads(raw)
+    except fast_json.JSONDecodeError as e:
         logger.error("JSON 디코드 오류: %s", e)
         return None
 
@@ -133,6 +170,7 @@ def _parse_response(raw: str) -> Optional[dict]:
         data["title_ko"] = "untitled"
 
     normalized = []
+    debug = logger.isEnabledFor(logging.DEBUG)   # 장면마다 로거 레벨을 확인하지 않도록 한 번만
     for i, s in enumerate(data["scenes"]):
         if not isinstance(s, dict):
             continue
@@ -151,7 +189,8 @@ def _parse_response(raw: str) -> Optional[dict]:
 
         # 유효하지 않은 stage → core 대체
         if s["stage"] not in _VALID_STAGES:
-            logger.debug("scene[%d] 비정상 stage '%s' → 'core' 대체", i, s["stage"])
+            if debug:
+                logger.debug("scene[%d] 비정상 stage '%s' → 'core' 대체", i, s["stage"])
             s["stage"] = "core"
 
         normalized.append(s)
@@ -166,7 +205,7 @@ def _check_scene_issues(scenes: list) -> list[str]:
     if len(scenes) < config.MIN_SCENES:
         issues.append(f"장면 수 부족 ({len(scenes)}개, 최소 {config.MIN_SCENES}개 필요)")
     if scenes:
-        avg_dur = sum(s.get("duration_sec", 3) for s in scenes) / len(scenes)
+        avg_dur = sum(s["duration_sec"] for s in scenes) / len(scenes)
         if avg_dur > 5.0:
             issues.append(f"장면 평균 길이 과다 ({avg_dur:.1f}초, 최대 5초)")
     return issues
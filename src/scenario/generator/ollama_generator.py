@@ -5,7 +5,6 @@ Ollama /api/chat HTTP 엔드포인트를 직접 호출한다 (ollama Python 패
 로컬 엔진이므로 비용 추적 없이 그대로 통과한다.
 """
 
-import json
 import logging
 from pathlib import Path
 from typing import Optional
@@ -13,7 +12,10 @@ from typing import Optional
 import requests
 
 import config
+from core import fast_json, llm_cache
+from core.codeblock import strip_markdown_codeblock
 from core.cost_tracker import CostTracker
+from prompts._loader import read_cached
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +44,12 @@ def generate_scenario(
         {"scenes": [...], "title_ko": "..."}
     """
     system_prompt = _load_system_prompt()
+
+    cache_key = llm_cache.make_key("scenario", config.OLLAMA_MODEL, system_prompt, focus, page_text)
+    cached = llm_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     user_prompt = _build_user_prompt(page_text, focus)
     last_result: Optional[dict] = None
 
@@ -71,6 +79,7 @@ def generate_scenario(
         issues = _check_scene_issues(result.get("scenes", []))
         if not issues:
             logger.info("시나리오 생성 성공: %d장면", len(result["scenes"]))
+            llm_cache.put(cache_key, result)
             return result
 
         logger.warning("검증 실패 (시도 %d): %s", attempt, " / ".join(issues))
@@ -95,7 +104,8 @@ def generate_scenario(
 def _call_ollama(system_prompt: str, user_prompt: str) -> str:
     """
     Ollama /api/chat 엔드포인트를 호출하고 content 문자열을 반환한다.
-    stream=False로 단일 JSON 응답을 받는다.
+    stream=True로 줄 단위 JSON 조각을 받아 누적하며, 생성이 끝나거나
+    _MAX_RESPONSE_CHARS에 도달하면 즉시 멈춘다 (폭주 출력 차단).
     format="json"은 모델이 지원하는 경우 구조화된 출력을 강제한다.
     """
     url = f"{config.OLLAMA_HOST.rstrip('/')}/api/chat"
@@ -105,7 +115,7 @@ def _call_ollama(system_prompt: str, user_prompt: str) -> str:
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
         ],
-        "stream": False,
+        "stream": True,
         "format": "json",
         "options": {
             "temperature": 0.8,
@@ -113,19 +123,31 @@ def _call_ollama(system_prompt: str, user_prompt: str) -> str:
         },
     }
 
-    resp = requests.post(url, json=payload, timeout=300)
-    resp.raise_for_status()
-
-    data = resp.json()
-    content: str = data.get("message", {}).get("content", "")
-    return content[:_MAX_RESPONSE_CHARS]
+    parts: list[str] = []
+    total = 0
+    with requests.post(url, json=payload, timeout=300, stream=True) as resp:
+        resp.raise_for_status()
+        for line in resp.iter_lines():
+            if not line:
+                continue
+            chunk = fast_json.loads(line)
+            if "error" in chunk:
+                raise RuntimeError(f"Ollama 오류: {chunk['error']}")
+            content = chunk.get("message", {}).get("content", "")
+            if content:
+                parts.append(content)
+                total += len(content)
+            if chunk.get("done") or total >= _MAX_RESPONSE_CHARS:
+                break
+
+    return "".join(parts)[:_MAX_RESPONSE_CHARS]
 
 
 def _load_system_prompt() -> str:
     """scenario_system.txt를 읽는다. 없으면 gpt_generator의 인라인 프롬프트 공유."""
-    path = _PROMPTS_DIR / "scenario_system.txt"
-    if path.exists():
-        return path.read_text(encoding="utf-8")
+    text = read_cached(_PROMPTS_DIR / "scenario_system.txt")
+    if text is not None:
+        return text
     logger.warning("scenario_system.txt 없음 — gpt_generator 인라인 프롬프트 사용")
     from scenario.generator.gpt_generator import _INLINE_SYSTEM_PROMPT
     return _INLINE_SYSTEM_PROMPT
@@ -146,11 +168,11 @@ def _parse_response(raw: str) -> Optional[dict]:
     JSON 파싱 후 scene 필드를 정규화한다.
     Ollama는 응답 앞뒤에 마크다운 코드블록(```json ... ```)을 붙이는 경우가 있어 제거한다.
     """
-    cleaned = _strip_markdown_codeblock(raw.strip())
+    cleaned = strip_markdown_codeblock(raw.strip())
 
     try:
-        data = json.loads(cleaned)
-    except json.JSONDecodeError as e:
+        data = fast_json.loads(cleaned)
+    except fast_json.JSONDecodeError as e:
         logger.error("JSON 디코드 오류: %s | raw preview: %s...", e, cleaned[:200])
         return None
 
@@ -161,6 +183,7 @@ def _parse_response(raw: str) -> Optional[dict]:
         data["title_ko"] = "untitled"
 
     normalized = []
+    debug = logger.isEnabledFor(logging.DEBUG)   # 장면마다 로거 레벨을 확인하지 않도록 한 번만
     for i, s in enumerate(data["scenes"]):
         if not isinstance(s, dict):
             continue
@@ -177,7 +200,8 @@ def _parse_response(raw: str) -> Optional[dict]:
             s["duration_sec"] = 3.0
 
         if s["stage"] not in _VALID_STAGES:
-            logger.debug("scene[%d] 비정상 stage '%s' → 'core' 대체", i, s["stage"])
+            if debug:
+                logger.debug("scene[%d] 비정상 stage '%s' → 'core' 대체", i, s["stage"])
             s["stage"] = "core"
 
         normalized.append(s)
@@ -186,36 +210,13 @@ def _parse_response(raw: str) -> Optional[dict]:
     return data
 
 
-def _strip_markdown_codeblock(text: str) -> str:
-    """
-    ```json ... ``` 또는 ``` ... ``` 블록 내부를 추출한다.
-    코드블록이 없으면 원본 반환.
-    """
-    if not text.startswith("```"):
-        return text
-
-    lines = text.splitlines()
-    inner: list[str] = []
-    in_block = False
-    for line in lines:
-        if not in_block and line.startswith("```"):
-            in_block = True
-            continue
-        if in_block and line.startswith("```"):
-            break
-        if in_block:
-            inner.append(line)
-
-    return "\n".join(inner) if inner else text
-
-
 def _check_scene_issues(scenes: list) -> list[str]:
     """재생성이 필요한 문제점 목록을 반환한다."""
     issues: list[str] = []
     if len(scenes) < config.MIN_SCENES:
         issues.append(f"장면 수 부족 ({len(scenes)}개, 최소 {config.MIN_SCENES}개 필요)")
     if scenes:
-        avg_dur = sum(s.get("duration_sec", 3) for s in scenes) / len(scenes)
+        avg_dur = sum(s["duration_sec"] for s in scenes) / len(scenes)
         if avg_dur > 5.0:
             issues.append(f"장면 평균 길이 과다 ({avg_dur:.1f}초, 최대 5초)")
     return issues
@@ -6,7 +6,10 @@ scenario/shorts_builder.py — 쇼츠 시나리오 재구성
 순수 알고리즘으로 처리 (GPT 추가 호출 없음).
 """
 
+import heapq
 import logging
+from collections import Counter
+from operator import itemgetter
 from typing import Optional
 
 import config
@@ -25,6 +28,9 @@ _SHORTS_STAGE_BUDGET: dict[str, int] = {
 
 _STAGE_ORDER = ["hook", "problem", "core", "twist", "cta"]
 
+# validator.validate_and_fix를 거친 장면은 duration_sec(float)가 항상 있으므로 기본값 없이 인덱싱
+_duration = itemgetter("duration_sec")
+
 
 def build_shorts_scenario(scenes: list) -> list:
     """
@@ -46,10 +52,9 @@ def build_shorts_scenario(scenes: list) -> list:
         return []
 
     selected = _select_scenes(scenes)
-    selected = _cap_to_duration(selected, config.SHORTS_DURATION_SEC)
+    selected, total_dur = _cap_to_duration(selected, config.SHORTS_DURATION_SEC)
     selected = _reassign_ids(selected)
 
-    total_dur = sum(s["duration_sec"] for s in selected)
     logger.info("쇼츠 시나리오: %d장면, 총 %.1f초", len(selected), total_dur)
     return selected
 
@@ -71,41 +76,36 @@ def _select_scenes(scenes: list) -> list:
         by_stage.setdefault(stage, []).append(s)
 
     # stage 내부: duration 짧은 것 우선 (빠른 템포 극대화)
-    for stage in by_stage:
-        by_stage[stage].sort(key=lambda s: s.get("duration_sec", 3.0))
-
+    # 할당량(k)만큼만 필요하므로 전체 정렬 대신 nsmallest — sorted()[:k]와 같은 결과(동률은 원본 순서)
     selected: list = []
     for stage in _STAGE_ORDER:
         budget = _SHORTS_STAGE_BUDGET.get(stage, 2)
-        candidates = by_stage.get(stage, [])
-        chosen = candidates[:budget]
-        selected.extend(chosen)
-
-    logger.debug(
-        "stage별 선발: %s",
-        {st: len([s for s in selected if s.get("stage") == st]) for st in _STAGE_ORDER},
-    )
+        selected.extend(
+            heapq.nsmallest(budget, by_stage.get(stage, ()), key=_duration)
+        )
+
+    if logger.isEnabledFor(logging.DEBUG):
+        counts = Counter(s.get("stage") for s in selected)
+        logger.debug("stage별 선발: %s", {st: counts[st] for st in _STAGE_ORDER})
     return selected
 
 
-def _cap_to_duration(scenes: list, max_sec: float) -> list:
-    """총 duration이 max_sec를 초과하면 초과 직전까지만 포함한다."""
-    result: list = []
+def _cap_to_duration(scenes: list, max_sec: float) -> tuple[list, float]:
+    """
+    총 duration이 max_sec를 초과하면 초과 직전까지만 포함한다.
+    반환: (포함된 장면, 그 총 duration) — 호출부에서 다시 합산하지 않도록 함께 돌려준다.
+    """
     total = 0.0
+    n = 0
     for s in scenes:
-        dur = s.get("duration_sec", 3.0)
+        dur = s["duration_sec"]
         if total + dur > max_sec:
             break
-        result.append(s)
         total += dur
-    return result
+        n += 1
+    return scenes[:n], total
 
 
 def _reassign_ids(scenes: list) -> list:
     """scene_id를 1부터 재부여한다. 원본 dict를 수정하지 않고 복사본을 반환한다."""
-    result: list = []
-    for i, s in enumerate(scenes):
-        new_scene = dict(s)
-        new_scene["scene_id"] = i + 1
-        result.append(new_scene)
-    return result
+    return [s | {"scene_id": i} for i, s in enumerate(scenes, 1)]
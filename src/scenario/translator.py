@@ -3,19 +3,21 @@ scenario/translator.py — 한/영 분기 + 번역
 
 한국어 시나리오의 narration·text_overlay·title을 영어로 번역한다.
 image_prompt는 이미 영어이므로 번역하지 않는다.
-20장면씩 청크로 분할해 GPT-4o를 호출한다.
+20장면씩 청크로 분할해 GPT-4o를 호출한다. 청크와 제목 번역은 서로 독립이므로 동시에 요청한다.
 """
 
-import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from typing import Optional
 
-import config
+from core import fast_json, llm_cache, openai_client
 from core.cost_tracker import CostTracker
 
 logger = logging.getLogger(__name__)
 
 _CHUNK_SIZE = 20   # 한 번에 번역할 최대 장면 수
+_MAX_WORKERS = 8   # 동시 번역 요청 상한
 
 _SCENE_TRANSLATE_SYSTEM = """\
 You are a professional Korean-to-English translator for YouTube video scripts.
@@ -53,8 +55,12 @@ def translate_scenario(
     Returns:
         (영어 scene 목록, 영어 제목) tuple
     """
-    scenes_en = _translate_scenes(scenes, cost_tracker)
-    title_en = _translate_title(title, cost_tracker)
+    n_chunks = (len(scenes) + _CHUNK_SIZE - 1) // _CHUNK_SIZE
+    with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, n_chunks + 1)) as executor:
+        # 제목 번역을 첫 장면 청크와 함께 시작
+        title_future = executor.submit(_translate_title, title, cost_tracker)
+        scenes_en = _translate_scenes(scenes, cost_tracker, executor)
+        title_en = title_future.result()
     return scenes_en, title_en
 
 
@@ -62,19 +68,27 @@ def translate_scenario(
 # 내부 헬퍼
 # ─────────────────────────────────────────────
 
-def _translate_scenes(scenes: list, cost_tracker: Optional[CostTracker]) -> list:
+def _translate_scenes(
+    scenes: list,
+    cost_tracker: Optional[CostTracker],
+    executor: Optional[ThreadPoolExecutor] = None,
+) -> list:
     """
     장면 목록을 _CHUNK_SIZE씩 나눠 번역한 뒤 합친다.
+    청크는 executor(없으면 새 스레드 풀)에서 동시에 번역하고 원래 순서대로 합친다.
     번역 실패 청크는 원본(한국어)을 그대로 사용한다.
     """
     if not scenes:
         return []
 
-    all_translated: list = []
-    for i in range(0, len(scenes), _CHUNK_SIZE):
-        chunk = scenes[i : i + _CHUNK_SIZE]
-        translated_chunk = _translate_chunk(chunk, cost_tracker)
-        all_translated.extend(translated_chunk)
+    chunks = [scenes[i : i + _CHUNK_SIZE] for i in range(0, len(scenes), _CHUNK_SIZE)]
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(chunks))) as own:
+            results = list(own.map(_translate_chunk, chunks, [cost_tracker] * len(chunks)))
+    else:
+        results = list(executor.map(_translate_chunk, chunks, [cost_tracker] * len(chunks)))
+
+    all_translated = list(chain.from_iterable(results))
 
     logger.info("번역 완료: %d장면", len(all_translated))
     return all_translated
@@ -83,6 +97,7 @@ def _translate_scenes(scenes: list, cost_tracker: Optional[CostTracker]) -> list
 def _translate_chunk(scenes: list, cost_tracker: Optional[CostTracker]) -> list:
     """청크 단위로 GPT-4o를 호출해 번역하고 원본 scene에 병합한다."""
     # 번역 대상 필드만 전송 (image_prompt 제외)
+    # narration·text_overlay가 모두 빈 장면은 번역할 것이 없으므로 보내지 않는다 (입출력 토큰 절약)
     payload = [
         {
             "scene_id": s["scene_id"],
@@ -90,13 +105,23 @@ def _translate_chunk(scenes: list, cost_tracker: Optional[CostTracker]) -> list:
             "text_overlay": s.get("text_overlay", ""),
         }
         for s in scenes
+        if s.get("narration") or s.get("text_overlay")
     ]
+    if not payload:
+        logger.debug("번역할 텍스트 없는 청크 — API 호출 생략")
+        return [dict(s) for s in scenes]
 
-    translated_list = _call_gpt_translate(
-        system=_SCENE_TRANSLATE_SYSTEM,
-        user=json.dumps(payload, ensure_ascii=False),
-        cost_tracker=cost_tracker,
-    )
+    user = fast_json.dumps(payload)
+    cache_key = llm_cache.make_key("translate", "gpt-4o", _SCENE_TRANSLATE_SYSTEM, user)
+    translated_list = llm_cache.get(cache_key)
+    if translated_list is None:
+        translated_list = _call_gpt_translate(
+            system=_SCENE_TRANSLATE_SYSTEM,
+            user=user,
+            cost_tracker=cost_tracker,
+        )
+        if translated_list is not None:
+            llm_cache.put(cache_key, translated_list)
 
     if translated_list is None:
         logger.warning("번역 실패 — 원본(한국어) 반환")
@@ -104,27 +129,31 @@ def _translate_chunk(scenes: list, cost_tracker: Optional[CostTracker]) -> list:
 
     # scene_id → 번역 결과 매핑
     # GPT가 scene_id를 정수로 반환하지 않을 수 있으므로 str→int 변환 처리
-    trans_map: dict[int, dict] = {}
-    for t in translated_list:
-        if not isinstance(t, dict):
-            continue
-        try:
-            sid = int(t.get("scene_id", -1))
-        except (TypeError, ValueError):
-            continue
-        trans_map[sid] = t
+    trans_map: dict[int, dict] = {
+        sid: t for t in translated_list
+        if isinstance(t, dict) and (sid := _to_scene_id(t.get("scene_id", -1))) is not None
+    }
 
     # 원본 scene에 번역 결과 병합 (image_prompt, stage, duration_sec 등은 원본 유지)
-    result: list = []
-    for s in scenes:
-        new_s = dict(s)
-        sid = s["scene_id"]
-        if sid in trans_map:
-            new_s["narration"] = trans_map[sid].get("narration") or s.get("narration", "")
-            new_s["text_overlay"] = trans_map[sid].get("text_overlay") or s.get("text_overlay", "")
-        result.append(new_s)
+    return [_merge_translation(s, trans_map.get(s["scene_id"])) for s in scenes]
+
 
-    return result
+def _merge_translation(scene: dict, t: Optional[dict]) -> dict:
+    """번역 결과 t를 원본 scene 복사본에 덮어쓴다. 빈 번역은 원본 텍스트 유지."""
+    if t is None:
+        return dict(scene)
+    return scene | {
+        "narration": t.get("narration") or scene.get("narration", ""),
+        "text_overlay": t.get("text_overlay") or scene.get("text_overlay", ""),
+    }
+
+
+def _to_scene_id(value) -> Optional[int]:
+    """GPT가 돌려준 scene_id를 int로 변환한다. 변환 불가면 None."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
 
 
 def _call_gpt_translate(
@@ -137,8 +166,7 @@ def _call_gpt_translate(
     실패 시 None 반환.
     """
     try:
-        from openai import OpenAI
-        client = OpenAI(api_key=config.OPENAI_API_KEY)
+        client = openai_client.get_client()
         response = client.chat.completions.create(
             model="gpt-4o",
             messages=[
@@ -170,8 +198,8 @@ def _parse_translation(raw: str) -> Optional[list]:
     {"scenes": [...]} 또는 [...] 형태로 올 수도 있어 유연하게 처리한다.
     """
     try:
-        data = json.loads(raw)
-    except json.JSONDecodeError as e:
+        data = fast_json.loads(raw)
+    except fast_json.JSONDecodeError as e:
         logger.error("번역 JSON 파싱 오류: %s", e)
         return None
 
@@ -192,9 +220,13 @@ def _parse_translation(raw: str) -> Optional[list]:
 
 def _translate_title(title: str, cost_tracker: Optional[CostTracker]) -> str:
     """유튜브 제목을 영어로 번역한다. 실패 시 원본 반환."""
+    cache_key = llm_cache.make_key("title", "gpt-4o", _TITLE_TRANSLATE_SYSTEM, title)
+    cached = llm_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        from openai import OpenAI
-        client = OpenAI(api_key=config.OPENAI_API_KEY)
+        client = openai_client.get_client()
         response = client.chat.completions.create(
             model="gpt-4o",
             messages=[
@@ -217,4 +249,7 @@ def _translate_title(title: str, cost_tracker: Optional[CostTracker]) -> str:
     # GPT가 제목을 따옴표로 감싸 반환하는 경우 제거
     en_title = (response.choices[0].message.content or "").strip().strip("\"'")
     logger.info("제목 번역: '%s' → '%s'", title, en_title)
-    return en_title if en_title else title
+    if not en_title:
+        return title
+    llm_cache.put(cache_key, en_title)
+    return en_title
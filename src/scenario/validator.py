@@ -8,8 +8,11 @@ generate_scenario() 결과를 받아 아래 규칙을 적용한다.
 """
 
 import logging
+import math
 from typing import Optional
 
+import numpy as np
+
 import config
 from core.cost_tracker import CostTracker
 
@@ -19,6 +22,7 @@ _DURATION_TOLERANCE = 10   # 허용 오차 (초)
 _SCENE_MIN_SEC = 2.0       # 장면 최소 시간
 _SCENE_MAX_SEC = 6.0       # 장면 최대 시간 (보정 후 클램핑)
 _STAGE_ORDER = ["hook", "problem", "core", "twist", "cta"]
+_STAGE_INDEX: dict[str, int] = {stage: i for i, stage in enumerate(_STAGE_ORDER)}
 
 
 def validate_and_fix(
@@ -40,13 +44,37 @@ def validate_and_fix(
         logger.warning("validator: scenes가 비어 있음 — 보정 없이 반환")
         return result
 
-    scenes = _fix_scene_ids(scenes)
-    scenes = _fix_duration(scenes)
-    _warn_stage_order(scenes)
+    # 한 번의 순회로 scene_id 재부여 · duration 수집 · stage 역행 감지
+    durations: list[float] = []
+    last_idx = -1
+    warned = False
+    for i, s in enumerate(scenes):
+        s["scene_id"] = i + 1
+        durations.append(s["duration_sec"])   # 생성기 _parse_response가 float로 정규화해 둠
 
-    result["scenes"] = scenes
+        # stage 순서가 hook→problem→core→twist→cta를 역행하면 경고 (첫 번째 이상만)
+        # 자동 수정은 하지 않는다 (내레이션 의미가 바뀔 수 있음)
+        if warned:
+            continue
+        stage = s.get("stage", "")
+        idx = _STAGE_INDEX.get(stage, -1)
+        if idx < 0:
+            continue
+        if idx < last_idx:
+            logger.warning(
+                "stage 순서 이상: scene_id=%d에서 '%s'(%d)가 '%s'(%d) 이전 단계로 역행",
+                s["scene_id"],
+                stage, idx,
+                _STAGE_ORDER[last_idx], last_idx,
+            )
+            warned = True
+            continue
+        last_idx = idx
 
-    total = sum(s["duration_sec"] for s in scenes)
+    # 보정이 필요한 경우에만 두 번째 순회
+    total = _fix_duration(scenes, durations)
+
+    result["scenes"] = scenes
     logger.info("validator 완료: %d장면, 총 %.1f초", len(scenes), total)
     return result
 
@@ -55,28 +83,21 @@ def validate_and_fix(
 # 내부 헬퍼
 # ─────────────────────────────────────────────
 
-def _fix_scene_ids(scenes: list) -> list:
-    """scene_id를 1부터 순서대로 재부여한다."""
-    for i, s in enumerate(scenes):
-        s["scene_id"] = i + 1
-    return scenes
-
-
-def _fix_duration(scenes: list) -> list:
+def _fix_duration(scenes: list, durations: list[float]) -> float:
     """
     총 duration이 TARGET_DURATION_SEC ±TOLERANCE를 벗어나면
-    비율 조정으로 보정한다.
+    비율 조정으로 보정한다. 반환: 보정 후(또는 그대로인) 총 duration.
     개별 scene은 [SCENE_MIN_SEC, SCENE_MAX_SEC] 범위로 클램핑한다.
     """
     target = float(config.TARGET_DURATION_SEC)
     lower = target - _DURATION_TOLERANCE
     upper = target + _DURATION_TOLERANCE
 
-    total = sum(s.get("duration_sec", 3.0) for s in scenes)
+    total = math.fsum(durations)   # 누적 반올림 오차 없는 합 — 허용 범위 경계에서 불필요한 보정 방지
 
     if lower <= total <= upper:
         logger.debug("총 duration %.1f초 — 목표 범위(%.0f~%.0f초) 내", total, lower, upper)
-        return scenes
+        return total
 
     ratio = target / total if total > 0 else 1.0
     logger.info(
@@ -84,32 +105,15 @@ def _fix_duration(scenes: list) -> list:
         total, target, ratio,
     )
 
-    for s in scenes:
-        raw = s.get("duration_sec", 3.0) * ratio
-        s["duration_sec"] = round(max(_SCENE_MIN_SEC, min(_SCENE_MAX_SEC, raw)), 1)
+    # 비율 적용 → 클램핑 → 소수 첫째 자리 반올림을 배열 단위로 (float64: 파이썬 float와 같은 정밀도)
+    durs = np.array(durations, dtype=np.float64)
+    np.multiply(durs, ratio, out=durs)
+    np.clip(durs, _SCENE_MIN_SEC, _SCENE_MAX_SEC, out=durs)
+    np.round(durs, 1, out=durs)
+    fixed = durs.tolist()
+    for s, d in zip(scenes, fixed):
+        s["duration_sec"] = d
 
-    new_total = sum(s["duration_sec"] for s in scenes)
+    new_total = math.fsum(fixed)
     logger.info("보정 후 총 duration: %.1f초", new_total)
-    return scenes
-
-
-def _warn_stage_order(scenes: list) -> None:
-    """
-    stage 순서가 hook→problem→core→twist→cta를 역행하면 경고한다.
-    자동 수정은 하지 않는다 (내레이션 의미가 바뀔 수 있음).
-    """
-    last_idx = -1
-    for s in scenes:
-        stage = s.get("stage", "")
-        if stage not in _STAGE_ORDER:
-            continue
-        idx = _STAGE_ORDER.index(stage)
-        if idx < last_idx:
-            logger.warning(
-                "stage 순서 이상: scene_id=%d에서 '%s'(%d)가 '%s'(%d) 이전 단계로 역행",
-                s.get("scene_id", "?"),
-                stage, idx,
-                _STAGE_ORDER[last_idx], last_idx,
-            )
-            return  # 첫 번째 이상만 경고
-        last_idx = idx
+    return new_total
@@ -1,8 +1,10 @@
 """
 scheduler/cron_runner.py — 예약 업로드 실행
 
-백그라운드 스레드에서 upload_queue를 주기적으로 폴링하며,
+백그라운드 스레드에서 upload_queue를 확인하며,
 예약 시간이 도래한 대기 항목을 순차 업로드한다.
+고정 간격으로 깨지 않고, 큐가 바뀌거나 다음 예약 시간이 되면 바로 깨어난다.
+(_POLL_INTERVAL은 최대 대기 시간)
 
 반복 스케줄 설정: "없음" | "매일" | "월수금" | 직접설정(cron 문자열)
 """
@@ -15,7 +17,7 @@ from typing import Callable, Optional
 
 logger = logging.getLogger(__name__)
 
-# 스케줄 체크 간격 (초)
+# 스케줄 체크 최대 간격 (초) — 큐 변경·예약 시간 도래 시에는 더 일찍 깨어난다
 _POLL_INTERVAL = 60
 
 # 반복 스케줄 프리셋에서 허용하는 요일 (ISO weekday: 1=월 ... 7=일)
@@ -26,8 +28,9 @@ _REPEAT_PRESETS = {
     "mwf":      [1, 3, 5],
 }
 
-# 진행/완료 콜백 타입
-UploadResultCallback = Callable[[int, bool, str], None]  # (queue_id, success, message)
+# 완료 콜백 타입 — 한 번의 처리 주기 결과 [(queue_id, success, message)]를 모아 한 번에 전달
+# (GUI 스레드를 항목마다 깨우지 않는다)
+UploadResultsCallback = Callable[[list[tuple[int, bool, str]]], None]
 
 
 class CronRunner:
@@ -44,16 +47,17 @@ class CronRunner:
     def __init__(
         self,
         poll_interval: int = _POLL_INTERVAL,
-        on_upload_result: Optional[UploadResultCallback] = None,
+        on_upload_results: Optional[UploadResultsCallback] = None,
     ) -> None:
         self._poll_interval = poll_interval
-        self._on_upload_result = on_upload_result
+        self._on_upload_results = on_upload_results
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
 
         # 반복 스케줄 설정
         self._repeat_mode: str = "none"     # "none" | "daily" | "mwf" | "weekdays" | "custom"
         self._repeat_days: list[int] = []   # ISO weekday 목록 (custom일 때 사용)
+        self._repeat_mask: int = 0          # _repeat_days 비트마스크 (bit d-1 = ISO weekday d)
         self._upload_time: str = "09:00"    # HH:MM 형식
 
     # ─────────────────────────────────────────────
@@ -75,6 +79,8 @@ class CronRunner:
         """백그라운드 폴링 스레드를 중지한다."""
         self._stop_event.set()
         if self._thread and self._thread.is_alive():
+            from scheduler import upload_queue
+            upload_queue.notify_changed()   # 대기 중인 루프를 즉시 깨움
             self._thread.join(timeout=10)
         logger.info("CronRunner 중지")
 
@@ -102,6 +108,7 @@ class CronRunner:
             self._repeat_days = _REPEAT_PRESETS[mode]
         else:
             self._repeat_days = []
+        self._repeat_mask = sum(1 << (d - 1) for d in set(self._repeat_days) if 1 <= d <= 7)
 
         logger.info(
             "반복 스케줄 설정: mode=%s, time=%s, days=%s",
@@ -122,20 +129,25 @@ class CronRunner:
         if self._repeat_mode == "none" or not self._repeat_days:
             return None
 
+        mask = self._repeat_mask
+        if not mask:
+            return None
+
         now = datetime.now()
         hour, minute = map(int, self._upload_time.split(":"))
+        target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+
+        # 요일 마스크를 오늘 기준으로 회전: bit k = 오늘부터 k일 뒤 요일이 대상인지
+        today = now.isoweekday() - 1
+        rotated = ((mask >> today) | (mask << (7 - today))) & 0x7F
+        if target <= now:
+            rotated &= ~1                       # 오늘 시간은 이미 지남
+        if rotated:
+            day_offset = (rotated & -rotated).bit_length() - 1   # 가장 낮은 비트 = 가장 가까운 날
+        else:
+            day_offset = 7                      # 오늘 요일만 대상이고 시간이 지남 → 다음 주 같은 요일
 
-        for day_offset in range(8):  # 최대 7일 앞까지 탐색
-            target = now + timedelta(days=day_offset)
-            target = target.replace(hour=hour, minute=minute, second=0, microsecond=0)
-
-            if target <= now:
-                continue
-
-            if target.isoweekday() in self._repeat_days:
-                return target.isoformat()
-
-        return None
+        return (target + timedelta(days=day_offset)).isoformat()
 
     # ─────────────────────────────────────────────
     # 폴링 루프
@@ -143,40 +155,65 @@ class CronRunner:
 
     def _run_loop(self) -> None:
         """메인 폴링 루프. stop_event가 설정될 때까지 반복한다."""
+        from scheduler import upload_queue
+
         while not self._stop_event.is_set():
+            # 처리 시작 전 변경 번호를 잡아 두어, 처리 중에 들어온 항목도 바로 다시 확인한다
+            seq = upload_queue.change_seq()
             try:
                 self._process_pending()
+                timeout = self._next_wait(upload_queue.next_scheduled_at())
             except Exception as e:
                 logger.error("CronRunner 폴링 오류: %s", e, exc_info=True)
+                timeout = self._poll_interval
 
-            self._stop_event.wait(timeout=self._poll_interval)
+            upload_queue.wait_for_change(seq, timeout, self._stop_event)
 
-    def _process_pending(self) -> None:
-        """대기 중인 큐 항목을 확인하고 업로드를 실행한다."""
-        from scheduler.upload_queue import get_pending, mark_uploading, mark_done, mark_failed
-
-        pending = get_pending()
-        if not pending:
-            return
-
-        logger.info("대기 항목 %d개 발견 — 업로드 시작", len(pending))
+    def _next_wait(self, next_scheduled_at: Optional[str]) -> float:
+        """다음 예약 시간까지 남은 초 (최대 poll_interval)."""
+        if not next_scheduled_at:
+            return self._poll_interval
+        try:
+            remaining = (datetime.fromisoformat(next_scheduled_at) - datetime.now()).total_seconds()
+        except (TypeError, ValueError):   # 형식 오류 / 시간대 포함 문자열
+            return self._poll_interval
+        return min(self._poll_interval, max(remaining, 0.0))
 
-        for item in pending:
-            if self._stop_event.is_set():
-                break
+    def _process_pending(self) -> None:
+        """대기 중인 큐 항목을 하나씩 가져와 업로드한다."""
+        from scheduler.upload_queue import claim_pending, mark_done, mark_failed, reset_stale_uploading
+
+        # 비정상 종료한 실행기가 남긴 오래된 claim만 되돌린다 (진행 중인 claim은 유지)
+        reset_stale_uploading()
+
+        results: list[tuple[int, bool, str]] = []
+        try:
+            while not self._stop_event.is_set():
+                # 한 번에 하나만 claim — 시작하지 않은 항목이 'uploading'에 묶여 있지 않다
+                claimed = claim_pending(limit=1)
+                if not claimed:
+                    break
+
+                queue_id = claimed[0]["id"]
+                # 결과는 업로드 직후 바로 기록한다 (중간에 종료돼도 완료 항목이 재업로드되지 않음)
+                try:
+                    video_id = self._do_upload(claimed[0])
+                except Exception as e:
+                    error_msg = str(e)
+                    mark_failed(queue_id, error_msg)
+                    results.append((queue_id, False, error_msg))
+                    logger.error("큐 [id=%d] 업로드 실패: %s", queue_id, e)
+                    continue
 
-            queue_id = item["id"]
-            try:
-                mark_uploading(queue_id)
-                video_id = self._do_upload(item)
                 mark_done(queue_id, video_id)
-                self._notify_result(queue_id, True, f"업로드 완료 (video_id={video_id})")
+                results.append((queue_id, True, f"업로드 완료 (video_id={video_id})"))
+        finally:
+            # GUI 알림만 처리 주기 단위로 모아 보낸다
+            self._notify_results(results)
 
-            except Exception as e:
-                error_msg = str(e)
-                mark_failed(queue_id, error_msg)
-                self._notify_result(queue_id, False, error_msg)
-                logger.error("큐 [id=%d] 업로드 실패: %s", queue_id, e)
+        if results:
+            ok = sum(1 for _, success, _ in results if success)
+            logger.info("업로드 처리 %d건 (완료 %d, 실패 %d)", len(results), ok, len(results) - ok)
 
     def _do_upload(self, item: dict) -> str:
         """실제 업로드를 수행하고 video_id를 반환한다."""
@@ -194,10 +231,10 @@ class CronRunner:
         )
         return video_id
 
-    def _notify_result(self, queue_id: int, success: bool, message: str) -> None:
-        """업로드 결과 콜백을 호출한다."""
-        if self._on_upload_result:
+    def _notify_results(self, results: list[tuple[int, bool, str]]) -> None:
+        """처리 주기의 업로드 결과 목록을 배치 콜백으로 한 번에 전달한다."""
+        if self._on_upload_results and results:
             try:
-                self._on_upload_result(queue_id, success, message)
+                self._on_upload_results(results)
             except Exception as e:
-                logger.warning("결과 콜백 오류: %s", e)
+                logger.warning("결과 배치 콜백 오류: %s", e)
@@ -4,26 +4,35 @@ scheduler/upload_queue.py — 업로드 큐 관리
 SQLite 기반으로 업로드 대기 항목을 관리한다.
 영상 제작 완료 후 즉시 업로드하지 않고 큐에 추가하면,
 cron_runner가 예약된 시간에 업로드를 실행한다.
+대기 항목이 추가·변경되면 notify_changed()로 대기 중인 cron_runner를 즉시 깨운다.
 """
 
-import json
 import logging
 import sqlite3
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import ContextManager, Optional
 
 import config
+from core import db, fast_json
 
 logger = logging.getLogger(__name__)
 
 _DB_PATH = config.HISTORY_DB_PATH  # history.db를 공유 (테이블 분리)
+_DB = db.shared(_DB_PATH)           # history_manager와 같은 공유 연결 (WAL)
 
+# 'uploading' 항목을 실패한 claim으로 보는 시간 — 영상 1개 업로드(재시도 포함)보다 충분히 길게
+_CLAIM_TIMEOUT_SEC = 3 * 60 * 60
 
-def _get_conn() -> sqlite3.Connection:
-    conn = sqlite3.connect(_DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+# 대기 항목 변경 알림 — 변경 번호를 함께 두어 대기 직전에 온 알림도 놓치지 않는다
+_changed = threading.Condition()
+_change_seq = 0
+
+
+def _get_conn() -> ContextManager[sqlite3.Connection]:
+    """공유 연결을 빌려준다. with 블록 하나가 트랜잭션 하나."""
+    return _DB.transaction()
 
 
 def _init_db() -> None:
@@ -41,15 +50,30 @@ def _init_db() -> None:
                 created_at      TEXT    DEFAULT (datetime('now')),
                 uploaded_at     TEXT,
                 video_id        TEXT,
-                error_message   TEXT
+                error_message   TEXT,
+                claimed_at      TEXT
             )
         """)
+        # 이전 버전 DB — claimed_at 컬럼 추가
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(upload_queue)")}
+        if "claimed_at" not in columns:
+            conn.execute("ALTER TABLE upload_queue ADD COLUMN claimed_at TEXT")
         conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_queue_status ON upload_queue(status)"
         )
-        conn.execute(
-            "CREATE INDEX IF NOT EXISTS idx_queue_scheduled ON upload_queue(scheduled_at)"
-        )
+        # 대기 항목 전용 부분 인덱스 — get_pending/claim_pending의 ORDER BY와
+        # next_scheduled_at의 범위 조건을 정렬 없이 처리하고, 완료된 항목은 빠져 작게 유지된다
+        has_pending_index = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_queue_pending'"
+        ).fetchone() is not None
+        if not has_pending_index:
+            conn.execute(
+                """CREATE INDEX idx_queue_pending
+                   ON upload_queue(scheduled_at, created_at) WHERE status = 'pending'"""
+            )
+            conn.execute("DROP INDEX IF EXISTS idx_queue_scheduled")
+            # 통계가 없으면 플래너가 idx_queue_status + 임시 정렬을 고르므로 인덱스를 만들 때 한 번만 분석
+            conn.execute("ANALYZE upload_queue")
 
 
 _init_db()
@@ -76,7 +100,7 @@ def enqueue(
     scheduled_at:   예약 시간 (ISO 형식, None이면 즉시 업로드 대상)
     반환: 생성된 큐 항목 id
     """
-    metadata_json = json.dumps(metadata, ensure_ascii=False)
+    metadata_json = fast_json.dumps(metadata)
     with _get_conn() as conn:
         cursor = conn.execute(
             """INSERT INTO upload_queue
@@ -85,6 +109,7 @@ def enqueue(
             (video_path, thumbnail_path, metadata_json, lang, scheduled_at),
         )
         queue_id = cursor.lastrowid
+    notify_changed()
     logger.info("큐 추가 [id=%d] %s (%s)", queue_id, Path(video_path).name, lang)
     return queue_id
 
@@ -96,16 +121,32 @@ def enqueue_batch(items: list[dict]) -> list[int]:
     items: [{"video_path", "thumbnail_path", "metadata", "lang", "scheduled_at"(선택)}]
     반환: 생성된 큐 항목 id 목록
     """
-    ids: list[int] = []
-    for item in items:
-        qid = enqueue(
-            video_path=item["video_path"],
-            thumbnail_path=item["thumbnail_path"],
-            metadata=item["metadata"],
-            lang=item.get("lang", "ko"),
-            scheduled_at=item.get("scheduled_at"),
+    if not items:
+        return []
+
+    rows = [
+        (
+            item["video_path"],
+            item["thumbnail_path"],
+            fast_json.dumps(item["metadata"]),
+            item.get("lang", "ko"),
+            item.get("scheduled_at"),
         )
-        ids.append(qid)
+        for item in items
+    ]
+    # 한 트랜잭션·한 번의 executemany로 삽입 (공유 연결 잠금 안이라 id는 연속 발급)
+    with _get_conn() as conn:
+        conn.executemany(
+            """INSERT INTO upload_queue
+               (video_path, thumbnail_path, metadata_json, lang, scheduled_at)
+               VALUES (?, ?, ?, ?, ?)""",
+            rows,
+        )
+        last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+    notify_changed()
+
+    ids = list(range(last_id - len(rows) + 1, last_id + 1))
+    logger.info("큐 일괄 추가 %d건 [id=%d~%d]", len(ids), ids[0], ids[-1])
     return ids
 
 
@@ -131,6 +172,45 @@ def get_pending(limit: int = 50) -> list[dict]:
     return [_row_to_dict(r) for r in rows]
 
 
+def claim_pending(limit: int = 50) -> list[dict]:
+    """
+    업로드 대상 항목을 한 트랜잭션에서 'uploading'으로 바꾸고 반환한다.
+    조회와 상태 변경 사이에 다른 실행기가 같은 항목을 가져갈 틈이 없다.
+    claim 시각(claimed_at)을 함께 기록한다. (reset_stale_uploading의 기준)
+    (UPDATE ... RETURNING — SQLite 3.35+)
+    정렬은 get_pending()과 같다: scheduled_at(NULL 먼저), created_at 순.
+    """
+    now = datetime.now().isoformat()
+    with _DB.transaction(immediate=True) as conn:
+        rows = conn.execute(
+            """UPDATE upload_queue SET status = 'uploading', claimed_at = datetime('now')
+               WHERE id IN (
+                   SELECT id FROM upload_queue
+                   WHERE status = 'pending'
+                     AND (scheduled_at IS NULL OR scheduled_at <= ?)
+                   ORDER BY scheduled_at ASC, created_at ASC
+                   LIMIT ?
+               )
+               RETURNING *""",
+            (now, limit),
+        ).fetchall()
+    # RETURNING 행 순서는 보장되지 않으므로 다시 정렬
+    rows.sort(key=lambda r: (r["scheduled_at"] is not None, r["scheduled_at"] or "", r["created_at"] or "", r["id"]))
+    return [_row_to_dict(r) for r in rows]
+
+
+def next_scheduled_at() -> Optional[str]:
+    """아직 예약 시간이 오지 않은 대기 항목 중 가장 이른 scheduled_at. 없으면 None."""
+    now = datetime.now().isoformat()
+    with _get_conn() as conn:
+        row = conn.execute(
+            """SELECT MIN(scheduled_at) FROM upload_queue
+               WHERE status = 'pending' AND scheduled_at > ?""",
+            (now,),
+        ).fetchone()
+    return row[0] if row else None
+
+
 def get_all(status: Optional[str] = None) -> list[dict]:
     """전체 큐 항목을 조회한다. status로 필터링 가능."""
     with _get_conn() as conn:
@@ -168,6 +248,38 @@ def mark_uploading(queue_id: int) -> None:
         )
 
 
+def release(queue_ids: list[int]) -> None:
+    """claim_pending()으로 가져갔지만 처리하지 못한 항목을 다시 pending으로 돌려놓는다."""
+    if not queue_ids:
+        return
+    with _get_conn() as conn:
+        conn.execute(
+            f"""UPDATE upload_queue SET status = 'pending', claimed_at = NULL
+                WHERE status = 'uploading' AND id IN ({_placeholders(queue_ids)})""",
+            queue_ids,
+        )
+    logger.info("큐 반환 %d건 (미처리)", len(queue_ids))
+
+
+def reset_stale_uploading(timeout_sec: int = _CLAIM_TIMEOUT_SEC) -> int:
+    """
+    claim 후 timeout_sec이 지나도 'uploading'에 남은 항목을 pending으로 되돌린다.
+    claim_pending()으로 가져간 실행기가 비정상 종료한 경우다.
+    아직 업로드 중인 다른 실행기의 항목(claim이 최근)은 건드리지 않는다. 반환: 되돌린 항목 수
+    """
+    with _get_conn() as conn:
+        count = conn.execute(
+            """UPDATE upload_queue SET status = 'pending', claimed_at = NULL
+               WHERE status = 'uploading'
+                 AND (claimed_at IS NULL OR claimed_at < datetime('now', ?))""",
+            (f"-{int(timeout_sec)} seconds",),
+        ).rowcount
+    if count:
+        logger.warning("중단된 업로드 %d건을 대기 상태로 되돌림 (claim 후 %d초 경과)", count, timeout_sec)
+        notify_changed()
+    return count
+
+
 def mark_done(queue_id: int, video_id: str) -> None:
     """업로드 완료 상태로 변경한다."""
     with _get_conn() as conn:
@@ -197,6 +309,7 @@ def retry(queue_id: int) -> None:
             "UPDATE upload_queue SET status = 'pending', error_message = NULL WHERE id = ?",
             (queue_id,),
         )
+    notify_changed()
     logger.info("큐 재시도 [id=%d]", queue_id)
 
 
@@ -217,6 +330,44 @@ def remove(queue_id: int) -> None:
     logger.info("큐 삭제 [id=%d]", queue_id)
 
 
+def retry_many(queue_ids: list[int]) -> None:
+    """여러 항목을 한 트랜잭션으로 pending 상태로 되돌린다."""
+    if not queue_ids:
+        return
+    with _get_conn() as conn:
+        conn.execute(
+            f"""UPDATE upload_queue SET status = 'pending', error_message = NULL
+                WHERE id IN ({_placeholders(queue_ids)})""",
+            queue_ids,
+        )
+    notify_changed()
+    logger.info("큐 재시도 %d건", len(queue_ids))
+
+
+def cancel_many(queue_ids: list[int]) -> None:
+    """여러 항목을 한 트랜잭션으로 취소한다."""
+    if not queue_ids:
+        return
+    with _get_conn() as conn:
+        conn.execute(
+            f"UPDATE upload_queue SET status = 'cancelled' WHERE id IN ({_placeholders(queue_ids)})",
+            queue_ids,
+        )
+    logger.info("큐 취소 %d건", len(queue_ids))
+
+
+def remove_many(queue_ids: list[int]) -> None:
+    """여러 항목을 한 트랜잭션으로 삭제한다."""
+    if not queue_ids:
+        return
+    with _get_conn() as conn:
+        conn.execute(
+            f"DELETE FROM upload_queue WHERE id IN ({_placeholders(queue_ids)})",
+            queue_ids,
+        )
+    logger.info("큐 삭제 %d건", len(queue_ids))
+
+
 # ─────────────────────────────────────────────
 # 예약 시간 변경
 # ─────────────────────────────────────────────
@@ -228,9 +379,40 @@ def reschedule(queue_id: int, scheduled_at: str) -> None:
             "UPDATE upload_queue SET scheduled_at = ? WHERE id = ?",
             (scheduled_at, queue_id),
         )
+    notify_changed()
     logger.info("큐 예약 변경 [id=%d] → %s", queue_id, scheduled_at)
 
 
+# ─────────────────────────────────────────────
+# 변경 알림
+# ─────────────────────────────────────────────
+
+def change_seq() -> int:
+    """현재 변경 번호. wait_for_change()에 넘겨 그 이후의 변경을 기다린다."""
+    with _changed:
+        return _change_seq
+
+
+def notify_changed() -> None:
+    """대기 항목이 추가·변경됐음을 알려 wait_for_change() 대기자를 깨운다."""
+    global _change_seq
+    with _changed:
+        _change_seq += 1
+        _changed.notify_all()
+
+
+def wait_for_change(seq: int, timeout: float, stop_event: Optional[threading.Event] = None) -> None:
+    """
+    변경 번호가 seq에서 바뀌거나 timeout(초)이 지날 때까지 대기한다.
+    stop_event가 설정돼 있으면 즉시 반환한다. (설정 후 notify_changed()로 깨울 것)
+    """
+    with _changed:
+        _changed.wait_for(
+            lambda: _change_seq != seq or (stop_event is not None and stop_event.is_set()),
+            timeout=timeout,
+        )
+
+
 # ─────────────────────────────────────────────
 # 통계
 # ─────────────────────────────────────────────
@@ -248,12 +430,17 @@ def count_by_status() -> dict[str, int]:
 # 내부 헬퍼
 # ─────────────────────────────────────────────
 
+def _placeholders(values: list) -> str:
+    """IN 절용 "?, ?, ..." 문자열을 만든다."""
+    return ", ".join("?" * len(values))
+
+
 def _row_to_dict(row: sqlite3.Row) -> dict:
     """sqlite3.Row를 dict로 변환하고 metadata_json을 파싱한다."""
     d = dict(row)
     if d.get("metadata_json"):
         try:
-            d["metadata"] = json.loads(d["metadata_json"])
-        except json.JSONDecodeError:
+            d["metadata"] = fast_json.loads(d["metadata_json"])
+        except fast_json.JSONDecodeError:
             d["metadata"] = {}
     return d
@@ -5,7 +5,10 @@ JavaScript 렌더링이 필요한 페이지는 정적 HTML만 수집하며
 JS 의존 콘텐츠는 parser 단계에서 부분적으로 보완된다.
 """
 
+import codecs
 import logging
+import re
+from typing import Optional
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -33,6 +36,10 @@ _TIMEOUT_SEC: int = 20
 _MAX_RETRIES: int = 3
 _RETRY_BACKOFF: float = 1.0   # 재시도 간격 (초), exponential: 1, 2, 4...
 
+# 본문 앞부분에서 <meta charset=...> / <meta http-equiv content="...; charset=..."> 를 찾는 범위
+_META_SNIFF_BYTES = 2048
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([A-Za-z0-9_.:-]+)""", re.IGNORECASE)
+
 
 def fetch_page(url: str, timeout: int = _TIMEOUT_SEC) -> str:
     """
@@ -45,35 +52,43 @@ def fetch_page(url: str, timeout: int = _TIMEOUT_SEC) -> str:
     Returns:
         HTML 문자열
 
+    Raises:
+        FetchError: 수집 실패 시 (타임아웃 / 연결 오류 / HTTP 오류)
+    """
+    content, encoding = fetch_page_bytes(url, timeout)
+    return content.decode(encoding, errors="replace")
+
+
+def fetch_page_bytes(url: str, timeout: int = _TIMEOUT_SEC) -> tuple[bytes, str]:
+    """
+    URL에서 HTML을 수집하고 디코딩하지 않은 (본문 bytes, 인코딩)을 반환한다.
+    parser.extract_text(content, encoding=encoding)에 그대로 넘기면
+    str로 디코딩한 뒤 lxml이 다시 인코딩하는 왕복을 피할 수 있다.
+
     Raises:
         FetchError: 수집 실패 시 (타임아웃 / 연결 오류 / HTTP 오류)
     """
     if not url or not url.startswith(("http://", "https://")):
         raise FetchError(f"유효하지 않은 URL: {url!r}")
 
-    session = _build_session()
     logger.info("페이지 수집 시작: %s", url)
 
     try:
-        response = session.get(
+        response = _SESSION.get(
             url,
-            headers=_DEFAULT_HEADERS,
             timeout=timeout,
             allow_redirects=True,
         )
         response.raise_for_status()
 
-        # 인코딩 자동 감지 (chardet / charset-normalizer)
-        # apparent_encoding이 None 이면 utf-8 폴백
-        encoding = response.apparent_encoding or "utf-8"
-        response.encoding = encoding
-        html = response.text
+        content = response.content
+        encoding = _detect_encoding(response)
 
         logger.info(
             "수집 완료: %s (%d bytes, 인코딩: %s, 상태: %d)",
-            url, len(response.content), encoding, response.status_code,
+            url, len(content), encoding, response.status_code,
         )
-        return html
+        return content, encoding
 
     except requests.exceptions.Timeout:
         raise FetchError(f"타임아웃: {url} (제한: {timeout}초)")
@@ -88,9 +103,46 @@ def fetch_page(url: str, timeout: int = _TIMEOUT_SEC) -> str:
         raise FetchError(f"요청 실패: {url} — {e}")
 
 
+def _detect_encoding(response: requests.Response) -> str:
+    """
+    응답 인코딩을 정한다. 비용이 싼 순서로:
+    1. Content-Type 헤더의 charset
+    2. 본문 앞부분 <meta> charset
+    3. apparent_encoding (chardet / charset-normalizer — 본문 전체를 분석하므로 느림)
+    apparent_encoding이 None이면 utf-8 폴백.
+    """
+    declared = _valid_codec(requests.utils.get_encoding_from_headers(response.headers))
+    # charset 없는 text/* 응답에 requests가 붙이는 기본값(ISO-8859-1)은 선언으로 보지 않는다
+    if declared and "charset" in response.headers.get("Content-Type", "").lower():
+        return declared
+
+    m = _META_CHARSET_RE.search(response.content[:_META_SNIFF_BYTES])
+    if m:
+        meta = _valid_codec(m.group(1).decode("ascii", "ignore"))
+        if meta:
+            return meta
+
+    return response.apparent_encoding or "utf-8"
+
+
+def _valid_codec(name: Optional[str]) -> Optional[str]:
+    """파이썬이 아는 코덱 이름이면 그대로, 아니면 None."""
+    if not name:
+        return None
+    try:
+        codecs.lookup(name)
+    except LookupError:
+        return None
+    return name
+
+
 def _build_session() -> requests.Session:
-    """재시도 로직이 내장된 HTTP 세션을 생성한다."""
+    """
+    재시도 로직이 내장된 HTTP 세션을 생성한다.
+    모듈 수준에서 한 번만 만들어 재사용하므로 같은 호스트 재요청 시 TCP/TLS 연결을 다시 맺지 않는다.
+    """
     session = requests.Session()
+    session.headers.update(_DEFAULT_HEADERS)
     retry = Retry(
         total=_MAX_RETRIES,
         backoff_factor=_RETRY_BACKOFF,
@@ -104,5 +156,8 @@ def _build_session() -> requests.Session:
     return session
 
 
+_SESSION = _build_session()
+
+
 class FetchError(Exception):
     """페이지 수집 실패 시 발생."""
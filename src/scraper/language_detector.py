@@ -5,17 +5,35 @@ scraper/language_detector.py — 한/영 언어 감지
 감지 실패 시 "en" 반환.
 """
 
+import hashlib
 import logging
-import re
+import threading
 from typing import Optional
 
+import numpy as np
+
+try:
+    from langdetect import DetectorFactory, detect_langs as _detect_langs
+    DetectorFactory.seed = 0   # BUG-06 FIX: 동일 텍스트에 항상 동일 결과 보장
+except ImportError:
+    _detect_langs = None
+
 logger = logging.getLogger(__name__)
 
-# 한국어 유니코드 범위 (한글 음절, 자모, 호환 자모)
-_KO_PATTERN = re.compile(
-    r"[\uac00-\ud7a3"   # 한글 음절 (가~힣)
-    r"\u1100-\u11ff"    # 한글 자모
-    r"\u3131-\u318e]"   # 한글 호환 자모
+# 한국어 유니코드 범위 (한글 음절, 자모, 호환 자모) — 양 끝 포함
+_KO_RANGES = (
+    (0xAC00, 0xD7A3),   # 한글 음절 (가~힣)
+    (0x1100, 0x11FF),   # 한글 자모
+    (0x3131, 0x318E),   # 한글 호환 자모
+)
+
+# 공백 코드포인트 (정규식 \s / str.isspace()와 같은 집합)
+_WS_CODEPOINTS = np.array(
+    [
+        *range(0x09, 0x0E), *range(0x1C, 0x21), 0x85, 0xA0, 0x1680,
+        *range(0x2000, 0x200B), 0x2028, 0x2029, 0x202F, 0x205F, 0x3000,
+    ],
+    dtype=np.uint32,
 )
 
 # 한국어 문자 비율이 이 값 이상이면 langdetect 없이 바로 "ko" 반환
@@ -24,9 +42,16 @@ _KO_FAST_THRESHOLD = 0.30
 # langdetect 신뢰도가 이 값 미만이면 휴리스틱으로 재판단
 _MIN_CONFIDENCE = 0.80
 
-# langdetect 샘플 길이 (속도 최적화, 앞부분이 언어 판단에 충분)
+# langdetect 샘플 길이 (속도 최적화) — 앞·가운데·끝에서 1/3씩 뽑는다
+# 앞부분만 쓰면 파서가 다 못 걷어낸 영문 내비게이션/보일러플레이트에 치우친다
 _SAMPLE_LENGTH = 3_000
 
+# 감지 결과 캐시 — 같은 본문으로 재시도/재실행할 때 langdetect를 다시 돌리지 않는다
+# 키는 본문 전체가 아닌 blake2b 다이제스트 (긴 본문을 캐시에 붙잡아 두지 않도록)
+_CACHE_MAX = 64
+_cache: dict[bytes, str] = {}
+_cache_lock = threading.Lock()
+
 
 def detect_language(text: str) -> str:
     """
@@ -43,6 +68,32 @@ def detect_language(text: str) -> str:
         logger.warning("텍스트 부족 (%d자) — 기본값 'en' 사용", len(text) if text else 0)
         return "en"
 
+    key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    cached = _cache.get(key)
+    if cached is not None:
+        logger.info("언어 감지 캐시 사용: '%s'", cached)
+        return cached
+
+    lang = _detect(text)
+    with _cache_lock:
+        if len(_cache) >= _CACHE_MAX:
+            _cache.pop(next(iter(_cache)))   # 가장 오래된 항목 제거
+        _cache[key] = lang
+    return lang
+
+
+def clear_cache() -> None:
+    """언어 감지 결과 캐시를 비운다."""
+    with _cache_lock:
+        _cache.clear()
+
+
+# ─────────────────────────────────────────────────────────────
+# 내부 헬퍼
+# ─────────────────────────────────────────────────────────────
+
+def _detect(text: str) -> str:
+    """휴리스틱 → langdetect 순으로 언어를 판단한다."""
     # 1차: 한국어 문자 비율 휴리스틱
     ko_ratio = _korean_char_ratio(text)
     if ko_ratio >= _KO_FAST_THRESHOLD:
@@ -55,17 +106,29 @@ def detect_language(text: str) -> str:
     return lang
 
 
-# ─────────────────────────────────────────────────────────────
-# 내부 헬퍼
-# ─────────────────────────────────────────────────────────────
-
 def _korean_char_ratio(text: str) -> float:
-    """공백 제외 전체 문자 대비 한국어 문자 비율을 반환한다."""
-    no_space = re.sub(r"\s", "", text)
-    if not no_space:
+    """
+    공백 제외 전체 문자 대비 한국어 문자 비율을 반환한다.
+    UTF-32 코드포인트 배열에서 범위 비교로 한 번에 센다 (정규식 findall·공백 제거 사본 없음).
+    """
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype="<u4")
+    non_space = codes.size - int(np.isin(codes, _WS_CODEPOINTS).sum())
+    if not non_space:
         return 0.0
-    ko_count = len(_KO_PATTERN.findall(no_space))
-    return ko_count / len(no_space)
+    ko = np.zeros(codes.size, dtype=bool)
+    for lo, hi in _KO_RANGES:
+        ko |= (codes >= lo) & (codes <= hi)
+    return int(ko.sum()) / non_space
+
+
+def _sample_text(text: str) -> str:
+    """_SAMPLE_LENGTH보다 긴 텍스트는 앞·가운데·끝 조각을 이어 붙여 반환한다."""
+    n = len(text)
+    if n <= _SAMPLE_LENGTH:
+        return text
+    part = _SAMPLE_LENGTH // 3
+    mid = (n - part) // 2
+    return "\n".join((text[:part], text[mid:mid + part], text[-part:]))
 
 
 def _detect_with_langdetect(text: str, ko_ratio: float) -> str:
@@ -73,18 +136,14 @@ def _detect_with_langdetect(text: str, ko_ratio: float) -> str:
     langdetect로 언어를 감지한다.
     langdetect 미설치 또는 감지 실패 시 휴리스틱 결과를 사용한다.
     """
-    try:
-        from langdetect import detect_langs
-        from langdetect import DetectorFactory
-        DetectorFactory.seed = 0   # BUG-06 FIX: 동일 텍스트에 항상 동일 결과 보장
-    except ImportError:
+    if _detect_langs is None:
         logger.warning("langdetect 미설치 — 한국어 비율(%.1f%%)로 판단", ko_ratio * 100)
         return "ko" if ko_ratio >= 0.10 else "en"
 
-    sample = text[:_SAMPLE_LENGTH] if len(text) > _SAMPLE_LENGTH else text
+    sample = _sample_text(text)
 
     try:
-        langs = detect_langs(sample)
+        langs = _detect_langs(sample)
     except Exception as e:
         logger.warning("langdetect 감지 오류: %s — 한국어 비율로 폴백", e)
         return "ko" if ko_ratio >= 0.10 else "en"
@@ -1,14 +1,19 @@
 """
 scraper/parser.py — 핵심 텍스트 추출
-BeautifulSoup4 + lxml으로 HTML 본문에서 의미 있는 텍스트를 추출한다.
+lxml.html로 HTML 본문에서 의미 있는 텍스트를 추출한다.
 focus 키워드가 있으면 해당 단락을 앞으로 배치한다.
+
+BeautifulSoup 트리를 거치지 않고 lxml 트리를 직접 순회한다.
+(노이즈 제거 1회 · 본문 후보 XPath · 텍스트 조각 수집 1회)
 """
 
+import codecs
 import logging
 import re
 from typing import Optional
 
-from bs4 import BeautifulSoup, NavigableString, Tag
+import lxml.html
+from lxml import etree
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +41,33 @@ _CONTENT_SELECTORS = [
     "#article",
 ]
 
+
+def _selector_finder(selector: str):
+    """
+    _CONTENT_SELECTORS 형식(태그 / [속성='값'] / .클래스 / #id)을
+    "root → 문서 순서상 첫 일치 요소(없으면 None)" 함수로 바꾼다.
+    """
+    if selector.startswith("."):
+        name = selector[1:]
+        # contains(@class) 사전 필터로 class 토큰 비교(concat/normalize-space)를 후보에만 적용
+        xpath = etree.XPath(
+            f"(//*[contains(@class, '{name}')]"
+            f"[contains(concat(' ', normalize-space(@class), ' '), ' {name} ')])[1]"
+        )
+    elif selector.startswith("#"):
+        xpath = etree.XPath(f"(//*[@id='{selector[1:]}'])[1]")
+    elif selector.startswith("["):
+        name, value = selector[1:-1].split("=", 1)
+        xpath = etree.XPath(f"(//*[@{name}={value}])[1]")
+    else:
+        # 태그 선택자: C 수준 iter()는 첫 일치에서 바로 멈춘다 (XPath는 트리 전체를 훑음)
+        return lambda root: next(root.iter(selector), None)
+    return lambda root: next(iter(xpath(root)), None)
+
+
+# 선택자별 탐색 함수는 모듈 로드 시 한 번만 만든다 (XPath 컴파일 포함)
+_CONTENT_FINDERS = [(sel, _selector_finder(sel)) for sel in _CONTENT_SELECTORS]
+
 # ── 텍스트 수집 대상 태그 ─────────────────────────────────────
 _TEXT_TAGS = (
     "h1", "h2", "h3", "h4", "h5", "h6",
@@ -49,14 +81,18 @@ _MIN_FRAGMENT_LEN = 15
 # GPT 토큰 절약을 위한 최대 텍스트 길이
 _MAX_TEXT_LENGTH = 8_000
 
+# 2칸 이상 연속 공백 → 단일 공백 (_clean_text)
+_SPACE_RUN_RE = re.compile(r" {2,}")
+
 
-def extract_text(html: str, focus: str = "") -> str:
+def extract_text(html: str | bytes, focus: str = "", encoding: Optional[str] = None) -> str:
     """
     HTML에서 핵심 본문 텍스트를 추출한다.
 
     Args:
-        html: raw HTML 문자열
+        html: raw HTML 문자열, 또는 fetcher.fetch_page_bytes()가 반환한 bytes
         focus: 주목할 키워드/주제 (있으면 해당 단락을 앞으로 배치)
+        encoding: html이 bytes일 때 그 인코딩 (None이면 utf-8)
 
     Returns:
         정제된 본문 텍스트. 최대 8,000자.
@@ -65,18 +101,23 @@ def extract_text(html: str, focus: str = "") -> str:
         logger.warning("빈 HTML 입력")
         return ""
 
-    try:
-        soup = BeautifulSoup(html, "lxml")
-    except Exception:
-        # lxml 실패 시 html.parser 폴백
-        soup = BeautifulSoup(html, "html.parser")
+    root = _parse_bytes(html, encoding) if isinstance(html, bytes) else _parse_html(html)
+    if root is None:
+        return ""
 
-    # 노이즈 태그 제거 (in-place)
-    for tag in soup.find_all(_NOISE_TAGS):
-        tag.decompose()
+    # 노이즈 태그 제거 (in-place) — 뒤따르는 텍스트(tail)는 남긴다
+    # drop_tree는 tail을 앞 텍스트에 그대로 붙이므로 공백을 하나 끼워 단어가 붙지 않게 한다
+    # ("data<script>…</script>python" → "data python", BeautifulSoup get_text(" ")와 같음)
+    for elem in list(root.iter(*_NOISE_TAGS)):
+        if elem.tail:
+            elem.tail = " " + elem.tail
+        elem.drop_tree()
 
     # 본문 영역 탐색
-    content_node = _find_content_node(soup)
+    body = root.find("body")
+    if body is None:
+        body = root
+    content_node = _find_content_node(root, body)
 
     # 텍스트 조각 수집
     if focus and focus.strip():
@@ -87,12 +128,11 @@ def extract_text(html: str, focus: str = "") -> str:
     text = _clean_text(text)
 
     # 추출 결과가 너무 짧으면 전체 body에서 재시도
-    if len(text) < 200 and content_node is not soup:
+    if len(text) < 200 and content_node is not root:
         logger.warning(
             "본문 추출 텍스트 부족 (%d자), 전체 body에서 재시도", len(text)
         )
-        fallback_node = soup.body if soup.body else soup
-        text = _clean_text(_collect_fragments(fallback_node))
+        text = _clean_text(_collect_fragments(body))
 
     # 최대 길이 제한
     if len(text) > _MAX_TEXT_LENGTH:
@@ -107,40 +147,78 @@ def extract_text(html: str, focus: str = "") -> str:
 # 내부 헬퍼
 # ─────────────────────────────────────────────────────────────
 
-def _find_content_node(soup: BeautifulSoup) -> Tag:
+def _parse_html(html: str):
+    """HTML을 lxml 문서 트리(<html> 요소)로 파싱한다. 실패 시 None."""
+    try:
+        return lxml.html.document_fromstring(html)
+    except ValueError:
+        # <?xml encoding="..."?> 선언이 있는 str은 lxml이 거부하므로 bytes로 재시도
+        try:
+            return lxml.html.document_fromstring(html.encode("utf-8"))
+        except (ValueError, etree.ParserError) as e:
+            logger.warning("HTML 파싱 실패: %s", e)
+            return None
+    except etree.ParserError as e:
+        logger.warning("HTML 파싱 실패: %s", e)
+        return None
+
+
+def _parse_bytes(data: bytes, encoding: Optional[str]):
+    """
+    bytes를 str로 디코딩하지 않고 lxml에 바로 넘긴다 (UTF-8일 때).
+    libxml2와 파이썬의 코덱 이름 해석이 다를 수 있으므로 UTF-8이 아니면 파이썬에서 디코딩한다.
+    """
+    try:
+        codec = codecs.lookup(encoding or "utf-8").name
+    except LookupError:
+        codec = "utf-8"
+    if codec not in ("utf-8", "ascii"):   # ASCII는 UTF-8의 부분집합
+        return _parse_html(data.decode(codec, errors="replace"))
+    # 디코딩은 libxml2 안에서, 주석·공백 전용 노드는 트리에 만들지 않는다
+    # (lxml 파서 객체는 스레드 간 공유하면 안 되므로 호출마다 생성 — 생성 비용은 무시할 수준)
+    parser = lxml.html.HTMLParser(encoding="utf-8", remove_comments=True, remove_blank_text=True)
+    try:
+        return lxml.html.document_fromstring(data, parser=parser)
+    except etree.ParserError as e:
+        logger.warning("HTML 파싱 실패: %s", e)
+        return None
+
+
+def _text_len(node) -> int:
+    """공백을 제외한 텍스트 길이 (BeautifulSoup get_text(strip=True) 길이와 같음)."""
+    return sum(len(t.strip()) for t in node.itertext())
+
+
+def _find_content_node(root, body):
     """
     본문 콘텐츠 노드를 우선순위 선택자로 탐색한다.
-    유효한 노드를 찾지 못하면 body(없으면 soup 전체)를 반환한다.
+    유효한 노드를 찾지 못하면 body(없으면 문서 전체)를 반환한다.
     """
-    for selector in _CONTENT_SELECTORS:
-        try:
-            node = soup.select_one(selector)
-        except Exception:
-            continue
-        if node and len(node.get_text(strip=True)) > 200:
+    for selector, find in _CONTENT_FINDERS:
+        node = find(root)
+        if node is not None and _text_len(node) > 200:
             logger.debug("본문 노드 선택: selector='%s'", selector)
             return node
 
     logger.debug("특정 본문 노드 없음 — body 전체 사용")
-    return soup.body if soup.body else soup
+    return body
 
 
-def _collect_fragments(node: Tag) -> str:
+def _iter_fragments(node):
     """
-    노드 내 모든 텍스트 태그에서 조각을 수집해 하나의 문자열로 합친다.
-    중복 제거: 부모-자식 관계에서 같은 텍스트가 두 번 나오는 걸 방지한다.
+    노드 내 리프 수준 텍스트 태그의 텍스트 조각을 문서 순서대로 한 번의 순회로 내보낸다.
+    - 하위에 텍스트 태그가 있는 요소는 건너뛴다 (예: <p>안에 <h2>가 있으면 <h2>만 수집)
+    - 너무 짧은 조각과 중복 조각(앞 80자 기준)은 제외한다
     """
+    elems = list(node.iter(*_TEXT_TAGS))
     seen: set[str] = set()
-    parts: list[str] = []
 
-    for elem in node.find_all(_TEXT_TAGS):
-        # 하위 블록 태그가 없는 리프 수준 텍스트만 직접 수집
-        # (예: <p>안에 <h2>가 없으면 정상 수집)
-        child_block = elem.find(_TEXT_TAGS)
-        if child_block is not None:
+    for i, elem in enumerate(elems):
+        # 문서 순서상 첫 번째 하위 텍스트 태그는 바로 다음 원소다 → 다음 원소가 자손이면 리프가 아님
+        if i + 1 < len(elems) and _is_ancestor(elem, elems[i + 1]):
             continue
 
-        t = elem.get_text(separator=" ", strip=True)
+        t = " ".join(s for s in (part.strip() for part in elem.itertext()) if s)
         if len(t) < _MIN_FRAGMENT_LEN:
             continue
         # 중복 조각 제거
@@ -148,35 +226,36 @@ def _collect_fragments(node: Tag) -> str:
         if key in seen:
             continue
         seen.add(key)
-        parts.append(t)
+        yield t
 
-    return "\n".join(parts)
 
+def _is_ancestor(elem, other) -> bool:
+    parent = other.getparent()
+    while parent is not None:
+        if parent is elem:
+            return True
+        parent = parent.getparent()
+    return False
 
-def _extract_with_focus(node: Tag, focus: str) -> str:
+
+def _collect_fragments(node) -> str:
+    """
+    노드 내 모든 텍스트 태그에서 조각을 수집해 하나의 문자열로 합친다.
+    중복 제거: 부모-자식 관계에서 같은 텍스트가 두 번 나오는 걸 방지한다.
+    """
+    return "\n".join(_iter_fragments(node))
+
+
+def _extract_with_focus(node, focus: str) -> str:
     """
     focus 키워드 포함 단락을 앞으로 배치하고, 나머지를 뒤에 이어 붙인다.
     """
     keywords = [k.lower() for k in re.split(r"[\s,]+", focus.lower()) if k]
 
-    seen: set[str] = set()
     prioritized: list[str] = []
     rest: list[str] = []
 
-    for elem in node.find_all(_TEXT_TAGS):
-        # 리프 수준만 수집 (중복 방지)
-        if elem.find(_TEXT_TAGS) is not None:
-            continue
-
-        t = elem.get_text(separator=" ", strip=True)
-        if len(t) < _MIN_FRAGMENT_LEN:
-            continue
-
-        key = t[:80]
-        if key in seen:
-            continue
-        seen.add(key)
-
+    for t in _iter_fragments(node):
         if any(kw in t.lower() for kw in keywords):
             prioritized.append(t)
         else:
@@ -194,24 +273,21 @@ def _clean_text(text: str) -> str:
     텍스트 정제:
     - 탭 → 공백
     - 줄 내 연속 공백 → 단일 공백
-    - 3줄 이상 연속 빈 줄 → 2줄
     - 각 줄 앞뒤 공백 제거
+    - 연속 빈 줄 → 빈 줄 1개
     """
-    text = text.replace("\t", " ")
-    text = re.sub(r" {2,}", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
-
-    lines = [line.strip() for line in text.splitlines()]
-
+    # 공백 정리는 replace + 정규식 1회, 줄 정리·빈 줄 축약은 루프 1회
+    # ("\n{3,}" 축약은 아래 빈 줄 축약에 포함되므로 별도 패스가 필요 없다)
+    # 탭 포함 문자 클래스 [ \t]{2,}는 리터럴 접두 검색을 못 써 replace보다 느리다
     result: list[str] = []
     prev_empty = False
-    for line in lines:
-        if not line:
-            if not prev_empty:
-                result.append("")
-            prev_empty = True
-        else:
+    for line in _SPACE_RUN_RE.sub(" ", text.replace("\t", " ")).splitlines():
+        line = line.strip()
+        if line:
             result.append(line)
             prev_empty = False
+        elif not prev_empty:
+            result.append("")
+            prev_empty = True
 
     return "\n".join(result).strip()
@@ -0,0 +1,26 @@
+"""
+tests/test_parser.py — scraper.parser 텍스트 추출 회귀 테스트
+"""
+
+from scraper.parser import extract_text
+
+_FILLER = "본문 텍스트가 충분히 길어야 추출 결과로 인정된다. " * 10
+
+
+def _page(body: str) -> str:
+    return f"<html><body><article><p>{_FILLER}</p>{body}</article></body></html>"
+
+
+def test_noise_tag_tail_keeps_word_boundary():
+    """제거한 노이즈 태그의 앞뒤 텍스트가 공백 없이 붙지 않는다."""
+    text = extract_text(_page("<p>learn data<script>var x = 1;</script>python today</p>"))
+    assert "learn data python today" in text
+    assert "datapython" not in text
+    assert "var x" not in text
+
+
+def test_noise_tag_tail_from_bytes():
+    """bytes 입력(lxml 직접 디코딩 경로)에서도 같다."""
+    html = _page("<p>first block<style>p{}</style>second block</p>").encode("utf-8")
+    text = extract_text(html, encoding="utf-8")
+    assert "first block second block" in text
@@ -11,21 +11,32 @@ YouTube 표준 사이즈로 리사이즈 + 텍스트 합성된다.
 저장 경로:
   output_dir/thumbnails/thumb_landscape_base.png
   output_dir/thumbnails/thumb_shorts_base.png
+
+같은 (프롬프트, 사이즈, 품질) 이미지는 config.THUMBNAIL_CACHE_DIR에 해시 이름으로 보관해
+다른 프로젝트에서도 DALL-E를 다시 호출하지 않고 복사해 쓴다.
 """
 
 import base64
+import hashlib
 import logging
+import os
+import random
+import shutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 import config
+from core import openai_client
 from core.cost_tracker import CostTracker
 
 logger = logging.getLogger(__name__)
 
 _MAX_RETRIES = 3
-_RETRY_DELAY_SEC = 5
+_RETRY_DELAY_SEC = 5      # 백오프 기준 (시도마다 2배, 0~상한 사이 무작위)
+_MAX_RETRY_DELAY_SEC = 60
 
 # DALL-E 3 지원 사이즈
 _LANDSCAPE_SIZE = "1792x1024"
@@ -62,9 +73,7 @@ def generate_thumbnail_image(
     if variant not in ("landscape", "shorts"):
         raise ValueError(f"variant는 'landscape' 또는 'shorts'여야 합니다: {variant!r}")
 
-    from openai import OpenAI
-
-    client = OpenAI(api_key=config.OPENAI_API_KEY)
+    client = openai_client.get_client()
     size = _LANDSCAPE_SIZE if variant == "landscape" else _SHORTS_SIZE
 
     thumbnails_dir = output_dir / "thumbnails"
@@ -78,6 +87,17 @@ def generate_thumbnail_image(
 
     full_prompt = prompt.rstrip() + _STYLE_SUFFIX
 
+    # 프롬프트 해시 캐시 적중 시 API 호출·비용 없이 복사
+    cache_path = _cache_path(full_prompt, size)
+    if cache_path.exists():
+        try:
+            shutil.copyfile(cache_path, save_path)
+        except OSError as e:
+            logger.warning("썸네일 캐시 복사 실패 (%s): %s", variant, e)
+        else:
+            logger.info("썸네일 캐시 사용: %s ← %s", variant, cache_path.name)
+            return save_path
+
     for attempt in range(1, _MAX_RETRIES + 1):
         logger.debug("DALL-E 3 썸네일 시도 %d/%d — %s", attempt, _MAX_RETRIES, variant)
         try:
@@ -92,7 +112,7 @@ def generate_thumbnail_image(
         except Exception as e:
             logger.error("DALL-E 3 썸네일 API 오류 (%s, 시도 %d): %s", variant, attempt, e)
             if attempt < _MAX_RETRIES:
-                time.sleep(_RETRY_DELAY_SEC * attempt)
+                time.sleep(_retry_delay(attempt, e))
                 continue
             return None
 
@@ -106,6 +126,8 @@ def generate_thumbnail_image(
             logger.error("썸네일 이미지 저장 실패 (%s): %s", variant, e)
             return None
 
+        _store_cache(cache_path, img_bytes)
+
         if cost_tracker:
             cost_tracker.add_dalle3(count=1)
 
@@ -115,23 +137,67 @@ def generate_thumbnail_image(
     return None
 
 
+def _cache_path(full_prompt: str, size: str) -> Path:
+    """(프롬프트, 사이즈, 품질)로 정해지는 캐시 파일 경로."""
+    key = hashlib.blake2b(
+        f"{full_prompt}|{size}|{config.IMAGE_QUALITY}".encode("utf-8"), digest_size=16,
+    ).hexdigest()
+    return config.THUMBNAIL_CACHE_DIR / f"{key}.png"
+
+
+def _store_cache(cache_path: Path, img_bytes: bytes) -> None:
+    """생성한 이미지를 캐시에 저장한다. 임시 파일 → os.replace (동시 저장 시 깨진 파일 방지)."""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(img_bytes)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning("썸네일 캐시 저장 실패: %s", e)
+        tmp_path.unlink(missing_ok=True)
+
+
+def _retry_delay(attempt: int, error: Exception) -> float:
+    """
+    재시도 전 대기 시간(초).
+    서버가 Retry-After를 보냈으면(429 등) 그 값을, 아니면 지수 백오프 + full jitter를 쓴다.
+    jitter로 여러 요청이 같은 순간에 다시 몰리지 않게 한다.
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is not None:
+        try:
+            retry_after = float(headers.get("retry-after", ""))
+        except (TypeError, ValueError):
+            retry_after = None
+        if retry_after is not None and retry_after >= 0:
+            return min(retry_after, _MAX_RETRY_DELAY_SEC)
+
+    return random.uniform(0, min(_MAX_RETRY_DELAY_SEC, _RETRY_DELAY_SEC * 2 ** (attempt - 1)))
+
+
 def generate_both_base_images(
     prompt: str,
     output_dir: Path,
     cost_tracker: Optional[CostTracker] = None,
 ) -> dict[str, Optional[Path]]:
     """
-    landscape + shorts 베이스 이미지를 연속으로 생성한다.
+    landscape + shorts 베이스 이미지를 동시에 생성한다.
+    DALL-E 호출은 네트워크 대기가 대부분이므로 두 요청을 함께 보내 전체 시간을 한 건 수준으로 줄인다.
 
     Returns:
         {"landscape": Path | None, "shorts": Path | None}
     """
-    results: dict[str, Optional[Path]] = {}
-    for variant in ("landscape", "shorts"):
-        results[variant] = generate_thumbnail_image(
-            prompt=prompt,
-            output_dir=output_dir,
-            variant=variant,
-            cost_tracker=cost_tracker,
-        )
-    return results
+    variants = ("landscape", "shorts")
+    with ThreadPoolExecutor(max_workers=len(variants)) as executor:
+        futures = {
+            variant: executor.submit(
+                generate_thumbnail_image,
+                prompt=prompt,
+                output_dir=output_dir,
+                variant=variant,
+                cost_tracker=cost_tracker,
+            )
+            for variant in variants
+        }
+        return {variant: future.result() for variant, future in futures.items()}
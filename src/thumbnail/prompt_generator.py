@@ -12,19 +12,24 @@ Returns:
     }
 """
 
-import json
 import logging
-import time
 from pathlib import Path
 from typing import Optional
 
+import requests
+
 import config
+from core import fast_json, llm_cache, openai_client
+from core.codeblock import strip_markdown_codeblock
 from core.cost_tracker import CostTracker
+from prompts._loader import read_cached
 
 logger = logging.getLogger(__name__)
 
-_MAX_RETRIES = 3
-_RETRY_DELAY_SEC = 5
+_MAX_RETRIES = 3           # 네트워크/서버 오류 재시도 (OpenAI SDK 내장 백오프)
+_MAX_PARSE_ATTEMPTS = 2    # 응답 JSON 파싱 실패 시 재요청 횟수
+_API_TIMEOUT_SEC = 60.0
+_OLLAMA_KEEP_ALIVE = "10m"   # 다음 호출(다음 파이프라인 실행)까지 모델을 메모리에 유지
 _PROMPT_FILE = config.PROMPTS_DIR / "thumbnail_system.txt"
 
 # GPT 응답 오버레이 텍스트 길이 제한
@@ -39,6 +44,9 @@ _FALLBACK_SYSTEM = (
     "No extra text outside the JSON."
 )
 
+# Ollama keep-alive 세션 — 호출마다 TCP 연결을 새로 맺지 않는다
+_SESSION = requests.Session()
+
 
 def generate_thumbnail_prompt(
     title_ko: str,
@@ -62,10 +70,22 @@ def generate_thumbnail_prompt(
     system_prompt = _load_system_prompt()
     user_msg = _build_user_message(title_ko, title_en, scenes)
 
+    # 같은 제목·장면으로 재실행하면 캐시 사용 (config.LLM_CACHE_DIR 설정 시, 폴백 결과는 저장 안 함)
+    model = "gpt-4o" if config.SCENARIO_ENGINE == "gpt4o" else config.OLLAMA_MODEL
+    cache_key = llm_cache.make_key("thumbnail_prompt", model, system_prompt, user_msg)
+    cached = llm_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     if config.SCENARIO_ENGINE == "gpt4o":
-        return _call_gpt4o(system_prompt, user_msg, cost_tracker)
+        result = _call_gpt4o(system_prompt, user_msg, cost_tracker)
     else:
-        return _call_ollama(system_prompt, user_msg)
+        result = _call_ollama(system_prompt, user_msg)
+
+    if result is None:
+        return _fallback_result()
+    llm_cache.put(cache_key, result)
+    return result
 
 
 # ─────────────────────────────────────────────
@@ -74,8 +94,9 @@ def generate_thumbnail_prompt(
 
 def _load_system_prompt() -> str:
     """thumbnail_system.txt를 읽는다. 없으면 인라인 폴백 사용."""
-    if _PROMPT_FILE.exists():
-        return _PROMPT_FILE.read_text(encoding="utf-8")
+    text = read_cached(_PROMPT_FILE)
+    if text is not None:
+        return text
     logger.warning("thumbnail_system.txt 없음 — 인라인 폴백 사용")
     return _FALLBACK_SYSTEM
 
@@ -107,13 +128,15 @@ def _call_gpt4o(
     system_prompt: str,
     user_msg: str,
     cost_tracker: Optional[CostTracker],
-) -> dict:
-    from openai import OpenAI
-
-    client = OpenAI(api_key=config.OPENAI_API_KEY)
+) -> Optional[dict]:
+    """GPT-4o로 썸네일 프롬프트를 생성한다. 모든 시도 실패 시 None."""
+    # 429/5xx/연결 오류 재시도는 SDK에 맡긴다 (지수 백오프 + 지터, 공유 연결 풀 유지)
+    client = openai_client.get_client().with_options(
+        max_retries=_MAX_RETRIES, timeout=_API_TIMEOUT_SEC,
+    )
 
-    for attempt in range(1, _MAX_RETRIES + 1):
-        logger.debug("GPT-4o 썸네일 프롬프트 생성 시도 %d/%d", attempt, _MAX_RETRIES)
+    for attempt in range(1, _MAX_PARSE_ATTEMPTS + 1):
+        logger.debug("GPT-4o 썸네일 프롬프트 생성 시도 %d/%d", attempt, _MAX_PARSE_ATTEMPTS)
         try:
             response = client.chat.completions.create(
                 model="gpt-4o",
@@ -126,11 +149,8 @@ def _call_gpt4o(
                 max_tokens=512,
             )
         except Exception as e:
-            logger.error("GPT-4o 썸네일 API 오류 (시도 %d): %s", attempt, e)
-            if attempt < _MAX_RETRIES:
-                time.sleep(_RETRY_DELAY_SEC * attempt)
-                continue
-            return _fallback_result(user_msg)
+            logger.error("GPT-4o 썸네일 API 오류: %s", e)
+            return None
 
         raw = response.choices[0].message.content or ""
 
@@ -147,14 +167,12 @@ def _call_gpt4o(
 
         logger.warning("GPT-4o 응답 파싱 실패 (시도 %d) — 재시도", attempt)
 
-    return _fallback_result(user_msg)
+    return None
 
 
-def _call_ollama(system_prompt: str, user_msg: str) -> dict:
-    """Ollama 로컬 엔진으로 썸네일 프롬프트를 생성한다."""
+def _call_ollama(system_prompt: str, user_msg: str) -> Optional[dict]:
+    """Ollama 로컬 엔진으로 썸네일 프롬프트를 생성한다. 실패 시 None."""
     try:
-        import requests
-
         url = f"{config.OLLAMA_HOST.rstrip('/')}/api/chat"
         payload = {
             "model": config.OLLAMA_MODEL,
@@ -165,8 +183,9 @@ def _call_ollama(system_prompt: str, user_msg: str) -> dict:
             "stream": False,
             "format": "json",
             "options": {"temperature": 0.8, "num_predict": 512},
+            "keep_alive": _OLLAMA_KEEP_ALIVE,
         }
-        resp = requests.post(url, json=payload, timeout=120)
+        resp = _SESSION.post(url, json=payload, timeout=120)
         resp.raise_for_status()
         raw: str = resp.json().get("message", {}).get("content", "")
 
@@ -179,7 +198,7 @@ def _call_ollama(system_prompt: str, user_msg: str) -> dict:
     except Exception as e:
         logger.error("Ollama 썸네일 프롬프트 오류: %s", e)
 
-    return _fallback_result("")
+    return None
 
 
 def _parse_response(raw: str) -> Optional[dict]:
@@ -187,11 +206,22 @@ def _parse_response(raw: str) -> Optional[dict]:
     GPT/Ollama 응답에서 JSON을 파싱해 필수 키를 검증한다.
     Ollama 마크다운 코드블록 제거 후 파싱.
     """
-    cleaned = _strip_markdown_codeblock(raw.strip())
+    cleaned = strip_markdown_codeblock(raw.strip())
     try:
-        data = json.loads(cleaned)
-    except (json.JSONDecodeError, ValueError) as e:
-        logger.warning("썸네일 프롬프트 JSON 파싱 오류: %s | 미리보기: %s...", e, cleaned[:100])
+        data = fast_json.loads(cleaned)
+    except fast_json.JSONDecodeError as e:
+        # Ollama는 JSON 앞뒤에 설명 문장을 붙이는 경우가 많다 — 중괄호 구간만 다시 시도
+        candidate = _extract_json_object(cleaned)
+        try:
+            data = fast_json.loads(candidate) if candidate else None
+        except fast_json.JSONDecodeError:
+            data = None
+        if not isinstance(data, dict):
+            logger.warning("썸네일 프롬프트 JSON 파싱 오류: %s | 미리보기: %s...", e, cleaned[:100])
+            return None
+
+    if not isinstance(data, dict):
+        logger.warning("썸네일 프롬프트 응답이 JSON 객체가 아님: %s", type(data).__name__)
         return None
 
     required = {"image_prompt", "overlay_text_ko", "overlay_text_en"}
@@ -209,25 +239,16 @@ def _parse_response(raw: str) -> Optional[dict]:
     }
 
 
-def _strip_markdown_codeblock(text: str) -> str:
-    """```json ... ``` 또는 ``` ... ``` 블록 내부를 추출한다."""
-    if not text.startswith("```"):
-        return text
-    lines = text.splitlines()
-    inner: list[str] = []
-    in_block = False
-    for line in lines:
-        if not in_block and line.startswith("```"):
-            in_block = True
-            continue
-        if in_block and line.startswith("```"):
-            break
-        if in_block:
-            inner.append(line)
-    return "\n".join(inner) if inner else text
-
-
-def _fallback_result(context: str) -> dict:
+def _extract_json_object(text: str) -> Optional[str]:
+    """앞뒤에 설명 문장이 붙은 응답에서 첫 '{' ~ 마지막 '}' 구간을 꺼낸다."""
+    start = text.find("{")
+    end = text.rfind("}")
+    if start == -1 or end <= start:
+        return None
+    return text[start:end + 1]
+
+
+def _fallback_result() -> dict:
     """API 실패 시 최소한의 폴백 결과를 반환한다."""
     logger.warning("썸네일 프롬프트 폴백 사용")
     return {
@@ -12,13 +12,16 @@ YouTube 표준 썸네일 사이즈:
   - 가로 영상: 하단 80% 위치 (하단 여백 20%)
   - 쇼츠:      하단 88% 위치 (하단 여백 12%)
 
-스타일: 흰색 텍스트 + 검정 스트로크 (stroke_width 4px, subtitle_renderer와 동일 방식)
+스타일: 흰색 텍스트 + 검정 스트로크 (stroke_width 4px, Pillow 네이티브 stroke)
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+from PIL import Image, ImageDraw, ImageFont
+
 import config
 
 logger = logging.getLogger(__name__)
@@ -46,6 +49,13 @@ _STROKE_WIDTH = 4
 _COLOR_WHITE = (255, 255, 255)
 _COLOR_BLACK = (0, 0, 0)
 
+# 썸네일 JPEG 품질
+_JPEG_QUALITY = 90
+
+# (폰트 경로, 크기) → 로드된 FreeTypeFont
+# 4종 썸네일이 같은 TTF를 반복 파싱하지 않도록 (폴백 기본 폰트는 캐시하지 않음)
+_font_cache: dict[tuple[Path, int], object] = {}
+
 
 def apply_text_overlay(
     base_image_path: Path,
@@ -67,12 +77,6 @@ def apply_text_overlay(
     Returns:
         저장된 JPG Path, 실패 시 None
     """
-    try:
-        from PIL import Image, ImageDraw, ImageFont
-    except ImportError:
-        logger.error("Pillow가 설치되지 않았습니다: pip install Pillow")
-        return None
-
     if variant not in ("landscape", "shorts"):
         logger.error("variant는 'landscape' 또는 'shorts'여야 합니다: %r", variant)
         return None
@@ -84,9 +88,15 @@ def apply_text_overlay(
     target_size = _LANDSCAPE_SIZE if variant == "landscape" else _SHORTS_SIZE
 
     # 이미지 열기 + 리사이즈
+    # DALL-E 베이스 PNG는 이미 RGB — convert("RGB")가 만드는 전체 사본을 건너뛴다
+    # (RGBA 등은 픽셀 수가 적은 리사이즈 전에 변환. pillow-simd 설치 시 리사이즈가 AVX2로 실행)
+    # JPEG 원본은 draft()로 디코딩 단계에서 축소하고, 큰 축소 비율은 reducing_gap으로
+    # 박스 축소 후 LANCZOS (PNG·작은 비율에서는 둘 다 아무 일도 하지 않음)
     try:
-        img = Image.open(base_image_path).convert("RGB")
-        img = img.resize(target_size, Image.LANCZOS)
+        with Image.open(base_image_path) as src:
+            src.draft("RGB", target_size)
+            img = src if src.mode == "RGB" else src.convert("RGB")
+            img = img.resize(target_size, Image.Resampling.LANCZOS, reducing_gap=3.0)
     except Exception as e:
         logger.error("이미지 열기/리사이즈 실패: %s", e)
         return None
@@ -94,32 +104,25 @@ def apply_text_overlay(
     draw = ImageDraw.Draw(img)
     font = _load_font(lang, target_size, variant)
 
-    # 텍스트 크기 측정
-    try:
-        bbox = draw.textbbox((0, 0), overlay_text, font=font)
-        text_w = bbox[2] - bbox[0]
-        text_h = bbox[3] - bbox[1]
-    except Exception:
-        text_w, text_h = target_size[0] // 2, 50
-
-    # 텍스트 위치: 수평 중앙, 수직은 설정 비율
-    x = (target_size[0] - text_w) // 2
-    y = int(target_size[1] * _TEXT_Y_RATIO[variant]) - text_h // 2
-
-    # 스트로크 먼저 렌더링 (subtitle_renderer와 동일 방식)
-    for dx in range(-_STROKE_WIDTH, _STROKE_WIDTH + 1):
-        for dy in range(-_STROKE_WIDTH, _STROKE_WIDTH + 1):
-            if dx == 0 and dy == 0:
-                continue
-            draw.text((x + dx, y + dy), overlay_text, font=font, fill=_COLOR_BLACK)
+    # 텍스트 위치: 수평 중앙, 수직은 설정 비율 (anchor="mm" — 별도 textbbox 측정 불필요)
+    x = target_size[0] // 2
+    y = int(target_size[1] * _TEXT_Y_RATIO[variant])
 
-    # 본문 텍스트
-    draw.text((x, y), overlay_text, font=font, fill=_COLOR_WHITE)
+    # 스트로크 + 본문을 한 번에 렌더링 (Pillow 네이티브 stroke — 오프셋별 draw.text 반복 없음)
+    draw.text(
+        (x, y), overlay_text, font=font, fill=_COLOR_WHITE,
+        stroke_width=_STROKE_WIDTH, stroke_fill=_COLOR_BLACK, anchor="mm",
+    )
 
     # 저장
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        img.save(str(output_path), "JPEG", quality=95)
+        # YouTube가 어차피 재인코딩하므로 quality 90 + 4:2:0으로 충분 (파일 크기·인코딩 시간 감소)
+        # optimize(허프만 최적화 2-pass)·progressive는 끈다
+        img.save(
+            str(output_path), "JPEG",
+            quality=_JPEG_QUALITY, subsampling=2, optimize=False, progressive=False,
+        )
         logger.info("썸네일 저장 완료: %s", output_path.name)
         return output_path
     except Exception as e:
@@ -161,19 +164,26 @@ def generate_all_thumbnails(
         ("shorts_en",    base_shorts_path,    overlay_text_en, "shorts",    "en"),
     ]
 
-    results: dict[str, Optional[Path]] = {}
-    for key, base_path, text, variant, lang in specs:
-        if base_path is None:
-            logger.warning("베이스 이미지 없음 — %s 건너뜀", key)
-            results[key] = None
-            continue
-        results[key] = apply_text_overlay(
-            base_image_path=base_path,
-            overlay_text=text,
-            output_path=thumbnails_dir / f"thumb_{key}.jpg",
-            variant=variant,
-            lang=lang,
-        )
+    # 4종은 출력 파일·폰트(언어×크기)가 모두 달라 공유 상태가 없다
+    # Pillow의 디코드·리사이즈·렌더·JPEG 인코딩은 GIL을 풀므로 스레드로 겹친다
+    futures = {}
+    with ThreadPoolExecutor(max_workers=len(specs)) as executor:
+        for key, base_path, text, variant, lang in specs:
+            if base_path is None:
+                logger.warning("베이스 이미지 없음 — %s 건너뜀", key)
+                continue
+            futures[key] = executor.submit(
+                apply_text_overlay,
+                base_image_path=base_path,
+                overlay_text=text,
+                output_path=thumbnails_dir / f"thumb_{key}.jpg",
+                variant=variant,
+                lang=lang,
+            )
+    results: dict[str, Optional[Path]] = {
+        key: futures[key].result() if key in futures else None
+        for key, *_ in specs
+    }
 
     success = sum(1 for v in results.values() if v is not None)
     logger.info("썸네일 생성 완료: %d/4종", success)
@@ -186,14 +196,19 @@ def generate_all_thumbnails(
 
 def _load_font(lang: str, target_size: tuple[int, int], variant: str):
     """언어와 영상 타입에 맞는 Pillow 폰트를 로드한다."""
-    from PIL import ImageFont
-
     font_path = config.FONT_KO_PATH if lang == "ko" else config.FONT_EN_PATH
     font_size = int(target_size[0] * _FONT_RATIO[variant])
 
+    key = (font_path, font_size)
+    font = _font_cache.get(key)
+    if font is not None:
+        return font
+
     if font_path.exists():
         try:
-            return ImageFont.truetype(str(font_path), font_size)
+            font = ImageFont.truetype(str(font_path), font_size)
+            _font_cache[key] = font
+            return font
         except Exception as e:
             logger.warning("폰트 로드 실패 (%s): %s — 기본 폰트 사용", font_path.name, e)
 
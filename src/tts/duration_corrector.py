@@ -6,13 +6,38 @@ TTS 생성 후 실제 MP3 길이를 측정해 scene의 duration_sec를 덮어쓴
 """
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
+
+try:
+    from mutagen.mp3 import MP3 as _MP3
+except ImportError:
+    _MP3 = None
 
 logger = logging.getLogger(__name__)
 
 # 빈 파일(narration 없음)의 fallback duration
 _EMPTY_FILE_FALLBACK_SEC = 2.0
 
+_MAX_WORKERS = 8   # 동시 길이 측정 상한 (파일 읽기·pydub의 ffmpeg 하위 프로세스가 겹치도록)
+
+# pydub AudioSegment — 마지막 폴백에서만 필요하므로 처음 쓸 때 import (None=미시도, False=미설치)
+_pydub = None
+
+# ── MPEG Layer III 헤더 표 (_fast_mp3_duration) ──────────────
+# 버전 비트(00=2.5, 10=2, 11=1; 01은 예약) → (비트레이트 kbps 표, 샘플레이트 표, 프레임당 샘플 수)
+_L3_BITRATES_V1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+_L3_BITRATES_V2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+_L3_VERSIONS = {
+    0b11: (_L3_BITRATES_V1, (44100, 48000, 32000), 1152),
+    0b10: (_L3_BITRATES_V2, (22050, 24000, 16000), 576),
+    0b00: (_L3_BITRATES_V2, (11025, 12000, 8000), 576),
+}
+_MP3_HEAD_READ = 8 * 1024   # 첫 프레임 4개 + Xing/LAME 태그를 담기에 충분
+_MIN_SYNC_FRAMES = 4        # 연속 유효 프레임 수 (오탐 방지 — mutagen과 동일 기준)
+
 
 def correct_durations(scenes: list[dict], audio_paths: list[Path]) -> list[dict]:
     """
@@ -31,10 +56,16 @@ def correct_durations(scenes: list[dict], audio_paths: list[Path]) -> list[dict]
             len(scenes), len(audio_paths),
         )
 
-    corrected = []
-    for i, (scene, audio_path) in enumerate(zip(scenes, audio_paths)):
-        duration = _get_duration(audio_path)
+    paths = audio_paths[:len(scenes)]
+    if len(paths) > 1:
+        # executor.map은 입력 순서대로 결과를 돌려준다
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(paths))) as executor:
+            durations = list(executor.map(_get_duration, paths))
+    else:
+        durations = [_get_duration(p) for p in paths]
 
+    corrected = []
+    for i, (scene, duration) in enumerate(zip(scenes, durations)):
         if duration <= 0:
             duration = _EMPTY_FILE_FALLBACK_SEC
             logger.debug(
@@ -58,26 +89,34 @@ def correct_durations(scenes: list[dict], audio_paths: list[Path]) -> list[dict]
 def _get_duration(path: Path) -> float:
     """
     MP3 파일의 재생 시간(초)을 반환한다.
-    mutagen 우선 → pydub 대체 → 파일 크기 추정 순으로 시도한다.
+    헤더 직접 파싱 → mutagen → pydub → 파일 크기 추정 순으로 시도한다.
     """
     if not path.exists() or path.stat().st_size == 0:
         return 0.0
 
-    # 1차: mutagen (순수 파이썬, ffmpeg 불필요)
+    # 0차: 헤더 직접 파싱 (mutagen과 같은 값 — 확신할 수 없는 파일은 None → mutagen)
     try:
-        from mutagen.mp3 import MP3
-        audio = MP3(str(path))
-        return float(audio.info.length)
-    except Exception:
-        pass
+        duration = _fast_mp3_duration(path)
+    except OSError:
+        duration = None
+    if duration is not None:
+        return duration
+
+    # 1차: mutagen (순수 파이썬, ffmpeg 불필요)
+    if _MP3 is not None:
+        try:
+            return float(_MP3(str(path)).info.length)
+        except Exception:
+            pass
 
     # 2차: pydub (ffmpeg 필요, 프로젝트 이미 의존)
-    try:
-        from pydub import AudioSegment
-        seg = AudioSegment.from_file(str(path))
-        return len(seg) / 1000.0
-    except Exception:
-        pass
+    audio_segment = _load_pydub()
+    if audio_segment:
+        try:
+            seg = audio_segment.from_file(str(path))
+            return len(seg) / 1000.0
+        except Exception:
+            pass
 
     # 3차: 파일 크기 기반 추정 (128kbps MP3 가정)
     size_bytes = path.stat().st_size
@@ -86,3 +125,124 @@ def _get_duration(path: Path) -> float:
         "%s 길이 측정 실패 → 크기 기반 추정 %.1f초", path.name, estimated
     )
     return estimated
+
+
+def _load_pydub():
+    """pydub.AudioSegment를 반환한다. 미설치면 False. (결과는 모듈 전역에 보관)"""
+    global _pydub
+    if _pydub is None:
+        try:
+            from pydub import AudioSegment as _pydub
+        except ImportError:
+            _pydub = False
+    return _pydub
+
+
+def _fast_mp3_duration(path: Path) -> Optional[float]:
+    """
+    MP3 앞부분 몇 KB만 읽어 재생 시간을 계산한다. (mutagen import·프레임 탐색 없음)
+    ID3v2 건너뛰기 → 첫 MPEG Layer III 프레임 헤더 해석 →
+    Xing/Info 태그가 있으면 총 프레임 수(LAME 인코더 지연·패딩 제외)로,
+    없으면 CBR로 보고 (파일 크기 - 오디오 시작 위치) × 8 / 비트레이트로 계산한다.
+    오디오가 ID3 바로 뒤에서 시작하지 않거나, VBRI·Layer I/II 등 확신할 수 없는 형식이면 None.
+    """
+    with open(path, "rb") as f:
+        offset = 0
+        while True:   # ID3v2 태그가 여러 개 붙은 파일도 있다
+            f.seek(offset)
+            tag = f.read(10)
+            if len(tag) < 10 or tag[:3] != b"ID3":
+                break
+            size = (tag[6] & 0x7F) << 21 | (tag[7] & 0x7F) << 14 | (tag[8] & 0x7F) << 7 | (tag[9] & 0x7F)
+            if not size:
+                break
+            offset += 10 + size
+        f.seek(offset)
+        data = f.read(_MP3_HEAD_READ)
+        file_size = os.fstat(f.fileno()).st_size
+
+    first = _parse_l3_header(data, 0)
+    if first is None:
+        return None
+    bitrate, sample_rate, samples_per_frame, frame_length, xing_offset = first
+
+    # Xing/Info 태그 (VBR 또는 LAME CBR)
+    xing = data[xing_offset:xing_offset + 8]
+    if xing[:4] in (b"Xing", b"Info"):
+        flags = int.from_bytes(xing[4:8], "big")
+        if flags & 0x1:
+            pos = xing_offset + 8
+            frames = int.from_bytes(data[pos:pos + 4], "big")
+            pos += 4 * (1 + bool(flags & 0x2)) + 100 * bool(flags & 0x4) + 4 * bool(flags & 0x8)
+            samples = frames * samples_per_frame
+            lame = data[pos:pos + 24]
+            if len(lame) < 24:
+                return None
+            if lame[:4] == b"LAME":
+                if _has_lame_extension(lame):
+                    if lame[9] >> 4:   # 확장 헤더 리비전 0만 정의돼 있다
+                        return None
+                    samples -= (lame[21] << 4 | lame[22] >> 4) + ((lame[22] & 0x0F) << 8 | lame[23])
+            elif lame[:5] == b"L3.99":
+                return None   # 드문 변형 버전 문자열 — mutagen에 맡긴다
+            return max(samples, 0) / sample_rate
+        # 프레임 수가 없는 Xing 태그 → 아래 CBR 추정과 같다
+    elif data[36:40] == b"VBRI":
+        return None
+    else:
+        # 태그 없는 프레임은 연속 유효 프레임으로 오탐이 아님을 확인
+        pos = frame_length
+        for _ in range(_MIN_SYNC_FRAMES - 1):
+            frame = _parse_l3_header(data, pos)
+            if frame is None:
+                return None
+            pos += frame[3]
+
+    return (file_size - offset) * 8 / bitrate
+
+
+def _has_lame_extension(lame: bytes) -> bool:
+    """
+    "LAME3.xx" 버전 문자열 뒤에 인코더 지연·패딩이 든 확장 헤더가 있는지 판단한다.
+    (3.90 이상 — 단, "LAME3.90 (alpha)"처럼 괄호가 붙은 3.90 초기 빌드는 제외)
+    """
+    version = lame[4:20]
+    if version[:2] != b"3.":
+        return False
+    digits = len(version) - len(version[2:].lstrip(b"0123456789")) - 2
+    if not digits or len(version) - 2 - digits < 11:
+        return False
+    minor = int(version[2:2 + digits])
+    if minor < 90:
+        return False
+    return not (minor == 90 and version[-11:-10] == b"(")
+
+
+def _parse_l3_header(data: bytes, pos: int) -> Optional[tuple[int, int, int, int, int]]:
+    """
+    data[pos:]의 MPEG Layer III 프레임 헤더를 해석한다.
+    반환: (비트레이트 bps, 샘플레이트, 프레임당 샘플 수, 프레임 길이, data 내 Xing 태그 위치). 유효하지 않으면 None.
+    """
+    if len(data) < pos + 4:
+        return None
+    b0, b1, b2, b3 = data[pos:pos + 4]
+    if b0 != 0xFF or (b1 & 0xE0) != 0xE0 or (b1 >> 1) & 0b11 != 0b01:   # 동기 비트, Layer III
+        return None
+    spec = _L3_VERSIONS.get((b1 >> 3) & 0b11)
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 0b11
+    if spec is None or bitrate_index in (0, 0xF) or rate_index == 0b11:
+        return None
+
+    bitrates, rates, samples_per_frame = spec
+    bitrate = bitrates[bitrate_index] * 1000
+    sample_rate = rates[rate_index]
+    padding = (b2 >> 1) & 1
+    frame_length = (samples_per_frame // 8 * bitrate) // sample_rate + padding
+
+    mono = (b3 >> 6) == 0b11
+    if samples_per_frame == 1152:
+        xing_offset = 21 if mono else 36
+    else:
+        xing_offset = 13 if mono else 21
+    return bitrate, sample_rate, samples_per_frame, frame_length, pos + xing_offset
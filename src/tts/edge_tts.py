@@ -3,6 +3,7 @@ tts/edge_tts.py — Edge TTS 음성 생성 (무료 로컬 대안)
 
 Microsoft Edge TTS를 사용해 narration을 MP3로 저장한다.
 API 키 불필요, 비용 0원.
+씬 전체를 이벤트 루프 하나에서 동시에 합성한다. (세마포어로 동시 연결 수 제한)
 """
 
 import asyncio
@@ -15,6 +16,8 @@ from core.cost_tracker import CostTracker
 
 logger = logging.getLogger(__name__)
 
+_MAX_CONCURRENCY = 4   # 동시 합성 상한 (무료 서비스 — 과도한 동시 연결 자제)
+
 
 def synthesize(
     scenes: list[dict],
@@ -37,46 +40,40 @@ def synthesize(
     """
     voice = config.EDGE_TTS_KO_VOICE if lang == "ko" else config.EDGE_TTS_EN_VOICE
     paths: list[Path] = []
+    jobs: list[tuple[int, str, Path]] = []   # (scene_id, narration, out_path)
 
     for i, scene in enumerate(scenes):
         scene_id = scene.get("scene_id", i + 1)
         narration = scene.get("narration", "").strip()
         out_path = output_dir / f"scene_{scene_id:03d}.mp3"
+        paths.append(out_path)
 
         if not narration:
             logger.warning("scene[%d] narration 없음 — 빈 파일 생성", scene_id)
             out_path.write_bytes(b"")
-            paths.append(out_path)
             continue
 
         if out_path.exists() and out_path.stat().st_size > 0:
             logger.debug("scene[%d] 캐시 사용: %s", scene_id, out_path.name)
-            paths.append(out_path)
             continue
 
-        try:
-            _run_async(_generate_speech(narration, voice, out_path))
-            logger.debug("scene[%d] Edge TTS 완료: %s", scene_id, out_path.name)
-        except Exception as e:
-            logger.error("scene[%d] Edge TTS 실패: %s", scene_id, e)
-            out_path.write_bytes(b"")
+        jobs.append((scene_id, narration, out_path))
 
-        paths.append(out_path)
+    # 이벤트 루프(·GUI 환경의 작업 스레드)는 씬마다가 아니라 한 번만 만든다
+    if jobs:
+        run_async(_synthesize_all(jobs, voice))
 
     logger.info("Edge TTS 완료: %d개 파일 (%s)", len(paths), lang)
     return paths
 
 
-# ─────────────────────────────────────────────
-# 내부 헬퍼
-# ─────────────────────────────────────────────
-
-def _run_async(coro) -> None:
+def run_async(coro):
     """
     이미 실행 중인 이벤트 루프(GUI 환경) 여부와 무관하게 코루틴을 실행한다.
     PyQt6는 자체 이벤트 루프를 가지므로 asyncio.run() 직접 호출 시
     'RuntimeError: This event loop is already running' 발생.
     → 실행 중인 루프가 있으면 별도 스레드에서 새 이벤트 루프로 실행한다.
+    코루틴의 반환값을 그대로 반환한다. (openai_tts도 사용)
     """
     import concurrent.futures
 
@@ -87,19 +84,39 @@ def _run_async(coro) -> None:
 
     if running_loop and running_loop.is_running():
         with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-            future = pool.submit(asyncio.run, coro)
-            future.result()
-    else:
-        asyncio.run(coro)
+            return pool.submit(asyncio.run, coro).result()
+    return asyncio.run(coro)
 
 
-async def _generate_speech(text: str, voice: str, out_path: Path) -> None:
-    """edge_tts.Communicate로 음성을 생성하고 파일로 저장한다."""
-    import edge_tts
+# ─────────────────────────────────────────────
+# 내부 헬퍼
+# ─────────────────────────────────────────────
+
+async def _synthesize_all(jobs: list[tuple[int, str, Path]], voice: str) -> None:
+    """모든 씬을 한 이벤트 루프에서 동시에 생성한다. 실패한 씬은 빈 파일을 남긴다."""
+    # edge_tts import와 속도 문자열은 실행당 한 번만 (씬마다 반복하지 않음)
+    try:
+        import edge_tts
+    except ImportError:
+        logger.error("edge-tts가 설치되지 않았습니다: pip install edge-tts")
+        for _, _, out_path in jobs:
+            out_path.write_bytes(b"")
+        return
 
     rate = _speed_to_rate_str(config.TTS_SPEED)
-    communicate = edge_tts.Communicate(text=text, voice=voice, rate=rate)
-    await communicate.save(str(out_path))
+    sem = asyncio.Semaphore(_MAX_CONCURRENCY)
+
+    async def _bounded(scene_id: int, narration: str, out_path: Path) -> None:
+        try:
+            async with sem:
+                communicate = edge_tts.Communicate(text=narration, voice=voice, rate=rate)
+                await communicate.save(str(out_path))
+            logger.debug("scene[%d] Edge TTS 완료: %s", scene_id, out_path.name)
+        except Exception as e:
+            logger.error("scene[%d] Edge TTS 실패: %s", scene_id, e)
+            out_path.write_bytes(b"")
+
+    await asyncio.gather(*(_bounded(*job) for job in jobs))
 
 
 def _speed_to_rate_str(speed: float) -> str:
@@ -3,17 +3,23 @@ tts/openai_tts.py — OpenAI TTS 음성 생성
 
 각 씬의 narration을 OpenAI TTS API(tts-1)로 변환해 MP3로 저장한다.
 이미 생성된 파일은 재사용해 API 비용을 절약한다.
+씬별 요청은 서로 독립이므로 AsyncOpenAI로 동시에 보낸다. (세마포어로 동시 요청 수 제한)
 """
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import Optional
 
 import config
+from core import openai_client
 from core.cost_tracker import CostTracker
+from tts.edge_tts import run_async
 
 logger = logging.getLogger(__name__)
 
+_MAX_CONCURRENCY = 8   # 동시 TTS 요청 상한 (Rate Limit 대응)
+
 
 def synthesize(
     scenes: list[dict],
@@ -33,49 +39,82 @@ def synthesize(
     Returns:
         씬 순서에 맞는 Path 목록 (빈 narration → 빈 파일)
     """
-    from openai import OpenAI
-
-    client = OpenAI(api_key=config.OPENAI_API_KEY)
     voice = config.TTS_KO_VOICE if lang == "ko" else config.TTS_EN_VOICE
     paths: list[Path] = []
+    jobs: list[tuple[int, str, Path]] = []   # (scene_id, narration, out_path)
 
     for i, scene in enumerate(scenes):
         scene_id = scene.get("scene_id", i + 1)
         narration = scene.get("narration", "").strip()
         out_path = output_dir / f"scene_{scene_id:03d}.mp3"
+        paths.append(out_path)
 
         # narration 없음 → 빈 파일
         if not narration:
             logger.warning("scene[%d] narration 없음 — 빈 파일 생성", scene_id)
             out_path.write_bytes(b"")
-            paths.append(out_path)
             continue
 
         # 이미 생성된 파일 재사용 (체크포인트 재시작 대응)
         if out_path.exists() and out_path.stat().st_size > 0:
             logger.debug("scene[%d] 캐시 사용: %s", scene_id, out_path.name)
-            paths.append(out_path)
             continue
 
-        try:
-            response = client.audio.speech.create(
-                model="tts-1",
-                voice=voice,
-                input=narration,
-                speed=config.TTS_SPEED,
-                response_format="mp3",
-            )
-            response.stream_to_file(out_path)
-            logger.debug("scene[%d] TTS 완료: %s", scene_id, out_path.name)
-
-            if cost_tracker:
-                cost_tracker.add_tts(len(narration))
+        jobs.append((scene_id, narration, out_path))
 
-        except Exception as e:
-            logger.error("scene[%d] TTS 실패: %s", scene_id, e)
-            out_path.write_bytes(b"")
-
-        paths.append(out_path)
+    if jobs:
+        run_async(_synthesize_all(jobs, voice, cost_tracker))
 
     logger.info("OpenAI TTS 완료: %d개 파일 (%s)", len(paths), lang)
     return paths
+
+
+# ─────────────────────────────────────────────
+# 내부 헬퍼
+# ─────────────────────────────────────────────
+
+async def _synthesize_all(
+    jobs: list[tuple[int, str, Path]],
+    voice: str,
+    cost_tracker: Optional[CostTracker],
+) -> None:
+    """모든 씬을 하나의 AsyncOpenAI 클라이언트로 동시 요청한다."""
+    sem = asyncio.Semaphore(_MAX_CONCURRENCY)
+    # 비동기 연결 풀은 이벤트 루프에 묶이므로 이번 실행 동안만 쓰고 닫는다
+    async with openai_client.new_async_client() as client:
+        await asyncio.gather(
+            *(
+                _synthesize_one(client, sem, scene_id, narration, out_path, voice, cost_tracker)
+                for scene_id, narration, out_path in jobs
+            )
+        )
+
+
+async def _synthesize_one(
+    client,
+    sem: asyncio.Semaphore,
+    scene_id: int,
+    narration: str,
+    out_path: Path,
+    voice: str,
+    cost_tracker: Optional[CostTracker],
+) -> None:
+    """씬 하나를 TTS로 변환해 저장한다. 실패하면 빈 파일을 남긴다."""
+    try:
+        # 스트리밍 응답 — MP3 전체를 메모리에 올리지 않고 청크 단위로 파일에 쓴다
+        async with sem, client.audio.speech.with_streaming_response.create(
+            model="tts-1",
+            voice=voice,
+            input=narration,
+            speed=config.TTS_SPEED,
+            response_format="mp3",
+        ) as response:
+            await response.stream_to_file(out_path)
+        logger.debug("scene[%d] TTS 완료: %s", scene_id, out_path.name)
+
+        if cost_tracker:
+            cost_tracker.add_tts(len(narration))
+
+    except Exception as e:
+        logger.error("scene[%d] TTS 실패: %s", scene_id, e)
+        out_path.write_bytes(b"")
@@ -4,13 +4,21 @@ uploader/oauth_handler.py — Google OAuth2 인증 처리
 한국어 채널("ko")과 영어 채널("en")의 토큰을 분리 관리한다.
 토큰 파일이 있으면 재사용하고, 만료 시 자동 갱신한다.
 토큰이 없으면 브라우저를 열어 신규 인증한다.
+
+토큰은 Credentials.to_json() 형식(token_{lang}.json)으로 저장한다.
+예전 버전의 token_{lang}.pickle이 있으면 처음 로드할 때 JSON으로 옮긴다.
 """
 
+import json
 import logging
-import pickle
+import os
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 
+import config
+
 logger = logging.getLogger(__name__)
 
 # YouTube 업로드 + 채널 관리에 필요한 최소 스코프
@@ -19,11 +27,72 @@ SCOPES = [
     "https://www.googleapis.com/auth/youtube",
 ]
 
+# is_authenticated 결과 캐시 — GUI가 버튼 상태용으로 자주 호출한다
+# lang → (time.monotonic() 기준 확인 시각, 결과). 토큰 저장·삭제 시 무효화
+_AUTH_CACHE_TTL_SEC = 30.0
+_auth_cache: dict[str, tuple[float, bool]] = {}
+
+# 브라우저 신규 인증은 한 번에 하나씩 (ko/en 업로드를 동시에 시작해도 인증 창이 겹치지 않도록)
+_flow_lock = threading.Lock()
+
 
 def _get_token_path(lang: str) -> Path:
     """채널별 토큰 파일 경로를 반환한다."""
-    import config
-    return config.DATABASE_DIR / f"token_{lang}.pickle"
+    return config.DATABASE_DIR / f"token_{lang}.json"
+
+
+def _get_legacy_token_path(lang: str) -> Path:
+    """예전 pickle 토큰 파일 경로 (마이그레이션용)."""
+    return _get_token_path(lang).with_suffix(".pickle")
+
+
+def load_credentials(lang: str = "ko"):
+    """
+    저장된 OAuth 토큰을 google.oauth2.credentials.Credentials로 로드한다.
+    토큰이 없거나 손상됐으면 None. (갱신·재인증은 하지 않는다)
+    """
+    from google.oauth2.credentials import Credentials
+
+    token_path = _get_token_path(lang)
+    if token_path.exists():
+        try:
+            info = json.loads(token_path.read_text(encoding="utf-8"))
+            return Credentials.from_authorized_user_info(info, SCOPES)
+        except Exception as e:
+            logger.warning("[%s] 토큰 파일 손상 — 재인증 필요: %s", lang, e)
+            return None
+
+    # 예전 pickle 토큰 → JSON으로 한 번만 옮긴다
+    legacy_path = _get_legacy_token_path(lang)
+    if not legacy_path.exists():
+        return None
+    try:
+        import pickle
+        with open(legacy_path, "rb") as f:
+            creds = pickle.load(f)
+    except Exception as e:
+        logger.warning("[%s] 예전 토큰 파일 손상 — 재인증 필요: %s", lang, e)
+        return None
+    if creds is not None and _save_credentials(lang, creds):
+        legacy_path.unlink(missing_ok=True)
+        logger.info("[%s] pickle 토큰을 JSON으로 변환", lang)
+    return creds
+
+
+def _save_credentials(lang: str, creds) -> bool:
+    """토큰을 JSON으로 저장한다. 임시 파일에 쓴 뒤 os.replace로 교체한다."""
+    token_path = _get_token_path(lang)
+    tmp_path = token_path.with_suffix(".tmp")
+    try:
+        tmp_path.write_text(creds.to_json(), encoding="utf-8")
+        os.replace(tmp_path, token_path)
+        _auth_cache.pop(lang, None)
+    except Exception as e:
+        logger.warning("[%s] 토큰 저장 실패 (다음 실행 시 재인증 필요): %s", lang, e)
+        tmp_path.unlink(missing_ok=True)
+        return False
+    logger.debug("[%s] 토큰 저장 완료: %s", lang, token_path)
+    return True
 
 
 def get_authenticated_service(lang: str = "ko"):
@@ -34,7 +103,7 @@ def get_authenticated_service(lang: str = "ko"):
     반환: googleapiclient.discovery.Resource (youtube v3)
 
     최초 실행 시 브라우저 인증 창이 열린다.
-    이후에는 저장된 토큰(token_{lang}.pickle)을 재사용한다.
+    이후에는 저장된 토큰(token_{lang}.json)을 재사용한다.
     """
     try:
         from google.auth.transport.requests import Request
@@ -48,20 +117,10 @@ def get_authenticated_service(lang: str = "ko"):
             "google-api-python-client"
         ) from e
 
-    import config
-
-    token_path = _get_token_path(lang)
-    creds: Optional[Credentials] = None
-
     # 저장된 토큰 로드
-    if token_path.exists():
-        try:
-            with open(token_path, "rb") as f:
-                creds = pickle.load(f)
-            logger.debug("[%s] 저장된 OAuth 토큰 로드", lang)
-        except Exception as e:
-            logger.warning("[%s] 토큰 파일 손상 — 재인증 필요: %s", lang, e)
-            creds = None
+    creds: Optional[Credentials] = load_credentials(lang)
+    if creds:
+        logger.debug("[%s] 저장된 OAuth 토큰 로드", lang)
 
     # 토큰 갱신 또는 신규 인증
     if not creds or not creds.valid:
@@ -86,16 +145,13 @@ def get_authenticated_service(lang: str = "ko"):
             flow = InstalledAppFlow.from_client_secrets_file(client_secret, SCOPES)
             # GUI 환경에서는 redirect_uri를 별도로 처리해야 할 수 있으나
             # 현재는 로컬 서버 방식으로 처리
-            creds = flow.run_local_server(port=0)
+            with _flow_lock:
+                logger.info("[%s] 브라우저 OAuth 인증 시작", lang)
+                creds = flow.run_local_server(port=0)
             logger.info("[%s] OAuth 신규 인증 완료", lang)
 
         # 토큰 저장 (다음 실행에서 재사용)
-        try:
-            with open(token_path, "wb") as f:
-                pickle.dump(creds, f)
-            logger.debug("[%s] 토큰 저장 완료: %s", lang, token_path)
-        except Exception as e:
-            logger.warning("[%s] 토큰 저장 실패 (다음 실행 시 재인증 필요): %s", lang, e)
+        _save_credentials(lang, creds)
 
     return build("youtube", "v3", credentials=creds)
 
@@ -103,24 +159,59 @@ def get_authenticated_service(lang: str = "ko"):
 def revoke_token(lang: str = "ko") -> None:
     """저장된 OAuth 토큰을 삭제해 다음 실행 시 재인증을 강제한다."""
     token_path = _get_token_path(lang)
-    if token_path.exists():
-        token_path.unlink()
+    legacy_path = _get_legacy_token_path(lang)
+    _auth_cache.pop(lang, None)
+    if token_path.exists() or legacy_path.exists():
+        token_path.unlink(missing_ok=True)
+        legacy_path.unlink(missing_ok=True)
         logger.info("[%s] OAuth 토큰 삭제 완료", lang)
     else:
         logger.info("[%s] 삭제할 토큰 파일 없음", lang)
 
 
 def is_authenticated(lang: str = "ko") -> bool:
-    """저장된 유효 토큰이 있는지 확인한다 (API 호출 없음)."""
+    """저장된 유효 토큰이 있는지 확인한다 (API 호출 없음, 결과는 30초 캐시)."""
+    now = time.monotonic()
+    hit = _auth_cache.get(lang)
+    if hit is not None and now - hit[0] < _AUTH_CACHE_TTL_SEC:
+        return hit[1]
+    result = _check_authenticated(lang)
+    _auth_cache[lang] = (now, result)
+    return result
+
+
+def _check_authenticated(lang: str) -> bool:
+    """토큰 파일을 읽어 is_authenticated 결과를 계산한다."""
     token_path = _get_token_path(lang)
     if not token_path.exists():
+        if not _get_legacy_token_path(lang).exists():
+            return False
+        try:
+            creds = load_credentials(lang)   # 예전 pickle 토큰 → JSON 변환
+        except ImportError:
+            return False
+        return creds is not None and (creds.valid or bool(creds.refresh_token))
+
+    # JSON만 읽어 판단 — google 인증 라이브러리 import 없음
+    try:
+        info = json.loads(token_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
         return False
+    if info.get("refresh_token"):
+        return True
+    return bool(info.get("token")) and _expiry_in_future(info.get("expiry"))
+
+
+def _expiry_in_future(expiry: Optional[str]) -> bool:
+    """to_json()의 expiry(UTC ISO 문자열, 없으면 만료 없음)가 아직 지나지 않았는지."""
+    if not expiry:
+        return True
+    from datetime import datetime, timezone
     try:
-        with open(token_path, "rb") as f:
-            creds = pickle.load(f)
-        return creds is not None and (creds.valid or bool(creds.refresh_token))
-    except Exception:
+        expires_at = datetime.fromisoformat(expiry.rstrip("Z")).replace(tzinfo=timezone.utc)
+    except ValueError:
         return False
+    return expires_at > datetime.now(timezone.utc)
 
 
 class OAuthError(Exception):
@@ -5,16 +5,41 @@ resumable upload로 대용량 영상 파일을 안정적으로 업로드한다.
 업로드 완료 후 thumbnails.set으로 썸네일을 설정한다.
 """
 
+import contextlib
 import logging
+import mmap
+import os
+import random
+import socket
+import ssl
+import stat
 import time
 from pathlib import Path
 
+try:
+    from googleapiclient.errors import HttpError
+    from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
+except ImportError:
+    HttpError = MediaFileUpload = MediaIoBaseUpload = None
+
+import config
+
 logger = logging.getLogger(__name__)
 
-_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MB — resumable 청크 크기
+_CHUNK_UNIT = 256 * 1024                   # resumable 청크는 256KB 배수여야 한다 (YouTube 규격)
+_SINGLE_SHOT_MAX = 100 * 1024 * 1024       # 이보다 작은 파일은 청크 없이 요청 1회로 전송
+_READ_BUFFER = 1024 * 1024                 # mmap을 못 쓸 때 파일 읽기 버퍼 (기본 8KB 대신)
 _MAX_RETRIES = 5                # 서버 오류 시 최대 재시도 횟수
+_MAX_BACKOFF_SEC = 64           # 재시도 대기 상한 (full jitter: 0 ~ min(상한, 2^retry)초)
 _RETRY_STATUSES = {500, 502, 503, 504}  # 재시도 대상 HTTP 상태 코드
 
+# 재시도 대상 네트워크 예외 (httplib2는 google-api-python-client 의존성)
+try:
+    from httplib2 import HttpLib2Error
+    _TRANSIENT_ERRORS: tuple = (socket.timeout, ConnectionError, ssl.SSLError, HttpLib2Error)
+except ImportError:
+    _TRANSIENT_ERRORS = (socket.timeout, ConnectionError, ssl.SSLError)
+
 
 def upload_video(
     video_path: str,
@@ -31,31 +56,31 @@ def upload_video(
     lang:           "ko" | "en" (채널 OAuth 토큰 선택에 사용)
     반환: 업로드된 영상의 video_id (str)
     """
-    try:
-        from googleapiclient.http import MediaFileUpload
-        from googleapiclient.errors import HttpError
-    except ImportError as e:
+    if MediaFileUpload is None:
         raise UploadError(
             "google-api-python-client 미설치.\n"
             "pip install google-api-python-client"
-        ) from e
+        )
 
     from uploader.oauth_handler import get_authenticated_service
 
+    # stat 한 번으로 존재 확인과 크기(로그·청크 크기 결정)를 함께 얻는다
     video_path = Path(video_path)
-    if not video_path.exists():
-        raise FileNotFoundError(f"영상 파일 없음: {video_path}")
+    try:
+        video_size = os.stat(video_path).st_size
+    except FileNotFoundError:
+        raise FileNotFoundError(f"영상 파일 없음: {video_path}") from None
 
     youtube = get_authenticated_service(lang)
 
     logger.info("[%s] 업로드 시작: %s (%.1f MB)", lang, video_path.name,
-                video_path.stat().st_size / 1024 / 1024)
+                video_size / 1024 / 1024)
 
-    video_id = _upload_file(youtube, video_path, metadata)
+    video_id = _upload_file(youtube, video_path, video_size, metadata)
     logger.info("[%s] 업로드 완료 — video_id: %s", lang, video_id)
 
     thumb_path = Path(thumbnail_path) if thumbnail_path else None
-    if thumb_path and thumb_path.exists():
+    if thumb_path and _is_file(thumb_path):
         _set_thumbnail(youtube, video_id, thumb_path)
         logger.info("[%s] 썸네일 설정 완료", lang)
     else:
@@ -68,31 +93,60 @@ def upload_video(
 # 내부 헬퍼
 # ─────────────────────────────────────────────
 
-def _upload_file(youtube, video_path: Path, metadata: dict) -> str:
+def _upload_file(youtube, video_path: Path, video_size: int, metadata: dict) -> str:
     """
     resumable upload를 실행하고 video_id를 반환한다.
-    서버 오류(5xx) 발생 시 지수적 대기 후 재시도한다.
+    서버 오류(5xx)·네트워크 오류 발생 시 무작위(full jitter) 지수 대기 후 재시도한다.
     """
-    from googleapiclient.http import MediaFileUpload
-    from googleapiclient.errors import HttpError
-
     body = {
         "snippet": metadata["snippet"],
         "status":  metadata["status"],
     }
-    media = MediaFileUpload(
-        str(video_path),
-        mimetype="video/mp4",
-        chunksize=_CHUNK_SIZE,
-        resumable=True,
-    )
-
-    request = youtube.videos().insert(
-        part="snippet,status",
-        body=body,
-        media_body=media,
-    )
+    with _open_video_media(video_path, video_size) as media:
+        request = youtube.videos().insert(
+            part="snippet,status",
+            body=body,
+            media_body=media,
+        )
+        response = _run_resumable(request, video_path)
+
+    video_id: str = response.get("id", "")
+    if not video_id:
+        raise UploadError("업로드 응답에 video_id 없음")
+    return video_id
+
+
+@contextlib.contextmanager
+def _open_video_media(video_path: Path, video_size: int):
+    """
+    영상 파일을 mmap으로 열어 MediaIoBaseUpload를 만든다.
+    http.client가 본문을 8KB 블록으로 읽을 때 블록마다 read() 시스템 콜 대신 메모리 복사만 한다.
+    Windows(매핑 중 파일 잠금)나 빈 파일은 1MB 버퍼로 연 파일을 쓴다.
+    """
+    chunksize = _chunk_size(video_size)
+    if MediaIoBaseUpload is None:
+        yield MediaFileUpload(str(video_path), mimetype="video/mp4", chunksize=chunksize, resumable=True)
+        return
+
+    # MediaFileUpload는 기본 버퍼(8KB)로 파일을 연다 — 청크 하나에 read()가 수천 번 호출된다
+    with open(video_path, "rb", buffering=_READ_BUFFER) as f:
+        mm = None
+        if os.name != "nt":
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):   # 빈 파일 등 매핑 불가
+                mm = None
+        if mm is None:
+            yield MediaIoBaseUpload(f, mimetype="video/mp4", chunksize=chunksize, resumable=True)
+            return
+        try:
+            yield MediaIoBaseUpload(mm, mimetype="video/mp4", chunksize=chunksize, resumable=True)
+        finally:
+            mm.close()
+
 
+def _run_resumable(request, video_path: Path) -> dict:
+    """next_chunk()를 끝까지 반복해 업로드 응답을 반환한다. 재시도 한도를 넘으면 UploadError."""
     response = None
     retry = 0
 
@@ -110,29 +164,74 @@ def _upload_file(youtube, video_path: Path, metadata: dict) -> str:
                     raise UploadError(
                         f"최대 재시도 초과 (HTTP {e.resp.status}): {video_path.name}"
                     ) from e
-                wait = 2 ** retry  # 지수적 대기: 2, 4, 8, 16, 32초
+                wait = _backoff(retry)
                 logger.warning(
-                    "서버 오류 %d — %d초 후 재시도 (%d/%d)",
+                    "서버 오류 %d — %.1f초 후 재시도 (%d/%d)",
                     e.resp.status, wait, retry, _MAX_RETRIES,
                 )
+                _log_resume_point(request)
                 time.sleep(wait)
             else:
                 raise UploadError(
                     f"업로드 실패 (HTTP {e.resp.status}): {e.reason}"
                 ) from e
 
+        except _TRANSIENT_ERRORS as e:
+            # 일시적 네트워크 오류 — 세션 URI가 유지되므로 마지막 청크부터 이어서 보낸다
+            retry += 1
+            if retry > _MAX_RETRIES:
+                raise UploadError(f"네트워크 오류로 업로드 실패: {e}") from e
+            wait = _backoff(retry)
+            logger.warning(
+                "네트워크 오류 — %.1f초 후 재시도 (%d/%d): %r",
+                wait, retry, _MAX_RETRIES, e,
+            )
+            _log_resume_point(request)
+            time.sleep(wait)
+
         except Exception as e:
             retry += 1
             if retry > _MAX_RETRIES:
                 raise UploadError(f"예상치 못한 업로드 오류: {e}") from e
-            wait = 2 ** retry
-            logger.warning("업로드 오류 — %d초 후 재시도: %s", wait, e)
+            wait = _backoff(retry)
+            logger.warning("업로드 오류 — %.1f초 후 재시도: %s", wait, e)
             time.sleep(wait)
 
-    video_id: str = response.get("id", "")
-    if not video_id:
-        raise UploadError("업로드 응답에 video_id 없음")
-    return video_id
+    return response
+
+
+def _is_file(path: Path) -> bool:
+    """os.stat 한 번으로 일반 파일인지 확인한다."""
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
+def _backoff(retry: int) -> float:
+    """재시도 대기 시간(초). ko/en 워커가 동시에 실패해도 재시도 시점이 겹치지 않도록 무작위화한다."""
+    return random.uniform(0, min(_MAX_BACKOFF_SEC, 2 ** retry))
+
+
+def _log_resume_point(request) -> None:
+    """중단된 업로드를 이어갈 세션 URI와 전송된 바이트 수를 기록한다. (디버그용)"""
+    uri = getattr(request, "resumable_uri", None)
+    if uri:
+        logger.debug(
+            "resumable 세션 유지: %s (전송 %d bytes)",
+            uri, getattr(request, "resumable_progress", 0),
+        )
+
+
+def _chunk_size(file_size: int) -> int:
+    """
+    resumable 업로드 청크 크기를 반환한다.
+    작은 파일은 -1(파일 전체를 요청 1회로), 그 외에는 config 값을 256KB 배수로 내림한다.
+    """
+    if file_size < _SINGLE_SHOT_MAX:
+        return -1
+    chunk = int(config.YOUTUBE_UPLOAD_CHUNK_SIZE) // _CHUNK_UNIT * _CHUNK_UNIT
+    return max(chunk, _CHUNK_UNIT)
 
 
 def _set_thumbnail(youtube, video_id: str, thumbnail_path: Path) -> None:
@@ -140,9 +239,6 @@ def _set_thumbnail(youtube, video_id: str, thumbnail_path: Path) -> None:
     업로드된 영상에 썸네일을 설정한다.
     썸네일 실패는 영상 업로드 자체를 실패시키지 않는다.
     """
-    from googleapiclient.http import MediaFileUpload
-    from googleapiclient.errors import HttpError
-
     media = MediaFileUpload(str(thumbnail_path), mimetype="image/jpeg")
     try:
         youtube.thumbnails().set(
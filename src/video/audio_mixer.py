@@ -0,0 +1,146 @@
+"""
+video/audio_mixer.py — ffmpeg로 TTS 연결 + BGM 믹스
+
+moviepy의 concatenate_audioclips + CompositeAudioClip은 TTS 파일을 모두 numpy로 디코딩해
+파이썬에서 샘플 단위로 더한다. 같은 작업을 ffmpeg 한 번으로 처리한다.
+  - TTS: 장면 순서대로 concat 필터로 이어 붙인다
+    narration이 없는 장면(빈 파일)은 그 장면 길이만큼 무음(anullsrc)을 넣어 뒤 장면과 싱크를 맞춘다
+  - BGM: -stream_loop -1로 무한 루프 → volume 필터로 덕킹
+  - amix로 합치고 -t로 영상 길이에서 자른다
+
+결과는 PCM WAV로 저장한다. 최종 AAC 인코딩은 write_videofile이 하므로 손실 압축을 두 번 거치지 않는다.
+ffmpeg 실행이 실패하면 None을 반환하고, 호출한 쪽은 기존 moviepy 합성으로 처리한다.
+"""
+
+import logging
+import os
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+import config
+
+logger = logging.getLogger(__name__)
+
+_SAMPLE_RATE = 44100
+_TIMEOUT_SEC = 300
+_NO_WINDOW = 0x08000000 if os.name == "nt" else 0   # Windows: 콘솔 창 띄우지 않음 (CREATE_NO_WINDOW)
+
+# 장면별 오디오 구간 — (TTS 파일 경로, 장면 길이). 경로가 None이면 장면 길이만큼 무음
+Segment = tuple[Optional[str], float]
+
+
+def mix_tts_and_bgm(
+    segments: list[Segment],
+    bgm_path: Optional[str],
+    total_duration: float,
+    out_path: Path,
+) -> Optional[Path]:
+    """
+    장면별 TTS(또는 무음)를 이어 붙이고 BGM(루프·덕킹)을 섞어 out_path(WAV)에 저장한다.
+
+    Parameters
+    ----------
+    segments       : 장면 순서의 (TTS 경로 | None, 장면 길이) 목록
+    bgm_path       : BGM 파일 경로 (없으면 None → TTS만)
+    total_duration : 결과 오디오 최대 길이 (영상 길이)
+    out_path       : 저장할 WAV 경로
+
+    Returns
+    -------
+    Path | None  — 실패하면 None
+    """
+    segments = [(path, dur) for path, dur in segments if path is not None or dur > 0]
+    if not segments and not bgm_path:
+        return None
+
+    cmd = [_ffmpeg_binary(), "-y", "-hide_banner", "-loglevel", "error"]
+    filters: list[str] = []
+    n_inputs = 0
+
+    if segments:
+        labels = []
+        for i, (path, dur) in enumerate(segments):
+            if path is None:
+                filters.append(
+                    f"anullsrc=r={_SAMPLE_RATE}:cl=stereo,atrim=duration={dur:.3f}[s{i}]"
+                )
+            else:
+                cmd += ["-i", str(path)]
+                # concat 필터는 입력 형식이 같아야 한다 (무음 구간과 맞춤)
+                filters.append(
+                    f"[{n_inputs}:a]aformat=sample_rates={_SAMPLE_RATE}:channel_layouts=stereo[s{i}]"
+                )
+                n_inputs += 1
+            labels.append(f"[s{i}]")
+        filters.append(f"{''.join(labels)}concat=n={len(labels)}:v=0:a=1[tts]")
+
+    if bgm_path:
+        cmd += ["-stream_loop", "-1", "-i", str(bgm_path)]
+        filters.append(f"[{n_inputs}:a]volume={config.BGM_VOLUME_RATIO}[bg]")
+
+    if segments and bgm_path:
+        # normalize=0 — 입력 수로 나누지 않는다 (CompositeAudioClip처럼 단순 합)
+        filters.append("[tts][bg]amix=inputs=2:duration=longest:dropout_transition=0:normalize=0[aout]")
+    else:
+        filters.append(f"{'[tts]' if segments else '[bg]'}anull[aout]")
+
+    cmd += [
+        "-filter_complex", ";".join(filters),
+        "-map", "[aout]",
+        "-t", f"{total_duration:.3f}",
+        "-ar", str(_SAMPLE_RATE),
+        "-ac", "2",
+        "-c:a", "pcm_s16le",
+        str(out_path),
+    ]
+
+    try:
+        subprocess.run(
+            cmd,
+            check=True,
+            capture_output=True,
+            timeout=_TIMEOUT_SEC,
+            creationflags=_NO_WINDOW,
+        )
+    except subprocess.CalledProcessError as e:
+        stderr = e.stderr.decode("utf-8", errors="replace").strip()
+        logger.warning("ffmpeg 오디오 믹스 실패 — moviepy로 합성: %s", stderr[-500:])
+        out_path.unlink(missing_ok=True)
+        return None
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.warning("ffmpeg 오디오 믹스 실행 불가 — moviepy로 합성: %s", e)
+        out_path.unlink(missing_ok=True)
+        return None
+
+    logger.debug(
+        "ffmpeg 오디오 믹스 완료: 구간 %d개 (TTS %d), BGM=%s", len(segments), n_inputs, bool(bgm_path)
+    )
+    return out_path
+
+
+def silence_clip(duration: float):
+    """moviepy 폴백용 스테레오 무음 AudioClip."""
+    from moviepy.audio.AudioClip import AudioClip
+
+    def make_frame(t):
+        if np.ndim(t):
+            return np.zeros((len(t), 2))
+        return np.zeros(2)
+
+    return AudioClip(make_frame, duration=duration, fps=_SAMPLE_RATE)
+
+
+# ─────────────────────────────────────────────
+# 내부 헬퍼
+# ─────────────────────────────────────────────
+
+def _ffmpeg_binary() -> str:
+    """moviepy가 쓰는 ffmpeg(imageio-ffmpeg 번들 포함)와 같은 실행 파일을 쓴다."""
+    try:
+        from moviepy.config import get_setting
+        return get_setting("FFMPEG_BINARY")
+    except Exception:
+        return "ffmpeg"
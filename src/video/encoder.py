@@ -1,24 +1,21 @@
 """
 video/encoder.py — ffmpeg 인코딩 설정
 moviepy의 write_videofile에 전달할 ffmpeg 파라미터를 중앙 관리한다.
-config.VIDEO_RESOLUTION / VIDEO_BITRATE / VIDEO_FPS 를 참조한다.
+config.VIDEO_RESOLUTION / VIDEO_BITRATE / VIDEO_FPS / VIDEO_PRESET / VIDEO_CRF / VIDEO_TUNE 을 참조한다.
 """
 
 import logging
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 import config
 
 logger = logging.getLogger(__name__)
 
-# ffmpeg libx264 프리셋 (속도 vs 압축률 트레이드오프)
-# "medium" → 대부분 환경에서 적절한 균형
-_FFMPEG_PRESET = "medium"
-
-# CRF 값 (낮을수록 고품질, 파일 큰 편)
-# 23 = libx264 기본값, 18 = 시각적 무손실에 가까움
-_CRF = "23"
+# 키프레임 간격 — 정지 화면 구간에 불필요한 키프레임을 넣지 않는다
+# (scenecut은 기본값 유지: 장면 전환 컷에서는 키프레임이 들어가는 편이 화질·탐색에 유리)
+_X264_PARAMS = "keyint=250:min-keyint=25"
 
 
 def get_write_params(is_shorts: bool = False) -> dict[str, Any]:
@@ -45,8 +42,10 @@ def get_write_params(is_shorts: bool = False) -> dict[str, Any]:
         "fps": config.VIDEO_FPS,
         "bitrate": config.VIDEO_BITRATE,
         "ffmpeg_params": [
-            "-preset", _FFMPEG_PRESET,
-            "-crf", _CRF,
+            "-preset", config.VIDEO_PRESET,
+            "-crf", str(config.VIDEO_CRF),
+            "-tune", config.VIDEO_TUNE,
+            "-x264-params", _X264_PARAMS,
             "-movflags", "+faststart",   # 웹 스트리밍 최적화 (메타데이터 앞 배치)
             "-pix_fmt", "yuv420p",       # 유튜브 호환성
         ],
@@ -67,7 +66,7 @@ def encode(
     clip,
     output_path: Path,
     is_shorts: bool = False,
-    threads: int = 2,
+    threads: Optional[int] = None,
 ) -> Path:
     """
     moviepy VideoClip을 ffmpeg로 인코딩해 파일로 저장한다.
@@ -77,14 +76,14 @@ def encode(
     clip        : moviepy CompositeVideoClip 등
     output_path : 저장할 파일 경로
     is_shorts   : 쇼츠 여부 (인코딩 파라미터 선택에만 사용)
-    threads     : ffmpeg 스레드 수 (기본 2 — 다중 영상 병렬 처리 고려)
+    threads     : ffmpeg 스레드 수 (None이면 CPU 코어를 동시 합성 수로 나눈 값, 최소 2)
 
     Returns
     -------
     Path  — 저장된 파일 경로
     """
     params = get_write_params(is_shorts=is_shorts)
-    params["threads"] = threads
+    params["threads"] = threads or _default_threads()
 
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -94,3 +93,9 @@ def encode(
     logger.info("인코딩 완료: %s (%.1f MB)", output_path.name, output_path.stat().st_size / 1e6)
 
     return output_path
+
+
+def _default_threads() -> int:
+    """동시에 합성하는 영상(config.PARALLEL_ENCODES)끼리 CPU 코어를 나눠 쓴다."""
+    workers = max(1, int(config.PARALLEL_ENCODES))
+    return max(2, (os.cpu_count() or 2) // workers)
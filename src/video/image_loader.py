@@ -0,0 +1,58 @@
+"""
+video/image_loader.py — 장면 이미지 로드 + 리사이즈 캐시
+
+같은 장면 이미지가 한 영상 안에서 여러 번 쓰이면(이미지 수 < 장면 수, 쇼츠의 scene_id 중복)
+리사이즈를 매번 다시 한다. (경로, mtime, 목표 크기)를 키로 결과 배열을 보관해 재사용한다.
+반환 배열은 캐시와 공유하므로 읽기 전용이다. (ImageClip·슬라이스 대입은 원본을 수정하지 않는다)
+1080p 프레임 하나가 약 6MB이므로 합성이 끝나면 clear_cache()로 비운다.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+from PIL import Image
+
+# 리사이즈 필터 — 4탭 BICUBIC. 8탭 LANCZOS와의 차이는 H.264 인코딩 후 눈에 띄지 않는다
+# (1024² → 1080p 확대 기준 약 10%, 축소 시에는 탭 수 차이만큼 더 빠름)
+_RESAMPLE = Image.Resampling.BICUBIC
+
+_CACHE_MAX = 64
+_cache: dict[tuple[str, int, int, int], np.ndarray] = {}
+_cache_lock = threading.Lock()
+
+
+def load_resized(image_path: Union[str, Path], width: int, height: int) -> np.ndarray:
+    """이미지를 RGB로 읽어 (width, height)로 리사이즈한 배열을 반환한다."""
+    path = str(image_path)
+    key = (path, os.stat(path).st_mtime_ns, width, height)
+    cached = _cache.get(key)
+    if cached is not None:
+        return cached
+
+    with Image.open(path) as src:
+        img = src if src.mode == "RGB" else src.convert("RGB")
+        arr = np.asarray(img.resize((width, height), _RESAMPLE))
+    arr.flags.writeable = False
+
+    with _cache_lock:
+        if len(_cache) >= _CACHE_MAX:
+            _cache.pop(next(iter(_cache)))   # 가장 오래된 항목 제거
+        _cache[key] = arr
+    return arr
+
+
+def load_fitted(image_path: Union[str, Path], box_w: int, box_h: int) -> np.ndarray:
+    """비율을 유지한 채 (box_w, box_h) 안에 들어가도록 리사이즈한 배열을 반환한다. (letterbox용)"""
+    with Image.open(str(image_path)) as src:   # 헤더만 읽는다
+        img_w, img_h = src.size
+    scale = min(box_w / img_w, box_h / img_h)
+    return load_resized(image_path, int(img_w * scale), int(img_h * scale))
+
+
+def clear_cache() -> None:
+    """리사이즈 캐시를 비운다."""
+    with _cache_lock:
+        _cache.clear()
@@ -4,19 +4,20 @@ video/landscape_composer.py — 5분 영상 합성 (16:9)
 
 합성 순서:
   1. 장면별 이미지 → ImageClip (duration = scene.duration_sec)
-  2. 장면별 TTS 오디오 → AudioFileClip
-  3. 전체 TTS 오디오 연결 → CompositeAudioClip (concat)
-  4. BGM AudioFileClip → TTS 대비 BGM_VOLUME_RATIO 볼륨으로 덕킹
-  5. 이미지 CUT 전환 → concatenate_videoclips (method="compose")
-  6. 자막 오버레이 → CompositeVideoClip
-  7. encoder.encode() 호출
+  2. 전체 TTS 오디오 연결 + BGM(TTS 대비 BGM_VOLUME_RATIO 볼륨으로 덕킹)
+     → audio_mixer(ffmpeg)로 WAV 하나에 믹스 (실패 시 moviepy CompositeAudioClip)
+  3. 이미지 CUT 전환 → concatenate_videoclips (method="chain")
+  4. 자막 오버레이 → CompositeVideoClip
+  5. encoder.encode() 호출
 """
 
 import logging
+import os
 from pathlib import Path
 from typing import Union
 
 import config
+from video import audio_mixer, image_loader
 from video.subtitle_renderer import build_subtitle_clips
 from video.encoder import encode
 
@@ -26,47 +27,69 @@ logger = logging.getLogger(__name__)
 def _load_image_clip(image_path: Union[str, Path], duration: float, width: int, height: int):
     """이미지를 로드해 지정 해상도로 리사이즈한 ImageClip을 반환한다."""
     from moviepy.editor import ImageClip
-    from PIL import Image
-    import numpy as np
 
-    img = Image.open(str(image_path)).convert("RGB")
-    img = img.resize((width, height), Image.LANCZOS)
-    arr = np.array(img)
+    # 같은 이미지가 반복되면 리사이즈 결과를 재사용한다 (배열 공유 — ImageClip은 수정하지 않음)
+    arr = image_loader.load_resized(image_path, width, height)
     return ImageClip(arr).set_duration(duration)
 
 
-def _build_audio(audio_paths: list[str], bgm_path: str, total_duration: float):
+def _build_audio(
+    audio_paths: list[str],
+    scenes: list[dict],
+    bgm_path: str,
+    total_duration: float,
+    mix_path: Path,
+):
     """
-    TTS 오디오 배열 + BGM을 합성해 CompositeAudioClip을 반환한다.
+    TTS 오디오 배열 + BGM을 합성해 오디오 클립을 반환한다.
+    narration이 없는 장면(빈 파일)은 장면 길이만큼 무음으로 채워 이후 장면의 싱크를 유지한다.
     BGM은 total_duration에 맞게 루프하거나 잘라서 덕킹 처리한다.
+    ffmpeg로 mix_path(WAV)에 한 번에 믹스하고, 실패하면 moviepy로 합성한다.
     """
     from moviepy.editor import AudioFileClip, CompositeAudioClip, concatenate_audioclips
 
-    # TTS 클립 연결
-    tts_clips = []
-    for p in audio_paths:
-        if Path(p).exists():
-            tts_clips.append(AudioFileClip(str(p)))
-        else:
-            logger.warning("TTS 오디오 파일 없음: %s", p)
-
-    if not tts_clips:
+    # 장면별 (TTS 경로 | None=무음, 장면 길이)
+    segments: list[audio_mixer.Segment] = []
+    for p, scene in zip(audio_paths, scenes):
+        dur = float(scene.get("duration_sec", config.SCENE_TARGET_SEC))
+        # stat 한 번으로 존재·빈 파일(narration 없는 장면)을 함께 확인
+        try:
+            size = os.stat(p).st_size
+        except OSError:
+            logger.warning("TTS 오디오 파일 없음 — 무음 처리: %s", p)
+            size = 0
+        segments.append((str(p) if size > 0 else None, dur))
+
+    if all(path is None for path, _ in segments):
         return None
 
-    tts_audio = concatenate_audioclips(tts_clips)
-
-    if not bgm_path or not Path(bgm_path).exists():
+    has_bgm = bool(bgm_path) and Path(bgm_path).exists()
+    if not has_bgm:
         logger.warning("BGM 파일 없음 — TTS만 사용")
+
+    mixed = audio_mixer.mix_tts_and_bgm(
+        segments, str(bgm_path) if has_bgm else None, total_duration, mix_path
+    )
+    if mixed is not None:
+        return AudioFileClip(str(mixed))
+
+    # ── 폴백: moviepy 합성 ──
+    tts_audio = concatenate_audioclips([
+        AudioFileClip(path) if path else audio_mixer.silence_clip(dur)
+        for path, dur in segments
+    ])
+
+    if not has_bgm:
         return tts_audio
 
     # BGM 로드 → 전체 duration에 맞게 처리
     bgm = AudioFileClip(str(bgm_path))
     if bgm.duration < total_duration:
-        # 루프: 필요한 반복 횟수만큼 연결
-        from moviepy.editor import concatenate_audioclips as _cat
-        repeats = int(total_duration / bgm.duration) + 1
-        bgm = _cat([bgm] * repeats)
-    bgm = bgm.subclip(0, total_duration)
+        # 루프: 같은 AudioFileClip(리더 1개)을 반복해 total_duration에서 자른다
+        from moviepy.audio.fx.all import audio_loop
+        bgm = audio_loop(bgm, duration=total_duration)
+    else:
+        bgm = bgm.subclip(0, total_duration)
 
     # 볼륨 덕킹
     bgm = bgm.volumex(config.BGM_VOLUME_RATIO)
@@ -119,16 +142,20 @@ def compose_landscape(
         clip = _load_image_clip(image_paths[img_idx], dur, w, h)
         image_clips.append(clip)
 
-    video = concatenate_videoclips(image_clips, method="compose")
+    # 모든 장면 클립이 같은 해상도 — "chain"은 프레임마다 합성 캔버스를 만들지 않고 해당 클립 프레임을 그대로 쓴다
+    video = concatenate_videoclips(image_clips, method="chain")
 
     # ── 2. 자막 오버레이 ──────────────────────────────────
-    subtitle_clips = build_subtitle_clips(scenes, w, h, lang=lang)
-    if subtitle_clips:
-        video = CompositeVideoClip([video] + subtitle_clips)
+    # 자막이 없으면 CompositeVideoClip으로 감싸지 않는다 (프레임마다 합성 레이어를 거치지 않음)
+    if config.SUBTITLE_ENABLED:
+        subtitle_clips = build_subtitle_clips(scenes, w, h, lang=lang)
+        if subtitle_clips:
+            video = CompositeVideoClip([video] + subtitle_clips)
 
     # ── 3. 오디오 합성 ────────────────────────────────────
     total_dur = video.duration
-    audio = _build_audio(audio_paths, bgm_path, total_dur)
+    mix_path = output_path.with_name(f"{output_path.stem}_audio.wav")
+    audio = _build_audio(audio_paths, scenes, bgm_path, total_dur, mix_path)
     if audio is not None:
         video = video.set_audio(audio)
 
@@ -137,6 +164,10 @@ def compose_landscape(
 
     # 메모리 해제
     video.close()
+    if audio is not None:
+        audio.close()   # 믹스 WAV 리더를 닫아야 삭제할 수 있다 (Windows)
+    image_loader.clear_cache()
+    mix_path.unlink(missing_ok=True)
 
     logger.info("landscape 합성 완료: %s", result.name)
     return result
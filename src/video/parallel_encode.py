@@ -0,0 +1,64 @@
+"""
+video/parallel_encode.py — 영상 합성·인코딩 병렬 실행
+
+landscape/shorts × ko/en 4개 영상은 서로 독립이고, 각각 moviepy 프레임 생성(GIL)과
+libx264 인코딩으로 CPU를 쓴다. config.PARALLEL_ENCODES개 프로세스에서 동시에 합성한다.
+
+moviepy 클립은 pickle할 수 없으므로 워커에는 합성 함수와 인자(scene dict, 파일 경로)만 넘기고
+클립은 워커 안에서 다시 만든다. GUI 설정 탭에서 바꾼 config 값은 워커 시작 시 그대로 옮긴다.
+PARALLEL_ENCODES가 1 이하이면 현재 프로세스에서 순서대로 실행한다.
+"""
+
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# (합성 함수, kwargs) — 함수는 모듈 최상위 함수여야 한다 (프로세스 간 전달)
+ComposeJob = tuple[Callable[..., Path], dict]
+
+_SETTING_TYPES = (str, int, float, bool, Path)
+
+
+def run_compose_jobs(jobs: list[ComposeJob]) -> list[Path]:
+    """
+    합성 작업들을 실행하고 결과 경로를 jobs 순서대로 반환한다.
+    하나라도 실패하면 그 예외를 그대로 올린다.
+    """
+    workers = min(int(config.PARALLEL_ENCODES), len(jobs))
+    if workers <= 1:
+        return [fn(**kwargs) for fn, kwargs in jobs]
+
+    logger.info("영상 %d개 병렬 합성 (프로세스 %d개)", len(jobs), workers)
+    # spawn — 파이프라인은 GUI(Qt) 워커 스레드에서도 돌므로 fork로 스레드 상태를 복제하지 않는다
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(_config_snapshot(),),
+    ) as pool:
+        futures = [pool.submit(fn, **kwargs) for fn, kwargs in jobs]
+        return [future.result() for future in futures]
+
+
+# ─────────────────────────────────────────────
+# 내부 헬퍼
+# ─────────────────────────────────────────────
+
+def _config_snapshot() -> dict:
+    """현재 프로세스의 config 값(대문자, 단순 타입)을 dict로 만든다."""
+    return {
+        key: value
+        for key, value in vars(config).items()
+        if key.isupper() and isinstance(value, _SETTING_TYPES)
+    }
+
+
+def _init_worker(settings: dict) -> None:
+    """워커 프로세스 시작 시 부모의 config 값을 반영한다."""
+    config.apply_settings(settings)
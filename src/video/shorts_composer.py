@@ -19,13 +19,15 @@ BUG-04 해결: shorts 시나리오의 scene_id 기반으로 landscape audio_path
 """
 
 import logging
+import os
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 import config
+from video import audio_mixer, image_loader
 from video.subtitle_renderer import build_subtitle_clips
 from video.encoder import encode
 
@@ -52,91 +54,127 @@ def _render_title_bar(title: str, width: int, height: int, lang: str) -> np.ndar
     max_chars = 25
     display_text = title if len(title) <= max_chars else title[:max_chars - 1] + "…"
 
-    bbox = draw.textbbox((0, 0), display_text, font=font)
-    tw = bbox[2] - bbox[0]
-    th = bbox[3] - bbox[1]
-    x = (width - tw) / 2
-    y = (height - th) / 2
-
-    # 스트로크
-    sw = config.SUBTITLE_STROKE_WIDTH
-    for dx in range(-sw, sw + 1):
-        for dy in range(-sw, sw + 1):
-            if dx == 0 and dy == 0:
-                continue
-            draw.text((x + dx, y + dy), display_text, font=font, fill="black")
-    draw.text((x, y), display_text, font=font, fill="white")
+    # 중앙 기준 배치 (anchor="mm" — textbbox로 따로 측정하지 않는다)
+    x = width / 2
+    y = height / 2
+
+    # 스트로크 + 본문을 한 번에 렌더링 (Pillow 네이티브 stroke)
+    draw.text(
+        (x, y), display_text, font=font, fill="white", anchor="mm",
+        stroke_width=config.SUBTITLE_STROKE_WIDTH, stroke_fill="black",
+    )
 
     return np.array(img)
 
 
+def _title_bar_rgb(title: str, sw: int, sh: int, lang: str) -> np.ndarray:
+    """
+    검은 배경에 합성된 제목 바(RGB)를 반환한다.
+    제목 바 아래는 항상 검은 캔버스이므로 한 번 합성해 두면 모든 장면에 그대로 복사할 수 있다.
+    """
+    title_h = int(sh * _TITLE_HEIGHT_RATIO)
+    title_img = Image.fromarray(_render_title_bar(title, sw, title_h, lang), "RGBA")
+    bar = Image.new("RGB", (sw, title_h), (0, 0, 0))
+    bar.paste(title_img, (0, 0), title_img)  # alpha 마스크 사용
+    return np.asarray(bar)
+
+
 def _make_scene_frame(
     image_path: str,
-    title: str,
+    title_bar: np.ndarray,
     sw: int,
     sh: int,
-    lang: str,
 ) -> np.ndarray:
     """
     한 장면의 쇼츠 프레임(sw×sh, RGB)을 생성한다.
     - 검은 배경
-    - 상단: 반투명 제목 바
+    - 상단: 반투명 제목 바 (_title_bar_rgb로 미리 합성한 것)
     - 중간: 원본 이미지 (비율 유지 letterbox)
     - 하단: 여백
     """
-    canvas = Image.new("RGB", (sw, sh), (0, 0, 0))
+    canvas = np.zeros((sh, sw, 3), dtype=np.uint8)
 
-    title_h = int(sh * _TITLE_HEIGHT_RATIO)
+    title_h = title_bar.shape[0]
     bottom_h = int(sh * _BOTTOM_PAD_RATIO)
     image_area_h = sh - title_h - bottom_h
 
-    # 이미지 로드 → 이미지 영역에 맞게 letterbox 리사이즈
-    img = Image.open(str(image_path)).convert("RGB")
-    img_w, img_h = img.size
-    scale = min(sw / img_w, image_area_h / img_h)
-    new_w = int(img_w * scale)
-    new_h = int(img_h * scale)
-    img = img.resize((new_w, new_h), Image.LANCZOS)
+    # 이미지 로드 → 이미지 영역에 맞게 letterbox 리사이즈 (같은 이미지는 캐시 재사용)
+    img = image_loader.load_fitted(image_path, sw, image_area_h)
+    new_h, new_w = img.shape[:2]
 
-    # 이미지를 이미지 영역 중앙에 붙이기
+    # 이미지를 이미지 영역 중앙에 붙이기 (배열 슬라이스 대입)
     x_offset = (sw - new_w) // 2
     y_offset = title_h + (image_area_h - new_h) // 2
-    canvas.paste(img, (x_offset, y_offset))
+    canvas[y_offset:y_offset + new_h, x_offset:x_offset + new_w] = img
 
-    # 상단 제목 바 오버레이
-    title_arr = _render_title_bar(title, sw, title_h, lang)
-    title_img = Image.fromarray(title_arr, "RGBA")
-    canvas.paste(title_img, (0, 0), title_img)  # alpha 마스크 사용
+    # 상단 제목 바
+    canvas[:title_h] = title_bar
 
-    return np.array(canvas)
+    return canvas
 
 
 def _filter_audio_by_scene_ids(
     all_audio_paths: list[str],
     scenes: list[dict],
-) -> list[str]:
+) -> list[tuple[str, bool]]:
     """
     BUG-04 해결:
     shorts 시나리오의 scene_id를 기준으로 landscape 전체 오디오 목록에서
     해당 scene의 오디오 경로만 추출한다.
     scene_id는 1-based이므로 index = scene_id - 1.
     scene_id가 없거나 범위를 벗어나면 빈 문자열("")로 채운다.
+    각 경로는 (경로, 사용 가능 여부) — 파일이 있고 비어 있지 않은지 stat 한 번으로 확인해 둔다.
     """
     filtered = []
     for scene in scenes:
         sid = scene.get("scene_id")
         if sid is None:
-            filtered.append("")
+            filtered.append(("", False))
             continue
         idx = int(sid) - 1
         if 0 <= idx < len(all_audio_paths):
-            filtered.append(all_audio_paths[idx])
+            path = all_audio_paths[idx]
+            filtered.append((path, _has_audio(path)))
         else:
             logger.warning("scene_id %d에 해당하는 오디오 없음 (전체 %d개)", sid, len(all_audio_paths))
-            filtered.append("")
+            filtered.append(("", False))
     return filtered
 
 
+def _has_audio(path: str) -> bool:
+    """파일이 있고 비어 있지 않으면 True. (narration 없는 장면은 빈 파일)"""
+    try:
+        return os.stat(path).st_size > 0
+    except OSError:
+        return False
+
+
+def _mix_with_moviepy(segments: list[audio_mixer.Segment], bgm_path: Optional[str], total_dur: float):
+    """ffmpeg 믹스가 실패했을 때 moviepy로 TTS 연결(무음 구간 포함) + BGM 덕킹 오디오를 만든다."""
+    from moviepy.editor import AudioFileClip, CompositeAudioClip, concatenate_audioclips
+    from moviepy.audio.fx.all import audio_loop
+
+    tts_audio = None
+    if any(path for path, _ in segments):
+        tts_audio = concatenate_audioclips([
+            AudioFileClip(path) if path else audio_mixer.silence_clip(dur)
+            for path, dur in segments
+        ])
+    if bgm_path is None:
+        return tts_audio
+
+    bgm = AudioFileClip(str(bgm_path))
+    if bgm.duration < total_dur:
+        bgm = audio_loop(bgm, duration=total_dur)
+    else:
+        bgm = bgm.subclip(0, total_dur)
+    bgm = bgm.volumex(config.BGM_VOLUME_RATIO)
+
+    if tts_audio is not None:
+        return CompositeAudioClip([tts_audio, bgm]).set_duration(total_dur)
+    return bgm.set_duration(total_dur)
+
+
 def compose_shorts(
     scenes: list[dict],
     image_paths: list[str],
@@ -168,8 +206,6 @@ def compose_shorts(
         concatenate_videoclips,
         CompositeVideoClip,
         AudioFileClip,
-        CompositeAudioClip,
-        concatenate_audioclips,
     )
 
     output_path = Path(output_path)
@@ -181,52 +217,48 @@ def compose_shorts(
     filtered_audio = _filter_audio_by_scene_ids(audio_paths, scenes)
 
     # ── 1. 장면별 프레임 → ImageClip ──────────────────────
+    title_bar = _title_bar_rgb(title, sw, sh, lang)   # 모든 장면 공통 — 한 번만 렌더링
     image_clips = []
     for i, scene in enumerate(scenes):
         img_idx = scene.get("scene_id", i + 1) - 1
         img_idx = max(0, min(img_idx, len(image_paths) - 1))
 
         dur = float(scene.get("duration_sec", config.SCENE_TARGET_SEC))
-        frame = _make_scene_frame(image_paths[img_idx], title, sw, sh, lang)
+        frame = _make_scene_frame(image_paths[img_idx], title_bar, sw, sh)
         clip = ImageClip(frame).set_duration(dur)
         image_clips.append(clip)
 
-    video = concatenate_videoclips(image_clips, method="compose")
+    # 모든 장면 클립이 같은 해상도 — "chain"은 프레임마다 합성 캔버스를 만들지 않고 해당 클립 프레임을 그대로 쓴다
+    video = concatenate_videoclips(image_clips, method="chain")
 
     # ── 2. 자막 오버레이 ──────────────────────────────────
-    subtitle_clips = build_subtitle_clips(scenes, sw, sh, lang=lang)
-    if subtitle_clips:
-        video = CompositeVideoClip([video] + subtitle_clips)
+    # 자막이 없으면 CompositeVideoClip으로 감싸지 않는다 (프레임마다 합성 레이어를 거치지 않음)
+    if config.SUBTITLE_ENABLED:
+        subtitle_clips = build_subtitle_clips(scenes, sw, sh, lang=lang)
+        if subtitle_clips:
+            video = CompositeVideoClip([video] + subtitle_clips)
 
     # ── 3. 오디오 합성 (scene_id 기반 필터링된 TTS + BGM) ──
     total_dur = video.duration
-    tts_clips = []
-    for ap in filtered_audio:
-        if ap and Path(ap).exists():
-            tts_clips.append(AudioFileClip(ap))
+    # 오디오 없는 장면은 장면 길이만큼 무음 — 이후 장면의 narration이 앞당겨지지 않는다
+    segments: list[audio_mixer.Segment] = [
+        (ap if usable else None, float(scene.get("duration_sec", config.SCENE_TARGET_SEC)))
+        for (ap, usable), scene in zip(filtered_audio, scenes)
+    ]
+    has_tts = any(path for path, _ in segments)
+    has_bgm = bool(bgm_path) and Path(bgm_path).exists()
+
+    audio = None
+    mix_path = output_path.with_name(f"{output_path.stem}_audio.wav")
+    if has_tts or has_bgm:
+        tts_segments = segments if has_tts else []
+        mixed = audio_mixer.mix_tts_and_bgm(
+            tts_segments, str(bgm_path) if has_bgm else None, total_dur, mix_path
+        )
+        if mixed is not None:
+            audio = AudioFileClip(str(mixed))
         else:
-            # 오디오 없는 장면은 무음으로 채우지 않음 (gap 자연스럽게 처리)
-            pass
-
-    if tts_clips:
-        tts_audio = concatenate_audioclips(tts_clips)
-    else:
-        tts_audio = None
-
-    if bgm_path and Path(bgm_path).exists():
-        bgm = AudioFileClip(str(bgm_path))
-        if bgm.duration < total_dur:
-            from moviepy.editor import concatenate_audioclips as _cat
-            repeats = int(total_dur / bgm.duration) + 1
-            bgm = _cat([bgm] * repeats)
-        bgm = bgm.subclip(0, total_dur).volumex(config.BGM_VOLUME_RATIO)
-
-        if tts_audio is not None:
-            audio = CompositeAudioClip([tts_audio, bgm]).set_duration(total_dur)
-        else:
-            audio = bgm.set_duration(total_dur)
-    else:
-        audio = tts_audio
+            audio = _mix_with_moviepy(tts_segments, bgm_path if has_bgm else None, total_dur)
 
     if audio is not None:
         video = video.set_audio(audio)
@@ -235,6 +267,10 @@ def compose_shorts(
     result = encode(video, output_path, is_shorts=True)
 
     video.close()
+    if audio is not None:
+        audio.close()   # 믹스 WAV 리더를 닫아야 삭제할 수 있다 (Windows)
+    image_loader.clear_cache()
+    mix_path.unlink(missing_ok=True)
 
     logger.info("shorts 합성 완료: %s", result.name)
     return result
@@ -6,6 +6,7 @@ moviepy ImageClip을 사용해 장면별 텍스트 오버레이를 생성한다.
 """
 
 import logging
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -23,12 +24,27 @@ _POSITION_MAP = {
     "bottom": 0.82,
 }
 
+# TTF 파싱 결과 캐시 — 장면마다 같은 폰트 파일을 다시 열지 않는다 (truetype 성공만 보관)
+_font_cache: dict[tuple[Path, int], ImageFont.FreeTypeFont] = {}
+
+# 렌더링된 자막 프레임 캐시 — 같은 문구(채널 문구 등)가 반복되면 다시 래스터화하지 않는다
+# 1080p RGBA 프레임 하나가 약 8MB이므로 소수만 보관한다
+_FRAME_CACHE_MAX = 8
+_frame_cache: dict[tuple, np.ndarray] = {}
+_frame_cache_lock = threading.Lock()
+
 
 def _load_font(lang: str, size: int) -> ImageFont.FreeTypeFont:
     """언어에 맞는 TTF 폰트를 로드한다. 실패 시 PIL 기본 폰트 사용."""
     path = config.FONT_KO_PATH if lang == "ko" else config.FONT_EN_PATH
+    key = (path, size)
+    font = _font_cache.get(key)
+    if font is not None:
+        return font
     try:
-        return ImageFont.truetype(str(path), size)
+        font = ImageFont.truetype(str(path), size)
+        _font_cache[key] = font
+        return font
     except (IOError, OSError):
         logger.warning("폰트 로드 실패 (%s) — PIL 기본 폰트 사용", path)
         try:
@@ -52,6 +68,7 @@ def render_subtitle_frame(
     """
     투명 배경의 자막 RGBA 프레임을 numpy 배열로 반환한다.
     moviepy의 ImageClip에 직접 전달 가능.
+    같은 인자의 프레임은 캐시에서 공유하므로 반환 배열은 읽기 전용이다.
 
     Parameters
     ----------
@@ -66,33 +83,33 @@ def render_subtitle_frame(
     sc  = stroke_color or config.SUBTITLE_STROKE_COLOR
     sw  = stroke_width if stroke_width is not None else config.SUBTITLE_STROKE_WIDTH
 
+    key = (text, width, height, lang, fs, pos, fg, sc, sw)
+    with _frame_cache_lock:
+        cached = _frame_cache.pop(key, None)
+        if cached is not None:
+            _frame_cache[key] = cached   # 최근 사용으로 갱신
+            return cached
+
     font = _load_font(lang, fs)
 
     # 투명 레이어 생성
     img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
 
-    # 텍스트 박스 측정
-    bbox = draw.textbbox((0, 0), text, font=font)
-    text_w = bbox[2] - bbox[0]
-    text_h = bbox[3] - bbox[1]
-
-    x = (width - text_w) / 2
-    y_ratio = _POSITION_MAP.get(pos, 0.82)
-    y = height * y_ratio - text_h / 2
+    # 텍스트 중심 좌표 (anchor="mm" — textbbox로 따로 측정하지 않는다)
+    x = width / 2
+    y = height * _POSITION_MAP.get(pos, 0.82)
 
-    # 스트로크(외곽선) 먼저 렌더링
-    if sw > 0:
-        for dx in range(-sw, sw + 1):
-            for dy in range(-sw, sw + 1):
-                if dx == 0 and dy == 0:
-                    continue
-                draw.text((x + dx, y + dy), text, font=font, fill=sc)
+    # 스트로크 + 본문을 한 번에 렌더링 (Pillow 네이티브 stroke — 오프셋별 draw.text 반복 없음)
+    draw.text((x, y), text, font=font, fill=fg, anchor="mm", stroke_width=sw, stroke_fill=sc)
 
-    # 본문 텍스트
-    draw.text((x, y), text, font=font, fill=fg)
-
-    return np.array(img)
+    arr = np.array(img)
+    arr.flags.writeable = False   # 캐시 공유 — ImageClip은 프레임을 수정하지 않는다
+    with _frame_cache_lock:
+        if len(_frame_cache) >= _FRAME_CACHE_MAX:
+            _frame_cache.pop(next(iter(_frame_cache)))   # 가장 오래 쓰지 않은 항목 제거
+        _frame_cache[key] = arr
+    return arr
 
 
 def render_subtitle_clip(
@@ -133,6 +150,7 @@ def build_subtitle_clips(
     """
     시나리오 scene 목록 → 자막 ImageClip 목록 (타이밍 포함).
     각 clip의 start는 누적 duration_sec으로 설정된다.
+    연속된 장면의 자막 문구가 같으면 clip 하나로 합친다.
 
     Returns
     -------
@@ -141,22 +159,32 @@ def build_subtitle_clips(
     if not config.SUBTITLE_ENABLED:
         return []
 
-    clips = []
+    # (문구, 시작, 길이) 구간 — 바로 앞 장면과 문구가 같으면 구간을 늘린다
+    runs: list[list] = []
+    prev_text = None
     t = 0.0
     for scene in scenes:
         text = scene.get("text_overlay") or scene.get("narration", "")
         dur = float(scene.get("duration_sec", 3.0))
-        if text.strip():
-            clip = render_subtitle_clip(
-                text=text,
-                duration=dur,
-                width=width,
-                height=height,
-                lang=lang,
-            )
-            clip = clip.set_start(t)
-            clips.append(clip)
+        if not text.strip():
+            prev_text = None
+        elif text == prev_text:
+            runs[-1][2] += dur
+        else:
+            runs.append([text, t, dur])
+            prev_text = text
         t += dur
 
+    clips = []
+    for text, start, dur in runs:
+        clip = render_subtitle_clip(
+            text=text,
+            duration=dur,
+            width=width,
+            height=height,
+            lang=lang,
+        )
+        clips.append(clip.set_start(start))
+
     logger.debug("자막 클립 생성: %d개", len(clips))
     return clips